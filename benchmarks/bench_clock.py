@@ -0,0 +1,34 @@
+"""
+Benchmark helpers.time(): the cached clock against formatting with datetime on every call.
+"""
+
+from datetime import datetime
+
+from common import measure, print_table
+
+from clock import Clock, Stopwatch
+
+
+def _datetime_time() -> str:
+    """The previous helpers.time() implementation."""
+    return datetime.now().strftime("%I:%M %p")
+
+
+def run(number: int = 500000) -> dict:
+    """Return per-call timings in nanoseconds."""
+    clock = Clock()
+    clock.now()
+    stopwatch = Stopwatch()
+    return {
+        "datetime.now().strftime": measure(_datetime_time, number),
+        "Clock.now (cached)": measure(clock.now, number),
+        "Stopwatch.elapsed": measure(stopwatch.elapsed, number),
+    }
+
+
+def main():
+    print_table("Clock", run().items())
+
+
+if __name__ == '__main__':
+    main()
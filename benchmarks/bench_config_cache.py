@@ -0,0 +1,68 @@
+"""
+Benchmark cold versus warm worker startup with the on-disk config cache.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from common import ROOT, print_table, write_config_tree
+
+
+# Starts a worker that loads every config file, as a warm cache would
+WORKER = """
+import sys
+sys.path.insert(0, {root!r})
+from config_manager import ConfigManager
+manager = ConfigManager(config_dir={config_dir!r}, json_file={json_file!r}, cache_file={cache_file!r})
+for name in {names!r}:
+    manager.all(name)
+"""
+
+
+def start_worker(script: str) -> float:
+    """Run a worker process and return its wall time in milliseconds."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", script], check=True, env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"))
+    return (time.perf_counter() - start) * 1000
+
+
+def run(files: int = 50, keys: int = 60, depth: int = 2, repeat: int = 5) -> dict:
+    """Return the best worker start time in milliseconds without the cache, cold and warm."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        names = write_config_tree(config_dir, files, keys, depth)
+        json_file = Path(temp_dir) / "config.json"
+        json_file.write_text('{"APP_NAME": "Bench"}')
+        cache_file = Path(temp_dir) / "data" / "config_cache.marshal"
+        
+        def script(cache):
+            return WORKER.format(root=ROOT, config_dir=str(config_dir), json_file=str(json_file),
+                                 cache_file=cache, names=names)
+        
+        no_cache = min(start_worker(script(None)) for _ in range(repeat))
+        
+        cold = []
+        for _ in range(repeat):
+            if cache_file.exists():
+                cache_file.unlink()
+            cold.append(start_worker(script(str(cache_file))))
+        
+        warm = min(start_worker(script(str(cache_file))) for _ in range(repeat))
+        
+        return {
+            f"start with {files} files (no cache)": no_cache,
+            f"start with {files} files (cold cache)": min(cold),
+            f"start with {files} files (warm cache)": warm,
+        }
+
+
+def main():
+    print_table("Worker startup", run().items(), unit="ms")
+
+
+if __name__ == '__main__':
+    main()
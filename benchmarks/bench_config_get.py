@@ -0,0 +1,53 @@
+"""
+Benchmark ConfigManager.get hit-path latency against the unindexed lookup.
+"""
+
+import tempfile
+from pathlib import Path
+
+from common import measure, print_table
+
+from config_manager import ConfigManager
+
+
+KEYS = ['app.name', 'app.response_number', 'app.logging.level', 'app.missing']
+
+
+def run(number: int = 200000) -> dict:
+    """Return per-call timings in nanoseconds for indexed and unindexed lookups."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        (config_dir / "app.py").write_text(
+            'name = "Bench"\n'
+            'response_number = 42\n'
+            'logging = {"level": "INFO", "file": "logs/app.log"}\n'
+        )
+        json_file = Path(temp_dir) / "config.json"
+        json_file.write_text('{"APP_NAME": "Bench JSON"}')
+        
+        manager = ConfigManager(config_dir=str(config_dir), json_file=str(json_file))
+        
+        results = {}
+        for key in KEYS:
+            manager.get(key)
+            results[f"get {key} (indexed)"] = measure(lambda: manager.get(key), number)
+            results[f"get {key} (unindexed)"] = measure(
+                lambda: manager._resolve(manager._state, key), number)
+        
+        for key in KEYS:
+            results[f"has {key}"] = measure(lambda: manager.has(key), number)
+        
+        manager.instrument()
+        for key in KEYS:
+            results[f"get {key} (instrumented)"] = measure(lambda: manager.get(key), number)
+        manager.instrument(False)
+        return results
+
+
+def main():
+    print_table("ConfigManager.get hit path", run().items())
+
+
+if __name__ == '__main__':
+    main()
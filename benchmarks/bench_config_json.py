@@ -0,0 +1,82 @@
+"""
+Benchmark eager versus lazy loading of large config.json files: startup time,
+peak RSS and the cost of the first lookups, as the file grows.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from common import ROOT, print_table
+
+
+# Loads the JSON file in a fresh process and reports its timings and memory
+WORKER = """
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+from config_manager import ConfigManager
+baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+manager = ConfigManager(config_dir={config_dir!r}, json_file={json_file!r}, json_mode={mode!r})
+loaded = time.perf_counter()
+for index in range(10):
+    manager.get(f'flags.table_{{index}}')
+looked_up = time.perf_counter()
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{
+    "load_ms": (loaded - start) * 1000,
+    "lookup_ms": (looked_up - loaded) * 1000,
+    "peak_rss_mb": (peak - baseline) / 1024,
+}}))
+"""
+
+
+def write_json_file(path: Path, size_mb: int) -> None:
+    """Write a config.json of roughly size_mb megabytes of feature flag and routing tables."""
+    tables = max(8, size_mb * 8)
+    rows = 2000
+    with open(path, 'w') as f:
+        f.write('{"APP_NAME": "Bench"')
+        for index in range(tables):
+            table = {f"flag_{row}": {"enabled": row % 2 == 0, "rollout": row % 100, "route": f"backend-{row % 17}"}
+                     for row in range(rows)}
+            f.write(f', "FLAGS_TABLE_{index}": ')
+            json.dump(table, f)
+        f.write('}')
+
+
+def load(config_dir: Path, json_file: Path, mode: str) -> dict:
+    script = WORKER.format(root=ROOT, config_dir=str(config_dir), json_file=str(json_file), mode=mode)
+    result = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True,
+                            env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"))
+    return json.loads(result.stdout)
+
+
+def run(sizes=(1, 8, 32), repeat: int = 3) -> dict:
+    """Return load time, first-lookup time and peak RSS growth per file size and mode."""
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        json_file = Path(temp_dir) / "config.json"
+        for size_mb in sizes:
+            write_json_file(json_file, size_mb)
+            actual_mb = json_file.stat().st_size / (1024 * 1024)
+            for mode in ('eager', 'lazy'):
+                runs = [load(config_dir, json_file, mode) for _ in range(repeat)]
+                label = f"{actual_mb:5.1f} MB {mode}"
+                results[f"{label} load (ms)"] = min(run["load_ms"] for run in runs)
+                results[f"{label} 10 lookups (ms)"] = min(run["lookup_ms"] for run in runs)
+                results[f"{label} peak RSS growth (MB)"] = min(run["peak_rss_mb"] for run in runs)
+    return results
+
+
+def main():
+    print_table("Large config.json loading", run().items(), unit="")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark loading config/*.py files statically versus importing them.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from common import print_table, write_config_tree
+
+import config_loader
+from config_manager import ConfigManager
+
+
+def load_all(config_dir: Path, names: list, loader: str) -> float:
+    """Load every config file with a fresh manager and return the elapsed milliseconds."""
+    config_loader._code_cache.clear()
+    start = time.perf_counter()
+    manager = ConfigManager(config_dir=str(config_dir), json_file="/nonexistent/config.json", loader=loader)
+    for name in names:
+        manager.all(name)
+    return (time.perf_counter() - start) * 1000
+
+
+def reload_all(config_dir: Path, names: list, loader: str) -> float:
+    """Reload every config file of a warm manager and return the elapsed milliseconds."""
+    config_loader._code_cache.clear()
+    manager = ConfigManager(config_dir=str(config_dir), json_file="/nonexistent/config.json", loader=loader)
+    for name in names:
+        manager.all(name)
+    
+    start = time.perf_counter()
+    manager.reload()
+    for name in names:
+        manager.all(name)
+    return (time.perf_counter() - start) * 1000
+
+
+def run(files: int = 50, keys: int = 60, depth: int = 2, repeat: int = 5) -> dict:
+    """Return the best cold-load time in milliseconds for each loader mode."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        names = write_config_tree(config_dir, files, keys, depth)
+        
+        results = {}
+        original = sys.dont_write_bytecode
+        try:
+            for write_bytecode in (False, True):
+                sys.dont_write_bytecode = not write_bytecode
+                cache = "with pyc cache" if write_bytecode else "no pyc cache"
+                for loader in ('exec', 'auto'):
+                    results[f"load {files} files ({loader}, {cache})"] = min(
+                        load_all(config_dir, names, loader) for _ in range(repeat)
+                    )
+                    results[f"reload {files} files ({loader}, {cache})"] = min(
+                        reload_all(config_dir, names, loader) for _ in range(repeat)
+                    )
+        finally:
+            sys.dont_write_bytecode = original
+        return results
+
+
+def main():
+    print_table("Config file loading", run().items(), unit="ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark worker start-up: building a ConfigManager versus attaching to a shared snapshot.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from common import print_table, write_config_tree
+
+import config_loader
+from config_manager import ConfigManager
+from config_shared import SharedConfigPublisher, SharedConfigReader
+
+
+def run(files: int = 50, keys: int = 60, depth: int = 2, reads: int = 20, repeat: int = 5) -> dict:
+    """Return the best time in milliseconds for a worker to get ready and read a few keys."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        names = write_config_tree(config_dir, files, keys, depth)
+        wanted = [f"{name}.setting_{index}" for name in names for index in range(3)][:reads]
+        
+        def build_manager():
+            config_loader._code_cache.clear()
+            start = time.perf_counter()
+            manager = ConfigManager(config_dir=str(config_dir), json_file="/nonexistent/config.json")
+            for key in wanted:
+                manager.get(key)
+            return (time.perf_counter() - start) * 1000
+        
+        parent = ConfigManager(config_dir=str(config_dir), json_file="/nonexistent/config.json")
+        publisher = SharedConfigPublisher(parent, auto_publish=False)
+        try:
+            def attach_reader():
+                start = time.perf_counter()
+                reader = SharedConfigReader(publisher.name)
+                for key in wanted:
+                    reader.get(key)
+                elapsed = (time.perf_counter() - start) * 1000
+                reader.close()
+                return elapsed
+            
+            start = time.perf_counter()
+            publisher.publish()
+            publish_time = (time.perf_counter() - start) * 1000
+            
+            return {
+                f"worker builds ConfigManager, {reads} reads": min(build_manager() for _ in range(repeat)),
+                f"worker attaches to snapshot, {reads} reads": min(attach_reader() for _ in range(repeat)),
+                f"parent publishes {files} files": publish_time,
+            }
+        finally:
+            publisher.close()
+
+
+def main():
+    print_table("Worker config start-up", run().items(), unit="ms")
+
+
+if __name__ == '__main__':
+    main()
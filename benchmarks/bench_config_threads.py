@@ -0,0 +1,78 @@
+"""
+Multi-threaded stress benchmark: read throughput while writes and reloads run.
+"""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from common import print_table
+
+from config_manager import ConfigManager
+
+
+KEYS = ['app.name', 'app.response_number', 'app.logging.level']
+
+
+def read_throughput(manager: ConfigManager, readers: int, duration: float, write_interval: float = 0.0,
+                    reload_every: int = 0) -> float:
+    """Run reader threads for duration seconds, optionally alongside a writer, and return reads per second."""
+    stop = threading.Event()
+    counts = [0] * readers
+    
+    def reader(index):
+        get = manager.get
+        count = 0
+        while not stop.is_set():
+            for key in KEYS:
+                get(key)
+            count += len(KEYS)
+        counts[index] = count
+    
+    def writer():
+        number = 0
+        while not stop.wait(write_interval):
+            number += 1
+            manager.set('app.response_number', number)
+            if reload_every and number % reload_every == 0:
+                manager.reload()
+    
+    threads = [threading.Thread(target=reader, args=(index,)) for index in range(readers)]
+    if write_interval:
+        threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / duration
+
+
+def run(readers: int = 4, duration: float = 1.0) -> dict:
+    """Return reads per second with no writer, a setter, and a setter that also reloads."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        (config_dir / "app.py").write_text(
+            'name = "Bench"\n'
+            'response_number = 42\n'
+            'logging = {"level": "INFO", "file": "logs/app.log"}\n'
+        )
+        manager = ConfigManager(config_dir=str(config_dir), json_file="/nonexistent/config.json")
+        
+        return {
+            f"{readers} readers, no writer": read_throughput(manager, readers, duration),
+            f"{readers} readers, set every 1 ms": read_throughput(manager, readers, duration, 0.001),
+            f"{readers} readers, set every 1 ms + reload every 10": read_throughput(
+                manager, readers, duration, 0.001, reload_every=10),
+        }
+
+
+def main():
+    print_table("Concurrent read throughput", run().items(), unit="reads/s")
+
+
+if __name__ == '__main__':
+    main()
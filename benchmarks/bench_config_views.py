@@ -0,0 +1,59 @@
+"""
+Benchmark ConfigManager.all on large config modules: the frozen shared view
+against the shallow copy it used to return.
+"""
+
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from common import measure, print_table, write_config_tree
+
+from config_manager import ConfigManager
+
+
+def _retained_bytes(func, calls: int) -> int:
+    """Memory held by the results of calls calls to func."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    results = [func() for _ in range(calls)]
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del results
+    return retained
+
+
+def run(keys: int = 500, depth: int = 3, number: int = 20000, calls: int = 1000) -> dict:
+    """Return per-call latency in ns and retained memory in bytes per call."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        name = write_config_tree(config_dir, files=1, keys=keys, depth=depth)[0]
+        manager = ConfigManager(config_dir=str(config_dir), json_file=str(Path(temp_dir) / "config.json"))
+        
+        def copy():
+            return manager._namespace(manager._state, name).copy()
+        
+        def view():
+            return manager.all(name)
+        
+        view()
+        return {
+            "copy, ns/call": measure(copy, number),
+            "view, ns/call": measure(view, number),
+            "view after set(), first call ns": _first_view_after_set(manager, name),
+            "copy, retained bytes/call": _retained_bytes(copy, calls) / calls,
+            "view, retained bytes/call": _retained_bytes(view, calls) / calls,
+        }
+
+
+def _first_view_after_set(manager: ConfigManager, name: str) -> float:
+    manager.set(f"{name}.setting_1", "changed")
+    return measure(lambda: manager.all(name), 1, 1)
+
+
+def main():
+    print_table("ConfigManager.all on a large config module", run().items(), unit="")
+
+
+if __name__ == '__main__':
+    main()
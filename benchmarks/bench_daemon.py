@@ -0,0 +1,52 @@
+"""
+Benchmark repeated invocations of main.py against a resident daemon (--serve)
+answering thin --client calls.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import ROOT, print_table
+
+
+def invoke(args, env) -> float:
+    """Run main.py once and return its wall time in milliseconds."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "main.py", *args], cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+
+def run(calls: int = 20) -> dict:
+    """Return the mean time per invocation in milliseconds, without and with the daemon."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1", APP_SOCKET=os.path.join(temp_dir, "app.sock"))
+        cold = sum(invoke([], env) for _ in range(calls)) / calls
+
+        server = subprocess.Popen([sys.executable, "main.py", "--serve"], cwd=ROOT, env=env,
+                                  stdout=subprocess.PIPE, text=True)
+        try:
+            server.stdout.readline()
+            while subprocess.run([sys.executable, "main.py", "--client", "ping"], cwd=ROOT, env=env,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode:
+                time.sleep(0.05)
+            warm = sum(invoke(["--client"], env) for _ in range(calls)) / calls
+        finally:
+            subprocess.run([sys.executable, "main.py", "--client", "stop"], cwd=ROOT, env=env,
+                           stdout=subprocess.DEVNULL)
+            server.wait(10)
+
+        return {
+            "main.py (full start)": cold,
+            "main.py --client (warm daemon)": warm,
+        }
+
+
+def main():
+    print_table("Invocation time", run().items(), unit="ms/call")
+
+
+if __name__ == '__main__':
+    main()
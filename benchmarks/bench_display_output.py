@@ -0,0 +1,59 @@
+"""
+Benchmark DisplayModule output: print-per-line against single-write sinks,
+with stdout redirected to a file.
+"""
+
+import os
+import sys
+import tempfile
+
+from common import measure, print_table
+
+from modules import DisplayModule, NullSink, StdoutSink
+
+
+def _print_per_line(display: DisplayModule) -> None:
+    """The previous output path: one print() call per line of show_all."""
+    for line in display.render_all().splitlines():
+        print(line)
+
+
+def run(number: int = 2000) -> dict:
+    """Return per-call timings in nanoseconds of show_all for each output path."""
+    results = {}
+    stdout = sys.stdout
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "output.txt")
+        # Block buffering is what a redirected stdout gets, line buffering what a terminal gets
+        for label, buffering in (("block buffered", -1), ("line buffered", 1)):
+            with open(path, 'w', buffering=buffering) as stream:
+                sys.stdout = stream
+                try:
+                    display = DisplayModule(StdoutSink())
+                    results[f"print per line ({label})"] = measure(lambda: _print_per_line(display), number)
+                    results[f"sink write ({label})"] = measure(display.show_all, number)
+
+                    sink = StdoutSink()
+                    batched = DisplayModule(sink)
+
+                    def batch_of_ten():
+                        with sink.batch():
+                            for _ in range(10):
+                                batched.show_all()
+
+                    results[f"sink write, batches of 10 ({label})"] = measure(batch_of_ten, number // 10) / 10
+                finally:
+                    sys.stdout = stdout
+
+    display = DisplayModule(NullSink())
+    results["render only (null sink)"] = measure(display.show_all, number)
+    results["render only, cold section cache"] = measure(lambda: DisplayModule(NullSink()).show_all(), number)
+    return results
+
+
+def main():
+    print_table("DisplayModule.show_all output", run().items())
+
+
+if __name__ == '__main__':
+    main()
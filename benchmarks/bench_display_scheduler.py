@@ -0,0 +1,85 @@
+"""
+Benchmark timed display sequences: drift of deadline scheduling against chained
+sleeps, and throughput of many concurrent sequences on one event loop.
+"""
+
+import asyncio
+import time
+
+from common import print_table
+
+from modules import DisplayModule, NullSink
+from modules.scheduler import run_timed
+
+
+STEPS = 4
+
+
+def _slow_steps(display: DisplayModule, interval: float) -> list:
+    """The display sections, each followed by slow output taking a tenth of the interval."""
+    def slow(step):
+        def run():
+            step()
+            time.sleep(interval / 10)
+        return run
+
+    return [slow(step) for step in (display.show_header, display.show_app_info,
+                                    display.show_app_response, display.show_config_source)]
+
+
+async def _chained_sleeps(steps: list, interval: float) -> list:
+    """The show_with_delay pattern: a fixed sleep between steps instead of deadlines."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    lateness = []
+    for index, step in enumerate(steps):
+        if index:
+            await asyncio.sleep(interval)
+        lateness.append(loop.time() - (start + index * interval))
+        step()
+    return lateness
+
+
+def _drift(lateness: list) -> float:
+    """Lateness of the last step in milliseconds."""
+    return lateness[-1] * 1000
+
+
+def run(sequences: tuple = (1, 100, 1000), interval: float = 0.01) -> dict:
+    """Return drift in ms and throughput in renders per second."""
+    results = {}
+    display = DisplayModule(NullSink())
+
+    steps = _slow_steps(display, interval)
+    results["drift, chained sleeps (ms)"] = _drift(asyncio.run(_chained_sleeps(steps, interval)))
+    results["drift, deadlines (ms)"] = _drift(asyncio.run(run_timed(steps, interval)))
+
+    for count in sequences:
+        displays = [DisplayModule(NullSink()) for _ in range(count)]
+
+        async def run_all():
+            return await asyncio.gather(*(d.show_with_delay_async(interval) for d in displays))
+
+        start = time.perf_counter()
+        lateness = asyncio.run(run_all())
+        elapsed = time.perf_counter() - start
+        results[f"{count} sequences, renders/s"] = count * STEPS / elapsed
+        results[f"{count} sequences, max drift (ms)"] = max(_drift(steps) for steps in lateness)
+        results[f"{count} sequences, wall time (ms)"] = elapsed * 1000
+
+    results["1 sequence blocking show_with_delay, wall time (ms)"] = _blocking(display, interval) * 1000
+    return results
+
+
+def _blocking(display: DisplayModule, interval: float) -> float:
+    start = time.perf_counter()
+    display.show_with_delay(interval)
+    return time.perf_counter() - start
+
+
+def main():
+    print_table("Timed display sequences", run().items(), unit="")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark copy-on-write sharing of the configuration with forked workers:
+shared versus private memory per worker, with and without ConfigManager.freeze().
+Linux only (reads /proc/self/smaps_rollup).
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from common import ROOT, print_table, write_config_tree
+
+
+# Loads the config in a parent process, forks workers that read every key and
+# run a full collection, and reports each worker's memory from smaps_rollup
+PARENT = """
+import gc, json, os, sys
+sys.path.insert(0, {root!r})
+from config_manager import ConfigManager
+
+def memory():
+    fields = {{}}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            name, _, rest = line.partition(':')
+            if rest.strip().endswith('kB'):
+                fields[name] = int(rest.split()[0])
+    return {{
+        "shared_kb": fields['Shared_Clean'] + fields['Shared_Dirty'],
+        "private_kb": fields['Private_Clean'] + fields['Private_Dirty'],
+    }}
+
+manager = ConfigManager(config_dir={config_dir!r}, json_file="/nonexistent/config.json")
+keys = [key for key, _ in manager.items()]
+if {freeze!r}:
+    manager.freeze()
+
+reports = []
+children = []
+for _ in range({workers}):
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        for _ in range(3):
+            for key in keys:
+                manager.get(key)
+        gc.collect()
+        os.write(write_end, json.dumps(memory()).encode())
+        os._exit(0)
+    os.close(write_end)
+    children.append((pid, read_end))
+
+for pid, read_end in children:
+    with os.fdopen(read_end) as pipe:
+        reports.append(json.loads(pipe.read()))
+    os.waitpid(pid, 0)
+print(json.dumps({{"keys": len(keys), "workers": reports}}))
+"""
+
+
+def measure(config_dir: Path, freeze: bool, workers: int) -> dict:
+    script = PARENT.format(root=ROOT, config_dir=str(config_dir), freeze=freeze, workers=workers)
+    result = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True,
+                            env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"))
+    return json.loads(result.stdout)
+
+
+def run(files: int = 200, keys: int = 60, depth: int = 3, workers: int = 4) -> dict:
+    """Return the mean shared and private memory per worker in MB, without and with freeze()."""
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        write_config_tree(config_dir, files, keys, depth)
+        for freeze in (False, True):
+            report = measure(config_dir, freeze, workers)
+            label = "frozen" if freeze else "not frozen"
+            count = len(report["workers"])
+            results[f"{label}: shared per worker (MB)"] = sum(
+                worker["shared_kb"] for worker in report["workers"]) / count / 1024
+            results[f"{label}: private per worker (MB)"] = sum(
+                worker["private_kb"] for worker in report["workers"]) / count / 1024
+    return results
+
+
+def main():
+    if not os.path.exists('/proc/self/smaps_rollup') or not hasattr(os, 'fork'):
+        print("This benchmark needs fork() and /proc/self/smaps_rollup (Linux)")
+        return
+    print_table("Forked workers (4 workers, 200 config files)", run().items(), unit="")
+
+
+if __name__ == '__main__':
+    main()
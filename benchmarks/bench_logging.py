@@ -0,0 +1,48 @@
+"""
+Benchmark the cost a log call puts on the calling thread: a synchronous
+logging.FileHandler against the queued writer.
+"""
+
+import logging
+import os
+import tempfile
+
+from common import measure, print_table
+
+from modules.logger import QueuedLogging
+
+
+FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def run(number: int = 20000) -> dict:
+    """Return per-call timings in nanoseconds of logger.info."""
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        logger = logging.getLogger('bench.sync')
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        handler = logging.FileHandler(os.path.join(temp_dir, "sync.log"))
+        handler.setFormatter(logging.Formatter(FORMAT))
+        logger.addHandler(handler)
+        results["FileHandler (synchronous)"] = measure(lambda: logger.info("request %d done", 42), number)
+        logger.removeHandler(handler)
+        handler.close()
+
+        writer = QueuedLogging(level='INFO', format=FORMAT, file=os.path.join(temp_dir, "queued.log"),
+                               max_bytes=0, logger_name='bench.queued')
+        writer.start()
+        logger = writer.logger
+        results["QueuedLogging (enqueue)"] = measure(lambda: logger.info("request %d done", 42), number)
+        flush = measure(writer.flush, 1, 1)
+        writer.stop()
+        results["QueuedLogging final flush (ns total)"] = flush
+    return results
+
+
+def main():
+    print_table("Log call cost", run().items())
+
+
+if __name__ == '__main__':
+    main()
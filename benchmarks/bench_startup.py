@@ -0,0 +1,97 @@
+"""
+Benchmark CLI startup against another revision of the tree, measured in the same run:
+the time `import modules` and `python main.py` (until its first output) add to
+a bare interpreter, with warm .pyc files, best of several interleaved runs.
+
+    python benchmarks/bench_startup.py                   # Working tree against HEAD
+    python benchmarks/bench_startup.py --revision v1.0   # ... against a tag or commit
+    python benchmarks/bench_startup.py --tolerance 0.1   # Exit 1 if more than 10% slower
+"""
+
+import argparse
+import io
+import subprocess
+import sys
+import tarfile
+import tempfile
+from typing import Dict, List, Optional
+
+from common import ROOT, print_table
+
+from main import STARTUP_COMMANDS, startup_env, time_to_first_output
+
+
+# Slowdown against the other revision tolerated before startup counts as a regression
+DEFAULT_TOLERANCE = 0.1
+
+
+def export_revision(revision: str, directory: str) -> None:
+    """Write the files of a git revision of the tree into directory."""
+    archive = subprocess.run(['git', 'archive', '--format=tar', revision], cwd=ROOT,
+                             check=True, capture_output=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(directory)
+
+
+def measure(roots: Dict[str, str], runs: int = 15) -> Dict[str, Dict[str, float]]:
+    """
+    Best startup times of each tree in milliseconds, over a bare interpreter.
+    Trees and commands are interleaved, so a busy moment hits them alike.
+    """
+    env = startup_env()
+    for root in roots.values():
+        # Compile every module once, as users' installs have
+        time_to_first_output(STARTUP_COMMANDS["first_output"], root, env)
+
+    best = {tree: dict.fromkeys(STARTUP_COMMANDS, float('inf')) for tree in roots}
+    for _ in range(runs):
+        for tree, root in roots.items():
+            for name, args in STARTUP_COMMANDS.items():
+                best[tree][name] = min(best[tree][name], time_to_first_output(args, root, env))
+
+    return {
+        tree: {name: times[name] - times["interpreter"] for name in ("import_modules", "first_output")}
+        for tree, times in best.items()
+    }
+
+
+def run(revision: str = 'HEAD', runs: int = 15, tolerance: float = DEFAULT_TOLERANCE) -> dict:
+    """
+    Measure the working tree and revision side by side. Returns both trees'
+    timings, the ratio working tree / revision per command and whether any
+    ratio exceeds 1 + tolerance.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        export_revision(revision, directory)
+        timings = measure({"current": ROOT, "baseline": directory}, runs)
+
+    ratios = {name: timings["current"][name] / timings["baseline"][name] for name in timings["current"]}
+    return {
+        "current_ms": timings["current"],
+        "baseline_ms": timings["baseline"],
+        "ratio": ratios,
+        "regressed": any(ratio > 1 + tolerance for ratio in ratios.values()),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare CLI startup with another revision of the tree.")
+    parser.add_argument("--revision", default="HEAD", help="git revision to compare with (default %(default)s)")
+    parser.add_argument("--runs", type=int, default=15, help="interleaved runs per command (the best is kept)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="slowdown tolerated against the revision (default %(default)s)")
+    args = parser.parse_args(argv)
+
+    report = run(args.revision, args.runs, args.tolerance)
+    print_table(f"Startup over a bare interpreter, {args.revision}",
+                report["baseline_ms"].items(), unit="ms")
+    print_table("Startup over a bare interpreter, working tree", report["current_ms"].items(), unit="ms")
+    print_table("Working tree / revision", report["ratio"].items(), unit="x")
+    if report["regressed"]:
+        print(f"Startup is more than {args.tolerance:.0%} slower than {args.revision}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Shared helpers for the benchmark scripts.
+"""
+
+import os
+import sys
+import timeit
+from typing import Callable, Iterable, Tuple
+
+# Add the project root to the path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def measure(func: Callable[[], object], number: int = 100000, repeat: int = 5) -> float:
+    """Return the best per-call time of func in nanoseconds."""
+    timings = timeit.repeat(func, number=number, repeat=repeat)
+    return min(timings) / number * 1e9
+
+
+def print_table(title: str, rows: Iterable[Tuple[str, float]], unit: str = "ns/call") -> None:
+    """Print benchmark rows as an aligned table."""
+    rows = list(rows)
+    width = max(len(name) for name, _ in rows)
+    print(f"=== {title} ===")
+    for name, value in rows:
+        print(f"{name:<{width}}  {value:>12.1f} {unit}")
+    print()
+
+
+def write_config_file(path, keys: int = 40, depth: int = 2) -> None:
+    """Write a literal-only config file with keys top-level settings nested depth levels deep."""
+    def nested(level: int, index: int):
+        if level == 0:
+            return {"enabled": index % 2 == 0, "timeout": index * 1.5, "name": f"value-{index}"}
+        return {f"level{level}_{i}": nested(level - 1, index + i) for i in range(3)}
+    
+    lines = ['"""', "Generated benchmark configuration.", '"""', ""]
+    for index in range(keys):
+        lines.append(f"# Setting {index}")
+        if index % 3 == 0:
+            lines.append(f"setting_{index} = {nested(depth, index)!r}")
+        elif index % 3 == 1:
+            lines.append(f"setting_{index} = {[f'item-{i}' for i in range(5)]!r}")
+        else:
+            lines.append(f"setting_{index} = {index}")
+        lines.append("")
+    path.write_text("\n".join(lines))
+
+
+def write_config_tree(config_dir, files: int = 20, keys: int = 40, depth: int = 2) -> list:
+    """Write files generated config modules into config_dir and return their names."""
+    config_dir.mkdir(parents=True, exist_ok=True)
+    names = [f"module{index}" for index in range(files)]
+    for name in names:
+        write_config_file(config_dir / f"{name}.py", keys, depth)
+    return names
@@ -0,0 +1,341 @@
+"""
+Benchmark suite for the config, display and startup hot paths.
+Runs every case against a synthetic config tree of configurable size, writes the
+results as JSON and compares them with a stored baseline to flag regressions.
+Uses only the standard library, so it runs offline.
+
+    python benchmarks/suite.py                                  # Run everything, print a table
+    python benchmarks/suite.py --files 100 --keys 80 --depth 3  # Bigger config tree
+    python benchmarks/suite.py --only 'config.*' --output results.json
+    python benchmarks/suite.py --baseline baseline.json         # Exit 1 on regressions
+    python benchmarks/suite.py --profile config.reload --profile-dir profiles
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from common import ROOT, print_table, write_config_tree
+
+import config_loader
+from config_manager import ConfigManager
+from main import startup_env
+from modules import DisplayModule, NullSink
+
+
+# Default slowdown tolerated before a case counts as a regression (0.25 = 25% slower)
+DEFAULT_TOLERANCE = 0.25
+
+
+class Tree:
+    """A synthetic config tree and a manager loaded from it."""
+    
+    def __init__(self, root: Path, files: int, keys: int, depth: int):
+        self.config_dir = root / "config"
+        self.names = write_config_tree(self.config_dir, files, keys, depth)
+        self.json_file = root / "config.json"
+        self.json_file.write_text(json.dumps({"MODULE0_SETTING_1": ["from", "json"], "APP_NAME": "Suite"}))
+        self.manager = self.new_manager()
+        
+        # A key at the bottom of the deepest nesting, and a top-level one
+        self.name = self.names[-1]
+        self.deep_key = f"{self.name}.setting_0" + "".join(f".level{level}_0" for level in range(depth, 0, -1))
+        self.flat_key = f"{self.name}.setting_2"
+    
+    def new_manager(self) -> ConfigManager:
+        return ConfigManager(config_dir=str(self.config_dir), json_file=str(self.json_file))
+
+
+# Case name -> setup(tree) returning the function to time
+CASES: Dict[str, Callable[[Tree], Callable[[], object]]] = {}
+
+
+def case(name: str):
+    """Register a benchmark case."""
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+@case("config.get")
+def _get(tree: Tree):
+    manager, key = tree.manager, tree.deep_key
+    manager.get(key)
+    return lambda: manager.get(key)
+
+
+@case("config.get.resolve")
+def _resolve(tree: Tree):
+    manager, key = tree.manager, tree.deep_key
+    return lambda: manager._resolve(manager._state, key)
+
+
+@case("config.has")
+def _has(tree: Tree):
+    manager, key = tree.manager, tree.deep_key
+    manager.has(key)
+    return lambda: manager.has(key)
+
+
+@case("config.all")
+def _all(tree: Tree):
+    manager, name = tree.manager, tree.name
+    manager.all(name)
+    return lambda: manager.all(name)
+
+
+@case("config.all.rebuild")
+def _all_rebuild(tree: Tree):
+    manager, name, key = tree.manager, tree.name, tree.flat_key
+    
+    def rebuild():
+        manager.set(key, time.perf_counter())
+        return manager.all(name)
+    return rebuild
+
+
+@case("config.reload")
+def _reload(tree: Tree):
+    manager, name, key = tree.manager, tree.name, tree.deep_key
+    
+    def reload():
+        manager.reload(name)
+        return manager.get(key)
+    return reload
+
+
+@case("config.reload.all")
+def _reload_all(tree: Tree):
+    manager = tree.manager
+    return manager.reload
+
+
+@case("config.load_file")
+def _load_file(tree: Tree):
+    manager, name = tree.manager, tree.name
+    return lambda: manager._load_config_file(name)
+
+
+@case("config.load_file.cold")
+def _load_file_cold(tree: Tree):
+    manager, name = tree.manager, tree.name
+    
+    def load():
+        config_loader._code_cache.clear()
+        return manager._load_config_file(name)
+    return load
+
+
+@case("config.startup")
+def _config_startup(tree: Tree):
+    def start():
+        manager = tree.new_manager()
+        return manager.get(tree.deep_key)
+    return start
+
+
+def _display() -> DisplayModule:
+    """A display module rendering the project's own config, wherever the suite is started from."""
+    import config_manager
+    
+    if config_manager._config_manager is None:
+        config_manager._config_manager = ConfigManager(
+            config_dir=os.path.join(ROOT, "config"), json_file=os.path.join(ROOT, "config.json"))
+    return DisplayModule(NullSink())
+
+
+@case("display.show_all")
+def _show_all(tree: Tree):
+    display = _display()
+    display.show_all()
+    return display.show_all
+
+
+@case("display.render_all.uncached")
+def _render_uncached(tree: Tree):
+    display = _display()
+    
+    def render():
+        display._rendered.clear()
+        display._settings = None
+        display._header = None
+        return display.render_all()
+    return render
+
+
+def _run_main(*args: str) -> Callable[[], object]:
+    command = [sys.executable, *args]
+    # With warm .pyc files, as users start
+    env = startup_env()
+    subprocess.run(command, cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL)
+    return lambda: subprocess.run(command, cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL)
+
+
+@case("startup.import_modules")
+def _import_modules(tree: Tree):
+    return _run_main("-c", "import modules")
+
+
+@case("startup.main")
+def _main(tree: Tree):
+    return _run_main("main.py")
+
+
+def select(patterns: Optional[Iterable[str]] = None) -> List[str]:
+    """Case names matching any of the glob patterns (all cases by default)."""
+    if not patterns:
+        return list(CASES)
+    return [name for name in CASES if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)]
+
+
+def time_case(func: Callable[[], object], min_time: float = 0.2, repeat: int = 5) -> dict:
+    """Best per-call time of func in nanoseconds, calibrated to run at least min_time per repeat."""
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 10 ** 7:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    timings = [elapsed] + timer.repeat(repeat=repeat - 1, number=number) if repeat > 1 else [elapsed]
+    return {"ns_per_call": min(timings) / number * 1e9, "number": number, "repeat": len(timings)}
+
+
+def profile_case(func: Callable[[], object], calls: int, output: Optional[Path] = None, limit: int = 15) -> str:
+    """Run func calls times under cProfile; dump the stats to output and return the top entries."""
+    import cProfile
+    import io
+    import pstats
+    
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(calls):
+        func()
+    profiler.disable()
+    
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(output))
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(limit)
+    return stream.getvalue()
+
+
+def run(files: int = 50, keys: int = 40, depth: int = 2, patterns: Optional[Iterable[str]] = None,
+        min_time: float = 0.2, repeat: int = 5, profile: Iterable[str] = (),
+        profile_dir: Optional[Path] = None, profile_calls: int = 1000) -> dict:
+    """
+    Run the selected cases and return the results document:
+    {"meta": {...}, "results": {case: {"ns_per_call", "number", "repeat"}}}.
+    Cases matching a profile pattern are also profiled (printed, and dumped to profile_dir).
+    """
+    names = select(patterns)
+    profiled = set(select(profile)) if profile else set()
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tree = Tree(Path(temp_dir), files, keys, depth)
+        for name in names:
+            func = CASES[name](tree)
+            results[name] = time_case(func, min_time, repeat)
+            if name in profiled:
+                calls = max(1, min(profile_calls, results[name]["number"]))
+                output = profile_dir / f"{name}.prof" if profile_dir is not None else None
+                print(f"=== Profile: {name} ({calls} calls) ===")
+                print(profile_case(func, calls, output))
+    
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "files": files,
+            "keys": keys,
+            "depth": depth,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> Dict[str, dict]:
+    """
+    Compare two results documents case by case. Returns, for every case in both,
+    its baseline and current time, the ratio and whether it regressed (slower
+    than the baseline by more than tolerance).
+    """
+    report = {}
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        ratio = result["ns_per_call"] / previous["ns_per_call"] if previous["ns_per_call"] else float('inf')
+        report[name] = {
+            "baseline_ns": previous["ns_per_call"],
+            "current_ns": result["ns_per_call"],
+            "ratio": ratio,
+            "regressed": ratio > 1 + tolerance,
+        }
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the config, display and startup hot paths.")
+    parser.add_argument("--files", type=int, default=50, help="config files in the synthetic tree")
+    parser.add_argument("--keys", type=int, default=40, help="top-level settings per config file")
+    parser.add_argument("--depth", type=int, default=2, help="nesting depth of dict settings")
+    parser.add_argument("--only", action="append", metavar="PATTERN", help="run cases matching a glob (repeatable)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per case (the best is kept)")
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--baseline", type=Path, help="compare with a results file; exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="slowdown tolerated against the baseline (default %(default)s)")
+    parser.add_argument("--profile", action="append", default=[], metavar="PATTERN",
+                        help="profile cases matching a glob with cProfile (repeatable)")
+    parser.add_argument("--profile-dir", type=Path, help="write .prof files for profiled cases here")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+    
+    if args.list:
+        print("\n".join(CASES))
+        return 0
+    
+    document = run(args.files, args.keys, args.depth, args.only, args.min_time, args.repeat,
+                   args.profile, args.profile_dir)
+    print_table(f"Benchmark suite ({args.files} files, {args.keys} keys, depth {args.depth})",
+                ((name, result["ns_per_call"]) for name, result in document["results"].items()))
+    
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(document, indent=2) + "\n")
+    
+    if args.baseline is None:
+        return 0
+    baseline = json.loads(args.baseline.read_text())
+    differences = [field for field in ("python", "implementation", "platform", "files", "keys", "depth")
+                   if baseline.get("meta", {}).get(field) != document["meta"][field]]
+    if differences:
+        print(f"Note: the baseline was recorded with a different {', '.join(differences)}")
+    report = compare(document, baseline, args.tolerance)
+    regressions = [name for name, entry in report.items() if entry["regressed"]]
+    print_table(f"Against {args.baseline} (current / baseline)",
+                ((f"{name}{'  REGRESSION' if entry['regressed'] else ''}", entry["ratio"])
+                 for name, entry in report.items()), unit="x")
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
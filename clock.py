@@ -0,0 +1,63 @@
+"""
+Coarse cached clock and cheap monotonic timers.
+The formatted wall-clock time only changes once a minute, so it is formatted once
+and reused until a monotonic deadline at the start of the next minute.
+"""
+
+from time import localtime, monotonic, perf_counter, strftime, time
+
+
+# Default clock format: minute resolution, 12-hour clock
+TIME_FORMAT = "%I:%M %p"
+
+
+class Clock:
+    """
+    Wall clock with minute resolution that formats the time at most once a minute.
+    A wall-clock adjustment is picked up at the next minute boundary.
+    """
+
+    def __init__(self, time_format: str = TIME_FORMAT):
+        self.time_format = time_format
+        self._text = ""
+        self._deadline = 0.0
+
+    def now(self) -> str:
+        """The current time, formatted."""
+        if monotonic() < self._deadline:
+            return self._text
+        return self._refresh()
+
+    def _refresh(self) -> str:
+        wall = time()
+        self._text = strftime(self.time_format, localtime(wall))
+        # Recompute once the wall clock reaches the next minute
+        self._deadline = monotonic() + 60.0 - wall % 60.0
+        return self._text
+
+
+class Stopwatch:
+    """Monotonic timer started on creation."""
+
+    __slots__ = ('start',)
+
+    def __init__(self):
+        self.start = perf_counter()
+
+    def elapsed(self) -> float:
+        """Seconds since the stopwatch was started."""
+        return perf_counter() - self.start
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the stopwatch was started."""
+        return (perf_counter() - self.start) * 1000
+
+    def restart(self) -> float:
+        """Restart the stopwatch and return the seconds elapsed before the restart."""
+        now = perf_counter()
+        elapsed, self.start = now - self.start, now
+        return elapsed
+
+
+# Shared clock used by helpers.time()
+clock = Clock()
@@ -24,5 +24,8 @@ message = "Hello from the General Python Template!"
 logging = {
     "level": "INFO",
     "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    "file": "logs/app.log"
+    "file": "logs/app.log",
+    # Rotate the log file once it grows past max_bytes, keeping backup_count old files
+    "max_bytes": 1048576,
+    "backup_count": 3
 }
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""
+Persistent on-disk cache of loaded configuration.
+Stores the loaded config files and JSON values in marshal format, keyed by the
+modification times and sizes of their source files.
+"""
+
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+# Bump when the layout of the cached data changes
+CACHE_FORMAT = 2
+
+# Default location of the cache file
+DEFAULT_CACHE_FILE = "data/config_cache.marshal"
+
+
+def _stat_entry(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def config_names(config_dir: Path) -> list:
+    """List the config file names (without .py) in a config directory."""
+    try:
+        with os.scandir(config_dir) as entries:
+            return sorted(
+                entry.name[:-3] for entry in entries
+                if entry.name.endswith('.py') and not entry.name.startswith('_') and entry.is_file()
+            )
+    except OSError:
+        return []
+
+
+def _overlay_entries(config_dir: Path, json_path: Path) -> tuple:
+    """Stat data of every possible environment overlay: config/<env>/*.py and config.<env>.json."""
+    try:
+        with os.scandir(config_dir) as entries:
+            directories = sorted(
+                entry.name for entry in entries
+                if entry.is_dir() and not entry.name.startswith(('_', '.'))
+            )
+    except OSError:
+        directories = []
+    overlays = tuple(
+        (directory, tuple((name, _stat_entry(config_dir / directory / f"{name}.py"))
+                          for name in config_names(config_dir / directory)))
+        for directory in directories
+    )
+
+    prefix, suffix = f"{json_path.stem}.", json_path.suffix
+    try:
+        with os.scandir(json_path.parent) as entries:
+            json_overlays = sorted(
+                entry.name for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+                and entry.name != json_path.name
+            )
+    except OSError:
+        json_overlays = []
+    return overlays, tuple((name, _stat_entry(json_path.parent / name)) for name in json_overlays)
+
+
+def fingerprint(config_dir: Path, json_path: Path, loader: str, env: Optional[str] = None) -> tuple:
+    """
+    Build the cache key for a config directory and JSON file from their stat data.
+    Every environment overlay is included, so the key does not depend on which
+    environment the loaded files select; env is the explicitly requested one.
+    """
+    files = tuple(
+        (name, _stat_entry(config_dir / f"{name}.py")) for name in config_names(config_dir)
+    )
+    return (
+        CACHE_FORMAT,
+        marshal.version,
+        tuple(sys.version_info[:2]),
+        loader,
+        str(config_dir.resolve()),
+        files,
+        str(json_path.resolve()),
+        _stat_entry(json_path),
+        env,
+        _overlay_entries(config_dir, json_path),
+    )
+
+
+class ConfigDiskCache:
+    """Reads and writes the marshalled config cache file."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_FILE):
+        self.path = Path(path)
+
+    def load(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Return the cached data if it was stored under key, otherwise None."""
+        try:
+            data = marshal.loads(self.path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if not isinstance(data, dict) or data.get('key') != key:
+            return None
+        return data
+
+    def store(self, key: tuple, files: Dict[str, Dict[str, Any]], json_vars: Dict[str, Any],
+              env: Optional[str] = None) -> bool:
+        """
+        Write the loaded config (and the environment it was loaded for) to the cache. Returns False if the values
+        cannot be marshalled (e.g. objects created by config files with real code).
+        """
+        try:
+            payload = marshal.dumps({'key': key, 'files': files, 'json': json_vars, 'env': env})
+        except ValueError:
+            return False
+
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(payload)
+            os.replace(temp_path, self.path)
+        except OSError:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            return False
+        return True
+
+    def clear(self) -> None:
+        """Delete the cache file."""
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
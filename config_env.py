@@ -0,0 +1,155 @@
+"""
+Environment variable layer shared by the config manager and helpers.
+Keeps a normalised, pre-coerced snapshot of os.environ and tracks changes to it.
+"""
+
+from __future__ import annotations
+
+import os
+import weakref
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set
+
+
+# Memoised dotted key -> environment variable name mapping
+_env_keys: Dict[str, str] = {}
+
+
+def env_key(key: str) -> str:
+    """Return the environment variable name for a dotted key (e.g. 'app.name' -> 'APP_NAME')."""
+    name = _env_keys.get(key)
+    if name is None:
+        name = _env_keys[key] = key.upper().replace('.', '_')
+    return name
+
+
+def coerce(value: str) -> Any:
+    """Convert string boolean values, leave everything else as is."""
+    lowered = value.lower()
+    if lowered in ('true', 'false'):
+        return lowered == 'true'
+    return value
+
+
+class EnvironmentLayer:
+    """
+    Snapshot of the process environment.
+    Writes through os.environ are picked up automatically; changes made behind
+    its back (os.putenv, C extensions, a custom mapping) are picked up by refresh().
+    """
+
+    def __init__(self, environ: Optional[Mapping[str, str]] = None):
+        self._environ = os.environ if environ is None else environ
+        self._raw: Dict[str, str] = dict(self._environ)
+        self._values: Dict[str, Any] = {name: coerce(value) for name, value in self._raw.items()}
+        self._listeners: List[Callable[[], Optional[Callable[[Set[str]], None]]]] = []
+        self.generation = 0
+
+        if self._environ is os.environ:
+            _watch_environ(self)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get the coerced value of an environment variable."""
+        return self._values.get(name, default)
+
+    def raw(self, name: str, default: Any = None) -> Any:
+        """Get the raw string value of an environment variable."""
+        return self._raw.get(name, default)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._raw
+
+    def names(self) -> List[str]:
+        """Names of all variables in the snapshot."""
+        return list(self._raw)
+
+    def subscribe(self, callback: Callable[[Set[str]], None]) -> None:
+        """
+        Register a callback that receives the set of changed variable names.
+        Bound methods are held weakly so subscribers can be garbage collected.
+        """
+        if hasattr(callback, '__self__'):
+            self._listeners.append(weakref.WeakMethod(callback))
+        else:
+            self._listeners.append(lambda: callback)
+
+    def refresh(self) -> Set[str]:
+        """Re-read the whole environment and return the names that changed."""
+        current = dict(self._environ)
+        changed = {
+            name for name in self._raw.keys() | current.keys()
+            if self._raw.get(name) != current.get(name)
+        }
+        for name in changed:
+            self._store(name, current.get(name))
+        if changed:
+            self._notify(changed)
+        return changed
+
+    def _on_write(self, name: str) -> None:
+        """Pick up a single variable written through os.environ."""
+        if os.name == 'nt':
+            name = name.upper()
+        value = self._environ.get(name)
+        if self._raw.get(name) == value:
+            return
+        self._store(name, value)
+        self._notify({name})
+
+    def _store(self, name: str, value: Optional[str]) -> None:
+        if value is None:
+            self._raw.pop(name, None)
+            self._values.pop(name, None)
+        else:
+            self._raw[name] = value
+            self._values[name] = coerce(value)
+
+    def _notify(self, changed: Set[str]) -> None:
+        self.generation += 1
+        alive = []
+        for ref in self._listeners:
+            callback = ref()
+            if callback is not None:
+                alive.append(ref)
+                try:
+                    callback(changed)
+                except Exception as e:
+                    # The variable is already written; a failing listener must
+                    # not fail the write or keep the others from invalidating
+                    print(f"Warning: Environment change listener failed: {e}")
+        self._listeners = alive
+
+
+# Layers that mirror os.environ and get notified of writes through it
+_environ_layers: "weakref.WeakSet[EnvironmentLayer]" = weakref.WeakSet()
+
+
+def _report_write(key: str) -> None:
+    """Tell every layer mirroring os.environ about a write; one failing layer does not stop the rest."""
+    for layer in list(_environ_layers):
+        try:
+            layer._on_write(key)
+        except Exception as e:
+            print(f"Warning: Could not update the environment snapshot for {key}: {e}")
+
+
+class _WatchedEnviron(type(os.environ)):
+    """os.environ that reports writes to the environment layers mirroring it."""
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        _report_write(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        _report_write(key)
+
+
+def _watch_environ(layer: EnvironmentLayer) -> None:
+    """Start reporting os.environ writes to layer."""
+    if type(os.environ) is not _WatchedEnviron:
+        os.environ.__class__ = _WatchedEnviron
+    _environ_layers.add(layer)
+
+
+# Shared environment layer
+environment = EnvironmentLayer()
@@ -0,0 +1,153 @@
+"""
+Prefix trie of every config key across all layers.
+Config file keys are indexed by their dotted path; JSON and environment names
+are mapped to dotted keys once, when the index is built, so membership tests and
+prefix queries never scan the layers.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
+
+from config_env import env_key
+
+
+class _Node:
+    __slots__ = ('children', 'terminal')
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.terminal = False
+
+
+def _copy(node: _Node) -> _Node:
+    copy = _Node()
+    copy.children = node.children.copy()
+    copy.terminal = node.terminal
+    return copy
+
+
+class KeyIndex:
+    """
+    Trie of dotted keys, one node per key segment.
+    Lookups cost one dict lookup per segment, independent of the number of keys.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        # Environment-style name -> dotted key, for every key and every key prefix
+        self._env_names: Dict[str, str] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: str) -> None:
+        """Add a dotted key (its prefixes become reachable, but are not keys themselves)."""
+        node = self._root
+        path = None
+        for part in key.split('.'):
+            path = part if path is None else f"{path}.{part}"
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _Node()
+                self._env_names.setdefault(env_key(path), path)
+            node = child
+        if not node.terminal:
+            node.terminal = True
+            self._size += 1
+
+    def with_keys(self, keys: Iterable[str]) -> "KeyIndex":
+        """
+        Copy of the index with keys added. Only the nodes on the keys' paths are
+        copied; the rest of the trie is shared, so this index is left unchanged.
+        """
+        index = KeyIndex()
+        index._root = self._root
+        index._env_names = self._env_names.copy()
+        index._size = self._size
+        for key in keys:
+            node = index._root = _copy(index._root)
+            path = None
+            for part in key.split('.'):
+                path = part if path is None else f"{path}.{part}"
+                child = node.children.get(part)
+                if child is None:
+                    index._env_names.setdefault(env_key(path), path)
+                    child = _Node()
+                else:
+                    child = _copy(child)
+                node.children[part] = child
+                node = child
+            if not node.terminal:
+                node.terminal = True
+                index._size += 1
+        return index
+
+    def add_tree(self, prefix: str, data: Mapping[str, Any]) -> None:
+        """Add every key of a nested mapping under prefix."""
+        for name, value in data.items():
+            key = f"{prefix}.{name}"
+            self.add(key)
+            if isinstance(value, dict):
+                self.add_tree(key, value)
+
+    def key_for(self, name: str) -> Optional[str]:
+        """
+        Map an environment-style name to a dotted key. Names of known keys map to
+        them (APP_LOGGING_LEVEL -> app.logging.level); otherwise the longest known
+        prefix is kept and the rest becomes one segment (APP_NEW_FLAG -> app.new_flag).
+        Returns None if no known key or prefix matches.
+        """
+        key = self._env_names.get(name)
+        if key is not None:
+            return key
+        parts = name.split('_')
+        for cut in range(len(parts) - 1, 0, -1):
+            prefix = self._env_names.get('_'.join(parts[:cut]))
+            if prefix is not None:
+                return f"{prefix}.{'_'.join(parts[cut:]).lower()}"
+        return None
+
+    def _node(self, key: str) -> Optional[_Node]:
+        node = self._root
+        for part in key.split('.'):
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def __contains__(self, key: str) -> bool:
+        node = self._node(key)
+        return node is not None and node.terminal
+
+    def keys(self, prefix: str = "") -> Iterator[str]:
+        """Stream the keys under prefix (not including prefix itself), depth first."""
+        prefix = prefix.rstrip('.')
+        node = self._node(prefix) if prefix else self._root
+        if node is None:
+            return
+        stack = [(f"{prefix}.{name}" if prefix else name, child)
+                 for name, child in reversed(node.children.items())]
+        while stack:
+            key, node = stack.pop()
+            if node.terminal:
+                yield key
+            stack.extend((f"{key}.{name}", child) for name, child in reversed(node.children.items()))
+
+
+def build_index(files: Mapping[str, Mapping[str, Any]], json_names: Iterable[str],
+                env_names: Iterable[str]) -> KeyIndex:
+    """
+    Index the config file keys, then the JSON names and the environment variables
+    that fall under a known key. JSON names that match nothing are indexed as
+    lower-case keys; unrelated environment variables (PATH, HOME, ...) are skipped.
+    """
+    index = KeyIndex()
+    for config_name, data in files.items():
+        index.add_tree(config_name, data)
+    for name in json_names:
+        index.add(index.key_for(name) or name.lower())
+    for name in env_names:
+        key = index.key_for(name)
+        if key is not None:
+            index.add(key)
+    return index
@@ -0,0 +1,288 @@
+"""
+Lazily materialised JSON config files.
+A large config.json is indexed in one streaming pass: the name of every
+top-level entry is mapped to the byte range of its value, and each value is
+decoded from the file only when it is first read. The file is read in chunks,
+so indexing holds at most one chunk (or the largest single value) in memory.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Set, Tuple
+
+from config_loader import load_json_file
+
+
+# JSON loading modes: 'auto' indexes files of LAZY_JSON_THRESHOLD bytes or more lazily
+JSON_MODES = ('auto', 'eager', 'lazy')
+
+LAZY_JSON_THRESHOLD = 1024 * 1024
+
+# Bytes read per step while indexing
+CHUNK_SIZE = 1024 * 1024
+
+_ABSENT = object()
+
+
+def _utf8_length(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+def index_json_file(f, chunk_size: int = CHUNK_SIZE) -> Optional[Dict[str, Tuple[int, int, int]]]:
+    """
+    Stream a JSON object from the binary file f and map each top-level name to
+    (byte offset, byte length, hash of the value's text). Returns None if the
+    document is not an object; raises ValueError if it is malformed.
+    """
+    import codecs
+    import re
+    from json.decoder import JSONDecoder, scanstring
+
+    scan_once = JSONDecoder().scan_once
+    skip = re.compile(r'[ \t\n\r]*').match
+    decoder = codecs.getincrementaldecoder('utf-8')()
+
+    buf = ''
+    eof = False
+    # Byte offset of buf[mark]; buf is only trimmed before reading more
+    mark = 0
+    mark_offset = 0
+
+    def offset_of(index: int) -> int:
+        nonlocal mark, mark_offset
+        mark_offset += _utf8_length(buf[mark:index])
+        mark = index
+        return mark_offset
+
+    def read_more(keep: int, size: int) -> None:
+        """Drop the text before buf[keep] and append at least size more bytes."""
+        nonlocal buf, eof, mark, mark_offset
+        offset_of(keep)
+        chunk = f.read(size)
+        eof = not chunk
+        buf = buf[keep:] + decoder.decode(chunk, final=eof)
+        mark = 0
+
+    read_more(0, chunk_size)
+    pos = skip(buf, 0).end()
+    while pos == len(buf) and not eof:
+        read_more(pos, chunk_size)
+        pos = skip(buf, 0).end()
+    if buf[pos:pos + 1] != '{':
+        return None
+
+    entries: Dict[str, Tuple[int, int, int]] = {}
+    pos += 1
+    first = True
+    while True:
+        # Parse one "name": value entry and the delimiter after it; if the buffer
+        # ends inside it, read more (growing the read so big values stay linear)
+        start = pos
+        try:
+            pos = skip(buf, pos).end()
+            if first and buf[pos] == '}':
+                pos += 1
+                break
+            if buf[pos] != '"':
+                raise ValueError("expected a property name")
+            name, pos = scanstring(buf, pos + 1)
+            pos = skip(buf, pos).end()
+            if buf[pos] != ':':
+                raise ValueError("expected ':'")
+            value_start = skip(buf, pos + 1).end()
+            _, value_end = scan_once(buf, value_start)
+            pos = skip(buf, value_end).end()
+            delimiter = buf[pos]
+            if delimiter not in ',}':
+                raise ValueError("expected ',' or '}'")
+        except (ValueError, IndexError, StopIteration) as e:
+            if eof:
+                problem = "unexpected end of data" if isinstance(e, (IndexError, StopIteration)) else e
+                raise ValueError(f"Invalid JSON near byte {offset_of(start)}: {problem}") from None
+            read_more(start, max(chunk_size, len(buf) - start))
+            pos = 0
+            continue
+
+        text = buf[value_start:value_end]
+        entries[name] = (offset_of(value_start), _utf8_length(text), hash(text))
+        pos += 1
+        first = False
+        if delimiter == '}':
+            break
+
+    rest = buf[pos:]
+    while not rest.strip() and not eof:
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        rest = decoder.decode(chunk, final=eof)
+    if rest.strip():
+        raise ValueError("Extra data after the JSON object")
+    return entries
+
+
+def _signature(stat: os.stat_result) -> Tuple[int, int, int]:
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+class _IndexedFile:
+    """
+    An open JSON file and the byte ranges of its values. If the file is rewritten
+    in place (truncated and written again), it is indexed again before the next
+    read, so values are never decoded from the wrong bytes.
+    """
+
+    # Reads retried when the file changes between the check and the read
+    ATTEMPTS = 3
+
+    def __init__(self, path: Path, file, entries: Dict[str, Tuple[int, int, int]],
+                 signature: Tuple[int, int, int]):
+        self.path = path
+        self.file = file
+        self.entries = entries
+        self.signature = signature
+        self.lock = threading.Lock()
+        weakref.finalize(self, file.close)
+
+    def _current(self) -> Dict[str, Tuple[int, int, int]]:
+        """The index of the file as it is now, re-indexing it if it was rewritten."""
+        signature = _signature(os.fstat(self.file.fileno()))
+        if signature == self.signature:
+            return self.entries
+        with self.lock:
+            if signature != self.signature:
+                self.file.seek(0)
+                entries = index_json_file(self.file)
+                if _signature(os.fstat(self.file.fileno())) != signature:
+                    raise ValueError(f"{self.path} changed while it was being indexed")
+                if entries is None:
+                    raise ValueError(f"{self.path} no longer holds a JSON object")
+                self.entries, self.signature = entries, signature
+            return self.entries
+
+    def read(self, name: str) -> bytes:
+        """Read the text of name's value from the file as it is now."""
+        for _ in range(self.ATTEMPTS):
+            entry = self._current().get(name)
+            if entry is None:
+                raise ValueError(f"{self.path} was rewritten without {name!r}; reload the configuration")
+            offset, length, _ = entry
+            if hasattr(os, 'pread'):
+                data = os.pread(self.file.fileno(), length, offset)
+            else:
+                with self.lock:
+                    self.file.seek(offset)
+                    data = self.file.read(length)
+            if _signature(os.fstat(self.file.fileno())) == self.signature:
+                return data
+        raise ValueError(f"{self.path} keeps changing while it is read")
+
+
+class LazyJSONObject(Mapping[str, Any]):
+    """
+    Read-only mapping over an indexed JSON file. Membership tests and iteration
+    use the index only; values are decoded on first access and kept.
+    The file stays open, so values keep coming from the indexed version of it
+    if it is replaced on disk (renamed over). If it is rewritten in place
+    instead, it is indexed again before the next value is decoded; names and
+    change detection (token) still describe the version indexed first.
+    """
+
+    def __init__(self, path: Path, source: _IndexedFile, entries: Dict[str, Tuple[int, int, int]],
+                 overlay: Optional[Mapping[str, Any]] = None, values: Optional[Dict[str, Any]] = None):
+        self.path = path
+        # The open file, shared with copies (which keep it open)
+        self._source = source
+        self._entries = entries
+        # Entries of an environment overlay (config.<env>.json) that replace ours
+        self._overlay = overlay
+        self._values = {} if values is None else values
+
+    @classmethod
+    def open(cls, path: Path, chunk_size: int = CHUNK_SIZE) -> Optional["LazyJSONObject"]:
+        """Index path, or return None if it does not hold a JSON object."""
+        file = open(path, 'rb', buffering=0)
+        try:
+            for _ in range(_IndexedFile.ATTEMPTS):
+                signature = _signature(os.fstat(file.fileno()))
+                file.seek(0)
+                entries = index_json_file(file, chunk_size)
+                if _signature(os.fstat(file.fileno())) == signature:
+                    break
+            else:
+                raise ValueError(f"{path} keeps changing while it is read")
+        except BaseException:
+            file.close()
+            raise
+        if entries is None:
+            file.close()
+            return None
+        return cls(path, _IndexedFile(path, file, entries, signature), entries)
+
+    def with_overlay(self, overlay: Mapping[str, Any]) -> "LazyJSONObject":
+        """A copy with overlay's entries taking precedence, sharing the decoded values."""
+        return LazyJSONObject(self.path, self._source, self._entries, overlay, self._values)
+
+    @property
+    def decoded(self) -> int:
+        """Number of values decoded so far."""
+        return len(self._values)
+
+    def __getitem__(self, name: str) -> Any:
+        overlay = self._overlay
+        if overlay is not None and name in overlay:
+            return overlay[name]
+        value = self._values.get(name, _ABSENT)
+        if value is _ABSENT:
+            if name not in self._entries:
+                raise KeyError(name)
+            import json
+            value = self._values.setdefault(name, json.loads(self._source.read(name)))
+        return value
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries or (self._overlay is not None and name in self._overlay)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._entries
+        if self._overlay is not None:
+            for name in self._overlay:
+                if name not in self._entries:
+                    yield name
+
+    def __len__(self) -> int:
+        if self._overlay is None:
+            return len(self._entries)
+        return len(self._entries) + sum(1 for name in self._overlay if name not in self._entries)
+
+    def token(self, name: str) -> Any:
+        """Something that compares equal for equal values of name, without decoding it if possible."""
+        overlay = self._overlay
+        if overlay is not None and name in overlay:
+            return _token(overlay, name)
+        entry = self._entries.get(name)
+        if entry is None:
+            return ('value', _ABSENT)
+        return ('text', entry[1], entry[2])
+
+
+def _token(values: Mapping[str, Any], name: str) -> Any:
+    if isinstance(values, LazyJSONObject):
+        return values.token(name)
+    return ('value', values.get(name, _ABSENT))
+
+
+def changed_names(old: Mapping[str, Any], new: Mapping[str, Any]) -> Set[str]:
+    """Names whose values differ; lazily loaded values are compared by their source text."""
+    return {name for name in old.keys() | new.keys() if _token(old, name) != _token(new, name)}
+
+
+def load_json(path: Path, mode: str = 'auto') -> Mapping[str, Any]:
+    """Load a JSON config file, indexing it lazily in 'lazy' mode or if it is large in 'auto' mode."""
+    if mode == 'eager' or (mode == 'auto' and os.stat(path).st_size < LAZY_JSON_THRESHOLD):
+        return load_json_file(path)
+    lazy = LazyJSONObject.open(path)
+    return load_json_file(path) if lazy is None else lazy
@@ -0,0 +1,118 @@
+"""
+Loaders for config/*.py files and the JSON config file.
+Literal-only config files are evaluated statically; files with real code are imported.
+"""
+
+from __future__ import annotations
+
+import importlib.machinery
+from opcode import opmap
+from pathlib import Path
+from types import CodeType
+from typing import Any, Dict, Optional, Tuple
+
+
+# 'auto' evaluates literal-only files statically and imports the rest, 'exec' always imports
+LOADER_MODES = ('auto', 'exec')
+
+# Instructions that only build constants and bind them to names
+_LITERAL_OPNAMES = (
+    'CACHE', 'RESUME', 'NOP', 'EXTENDED_ARG',
+    'LOAD_CONST', 'LOAD_SMALL_INT', 'STORE_NAME', 'COPY', 'DUP_TOP', 'POP_TOP',
+    'BUILD_LIST', 'BUILD_TUPLE', 'BUILD_SET', 'BUILD_MAP', 'BUILD_CONST_KEY_MAP',
+    'LIST_APPEND', 'LIST_EXTEND', 'LIST_TO_TUPLE', 'SET_ADD', 'SET_UPDATE', 'MAP_ADD',
+    'RETURN_VALUE', 'RETURN_CONST',
+)
+_LITERAL_OPCODES = frozenset(opmap[name] for name in _LITERAL_OPNAMES if name in opmap)
+
+# Compiled config files keyed by path: (mtime_ns, size, code or None if not literal-only)
+_code_cache: Dict[str, Tuple[int, int, Optional[CodeType]]] = {}
+
+
+def is_literal_code(code: CodeType) -> bool:
+    """Check that a module code object does nothing but assign literals to names."""
+    if not set(code.co_code[::2]) <= _LITERAL_OPCODES:
+        return False
+    return not any(isinstance(const, CodeType) for const in code.co_consts)
+
+
+def _literal_code(config_file: Path, config_name: str) -> Optional[CodeType]:
+    """Get the compiled code of a literal-only config file, or None if it has real code."""
+    path = str(config_file)
+    stat = config_file.stat()
+    cached = _code_cache.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    loader = importlib.machinery.SourceFileLoader(config_name, path)
+    try:
+        code = loader.get_code(config_name)
+    except SyntaxError:
+        # Let the import path raise the real error
+        code = None
+
+    if code is not None and not is_literal_code(code):
+        code = None
+    _code_cache[path] = (stat.st_mtime_ns, stat.st_size, code)
+    return code
+
+
+def load_static(config_file: Path, config_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Evaluate a literal-only config file without importing it.
+    The compiled code comes from the regular __pycache__ bytecode cache (and an
+    in-process cache keyed by mtime and size, so reloads of unchanged files skip
+    compilation). It is only run after checking that it consists of
+    constant-building instructions, so it has no access to builtins, imports or
+    calls. Returns None for files with real code.
+    """
+    code = _literal_code(config_file, config_name)
+    if code is None:
+        return None
+
+    namespace: Dict[str, Any] = {'__builtins__': {}}
+    exec(code, namespace)
+
+    # Match the attribute order and filtering of an imported module's dir()
+    return {name: namespace[name] for name in sorted(namespace) if not name.startswith('_')}
+
+
+def load_module(config_file: Path, config_name: str) -> Dict[str, Any]:
+    """Import a config file and collect its non-private attributes."""
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location(config_name, config_file)
+    if spec is None or spec.loader is None:
+        return {}
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    # Extract all non-private attributes as config values
+    config_data = {}
+    for attr_name in dir(module):
+        if not attr_name.startswith('_'):
+            config_data[attr_name] = getattr(module, attr_name)
+
+    return config_data
+
+
+def load_config_file(config_file: Path, config_name: str, mode: str = "auto") -> Dict[str, Any]:
+    """Load a config file, statically if possible when mode is 'auto'."""
+    if not config_file.exists():
+        return {}
+
+    if mode == "auto":
+        values = load_static(config_file, config_name)
+        if values is not None:
+            return values
+
+    return load_module(config_file, config_name)
+
+
+def load_json_file(json_path: Path) -> Dict[str, Any]:
+    """Read and parse a JSON config file in place with a single read."""
+    import json
+
+    with open(json_path, 'rb') as f:
+        return json.loads(f.read())
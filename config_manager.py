@@ -3,109 +3,596 @@ Laravel-like configuration manager for Python applications.
 Supports loading config files from the config directory and environment overrides.
 """
 
+from __future__ import annotations
+
 import os
 import sys
-import json
-import importlib.util
-from typing import Any, Dict, Optional
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
 from pathlib import Path
-import tempfile
-import shutil
+from time import perf_counter_ns
+
+from clock import Stopwatch
+from config_env import EnvironmentLayer, env_key, environment as _environment
+from config_loader import LOADER_MODES, load_config_file
+
+# The disk cache, key index, lazy JSON and schema modules are imported when
+# first needed, so importing this module (and starting the CLI) stays cheap
+if TYPE_CHECKING:
+    from config_cache import ConfigDiskCache
+    from config_index import KeyIndex
+    from config_metrics import ConfigMetrics
+    from config_schema import ConfigSchema
+
+
+# Marks a key that is not in the resolved index yet
+_MISSING = object()
+
+# Marks a key that was resolved and found in no layer
+_NOT_FOUND = object()
+
+# Key that names the active environment (APP_ENV), which selects the overlays
+ENV_KEY = 'app.env'
+
+# Generated snapshot classes keyed by the dotted keys they hold
+_snapshot_classes: Dict[Tuple[str, ...], type] = {}
+
+
+def _flatten(prefix: str, data: Mapping[str, Any], into: Dict[str, Any]) -> Dict[str, Any]:
+    """Collect every dotted key under prefix (nested dicts included) with its value."""
+    for name, value in data.items():
+        key = f"{prefix}.{name}"
+        into[key] = value
+        if isinstance(value, dict):
+            _flatten(key, value, into)
+    return into
+
+
+def _file_value(data: Mapping[str, Any], setting_path: str) -> Any:
+    """Get the value at a dotted path inside a config file's values, or _MISSING."""
+    current = data
+    for part in setting_path.split('.'):
+        if not isinstance(current, dict) or part not in current:
+            return _MISSING
+        current = current[part]
+    return current
+
+
+def _freeze(value: Any, previous: Any = None, previous_frozen: Any = None) -> Any:
+    """
+    Recursively convert dicts to read-only mapping proxies and lists to tuples.
+    Subtrees that are the same objects as in previous (set() copies only the
+    path it changes) reuse their frozen counterpart from previous_frozen.
+    """
+    if value is previous and previous_frozen is not None:
+        return previous_frozen
+    if isinstance(value, dict):
+        if not isinstance(previous, dict):
+            previous, previous_frozen = {}, {}
+        return MappingProxyType({
+            name: _freeze(item, previous.get(name), previous_frozen.get(name))
+            for name, item in value.items()
+        })
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _changed_keys(old: Mapping[str, Any], new: Mapping[str, Any]) -> Set[str]:
+    """Get the keys whose values differ between two flattened configs."""
+    return {key for key in old.keys() | new.keys() if old.get(key, _MISSING) != new.get(key, _MISSING)}
+
+
+def _snapshot_class(keys: Tuple[str, ...]) -> type:
+    """
+    Get the namedtuple class for a set of keys ('app.name' becomes the field 'app_name').
+    Keys that don't give a valid, unique field name get their position instead ('_1').
+    """
+    cls = _snapshot_classes.get(keys)
+    if cls is None:
+        fields = [key.replace('.', '_') for key in keys]
+        cls = _snapshot_classes[keys] = namedtuple('ConfigSnapshot', fields, rename=True)
+    return cls
+
+
+def _with_value(data: Dict[str, Any], parts: List[str], value: Any) -> Dict[str, Any]:
+    """Return a copy of data with value set at the nested path, copying only the dicts along it."""
+    updated = dict(data)
+    if len(parts) == 1:
+        updated[parts[0]] = value
+    else:
+        child = updated.get(parts[0])
+        updated[parts[0]] = _with_value(child if isinstance(child, dict) else {}, parts[1:], value)
+    return updated
+
+
+def _merged(base: Dict[str, Any], overlay: Mapping[str, Any]) -> Dict[str, Any]:
+    """Deep-merge overlay over base: nested dicts are merged, everything else is replaced."""
+    merged = dict(base)
+    for name, value in overlay.items():
+        current = merged.get(name)
+        if isinstance(value, dict) and isinstance(current, dict):
+            value = _merged(current, value)
+        merged[name] = value
+    return merged
+
+
+def _override(overrides: Mapping[str, Any], key: str) -> Any:
+    """
+    Look key up in the set() overrides: the key itself, or a value nested in an
+    overridden ancestor. Costs one dict lookup per key segment at most.
+    """
+    value = overrides.get(key, _MISSING)
+    if value is not _MISSING or '.' not in key:
+        return value
+    parts = key.split('.')
+    for depth in range(len(parts) - 1, 0, -1):
+        value = overrides.get('.'.join(parts[:depth]), _MISSING)
+        if value is not _MISSING:
+            for part in parts[depth:]:
+                if not isinstance(value, dict) or part not in value:
+                    return _MISSING
+                value = value[part]
+            return value
+    return _MISSING
+
+
+def _with_override(overrides: Mapping[str, Any], key: str, value: Any) -> Dict[str, Any]:
+    """
+    Return a copy of overrides with key set to value. Overrides nested below key
+    are dropped; if an ancestor of key is overridden, value is set inside it.
+    """
+    prefix = key + '.'
+    updated = {name: item for name, item in overrides.items() if not name.startswith(prefix)}
+    parts = key.split('.')
+    for depth in range(1, len(parts)):
+        ancestor = '.'.join(parts[:depth])
+        if ancestor in updated:
+            current = updated[ancestor]
+            updated[ancestor] = _with_value(current if isinstance(current, dict) else {}, parts[depth:], value)
+            return updated
+    updated[key] = value
+    return updated
+
+
+def _related_to(key: str) -> Callable[[str], bool]:
+    """Match key, its ancestors and its descendants."""
+    prefix = key + '.'
+    return lambda cached: cached == key or cached.startswith(prefix) or key.startswith(cached + '.')
+
+
+def _nested_under(keys: Set[str]) -> Callable[[str], bool]:
+    """Match any of keys and anything nested below them."""
+    def matches(cached: str) -> bool:
+        parts = cached.split('.')
+        return any('.'.join(parts[:depth]) in keys for depth in range(1, len(parts) + 1))
+    return matches
+
+
+class _ConfigState:
+    """
+    One published generation of configuration.
+    Writers never change a published state, they build a new one and swap it in.
+    files and resolved only ever gain entries (lazily loaded files, cached lookups),
+    which is safe for concurrent readers.
+    
+    The layers, lowest first: config files (with the environment overlay merged
+    in when they are loaded), JSON (likewise), environment variables and set()
+    overrides. resolved is the flattened result, filled in lazily.
+    """
+    
+    __slots__ = ('files', 'json_vars', 'overrides', 'resolved', 'env_keys', 'index', 'views')
+    
+    def __init__(self, files: Dict[str, Dict[str, Any]], json_vars: Mapping[str, Any],
+                 resolved: Optional[Dict[str, Any]] = None,
+                 views: Optional[Dict[str, Tuple[Dict[str, Any], Mapping[str, Any]]]] = None,
+                 overrides: Optional[Dict[str, Any]] = None,
+                 env_keys: Optional[Dict[str, Set[str]]] = None, index: Optional["KeyIndex"] = None):
+        self.files = files
+        self.json_vars = json_vars
+        # Dotted key -> value set at runtime with set()
+        self.overrides = {} if overrides is None else overrides
+        self.resolved = {} if resolved is None else resolved
+        # Environment-style name -> resolved keys it overrides, recorded as keys
+        # are resolved, so environment and JSON changes map to keys without a scan
+        self.env_keys = {} if env_keys is None else env_keys
+        # Config file name -> (file values, frozen view of them), built by all()
+        self.views = {} if views is None else views
+        # Key index over all layers, built on first use and carried over (with
+        # the new keys added) by set() and environment changes
+        self.index = index
 
 
 class ConfigManager:
-    """Manages application configuration with support for multiple config files and environment overrides."""
+    """
+    Manages application configuration with support for multiple config files and environment overrides.
     
-    def __init__(self, config_dir: str = "config", json_file: str = "config.json"):
+    Readers work on an immutable state picked up with a single attribute read and
+    never lock. Writers (set, reload, environment changes) are serialised, build a
+    new state and swap it in atomically.
+    """
+    
+    def __init__(self, config_dir: str = "config", json_file: str = "config.json",
+                 environment: Optional[EnvironmentLayer] = None, loader: str = "auto",
+                 cache_file: Optional[str] = None, schema_file: Optional[str] = None,
+                 env: Optional[str] = None, json_mode: str = "auto"):
+        if loader not in LOADER_MODES:
+            raise ValueError(f"Unknown config loader mode: {loader!r}")
+        if json_mode != "auto":
+            from config_json import JSON_MODES
+            if json_mode not in JSON_MODES:
+                raise ValueError(f"Unknown JSON loading mode: {json_mode!r}")
+        
         self.config_dir = Path(config_dir)
+        self.loader = loader
         self.json_file = Path(json_file)
-        self._config_cache: Dict[str, Dict[str, Any]] = {}
-        self._json_vars: Dict[str, Any] = {}
-        self._extracted_json_path: Optional[Path] = None
+        # 'eager' parses JSON files in full, 'lazy' indexes them and decodes values
+        # on first access, 'auto' does that for large files only
+        self.json_mode = json_mode
+        self._write_lock = threading.RLock()
+        
+        # Callbacks notified with the keys changed by incremental reloads
+        self._subscribers: List[Callable[[Set[str]], None]] = []
+        self._watcher = None
         
-        # Load configuration from JSON file
-        self._load_json_file()
+        # Optional on-disk cache of the loaded config files and JSON values
+        self._disk_cache: Optional["ConfigDiskCache"] = None
+        if cache_file:
+            from config_cache import ConfigDiskCache
+            self._disk_cache = ConfigDiskCache(cache_file)
         
-    def _load_json_file(self) -> None:
-        """Load configuration from JSON file. If bundled, extract it temporarily."""
-        json_path = self.json_file
+        # Optional typed schema (config/schema.json by default), compiled once
+        schema_path = Path(schema_file) if schema_file else self.config_dir / "schema.json"
+        self.schema: Optional["ConfigSchema"] = None
+        if schema_path.exists():
+            from config_schema import load_schema
+            self.schema = load_schema(schema_path)
         
-        # Check if this is a bundled application (PyInstaller)
+        # Metrics are only collected once instrument() is called
+        self._metrics: Optional["ConfigMetrics"] = None
+        
+        # Set by freeze(); a frozen configuration rejects every change
+        self._frozen = False
+        
+        # Environment snapshot, shared with helpers.env unless one is passed in
+        self._environment = _environment if environment is None else environment
+        
+        # Active environment (e.g. "production"), selecting config/<env>/*.py and
+        # config.<env>.json overlays; picked when the configuration is (re)loaded
+        self._env = env
+        self.env_name: Optional[str] = None
+        self._overlay_dir: Optional[Path] = None
+        
+        # Load configuration from the disk cache or the JSON file
+        self._state = self._initial_state()
+        self._version = 0
+        
+        self._environment.subscribe(self._on_env_change)
+    
+    def _json_source(self) -> Path:
+        """Get the JSON file to read, preferring the bundled copy in PyInstaller builds."""
         if hasattr(sys, '_MEIPASS'):
-            # Extract JSON from bundled resources to a temporary location
             bundled_json = Path(sys._MEIPASS) / self.json_file.name
             if bundled_json.exists():
-                # Create a temporary file
-                temp_fd, temp_path = tempfile.mkstemp(suffix='.json')
-                os.close(temp_fd)
-                
-                # Copy the bundled JSON to temp location
-                shutil.copy2(bundled_json, temp_path)
-                json_path = Path(temp_path)
-                self._extracted_json_path = json_path
-        
-        # Load the JSON file if it exists
-        if json_path.exists():
-            try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    self._json_vars = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load JSON config file {json_path}: {e}")
-                self._json_vars = {}
-    
-    def __del__(self):
-        """Clean up extracted JSON file when the ConfigManager is destroyed."""
-        self._cleanup_extracted_json()
-    
-    def _cleanup_extracted_json(self) -> None:
-        """Delete the extracted JSON file if it exists."""
-        if hasattr(self, '_extracted_json_path') and self._extracted_json_path and self._extracted_json_path.exists():
-            try:
-                self._extracted_json_path.unlink()
-                self._extracted_json_path = None
-            except OSError:
-                pass  # Ignore cleanup errors
-    
-    def _load_config_file(self, config_name: str) -> Dict[str, Any]:
-        """Load a specific config file."""
-        config_file = self.config_dir / f"{config_name}.py"
-        
-        if not config_file.exists():
+                return bundled_json
+        return self.json_file
+    
+    def _json_overlay_source(self) -> Optional[Path]:
+        """Get the active environment's JSON overlay (config.<env>.json next to the JSON file)."""
+        if not self.env_name:
+            return None
+        json_path = self._json_source()
+        return json_path.with_name(f"{json_path.stem}.{self.env_name}{json_path.suffix}")
+    
+    def _explicit_env(self) -> Optional[str]:
+        """The environment requested with the env argument or the APP_ENV variable, if any."""
+        if self._env is not None:
+            return self._env
+        return self._environment.raw(env_key(ENV_KEY)) or None
+    
+    def _default_env(self, base_json: Mapping[str, Any], loaded: Dict[str, Dict[str, Any]]) -> Optional[str]:
+        """
+        The environment named by APP_ENV in the base JSON file, or by env in
+        config/app.py. If app.py has to be read, its values are kept in loaded.
+        """
+        name = base_json.get(env_key(ENV_KEY))
+        if name is None:
+            config_name, setting = ENV_KEY.split('.')
+            data = loaded[config_name] = load_config_file(
+                self.config_dir / f"{config_name}.py", config_name, self.loader)
+            name = data.get(setting)
+        return name
+    
+    def _use_env(self, name: Optional[str]) -> None:
+        """Make name the active environment and locate its config overlay directory."""
+        self.env_name = str(name) if name else None
+        overlay_dir = self.config_dir / self.env_name if self.env_name else None
+        self._overlay_dir = overlay_dir if overlay_dir is not None and overlay_dir.is_dir() else None
+    
+    def _config_names(self) -> List[str]:
+        """List the config file names, including ones that only exist as an overlay."""
+        from config_cache import config_names
+        
+        names = config_names(self.config_dir)
+        if self._overlay_dir is not None:
+            names = sorted(set(names).union(config_names(self._overlay_dir)))
+        return names
+    
+    def _initial_state(self) -> _ConfigState:
+        """
+        Build a fresh state. With the disk cache enabled every config file is loaded
+        up front, from the cache if it is current, otherwise from source (and the
+        cache is rewritten). Without it config files are loaded on first use.
+        
+        The active environment is picked first: the env argument, then APP_ENV
+        from the environment, then from the base JSON file, then env in config/app.py.
+        """
+        explicit_env = self._explicit_env()
+        key = None
+        if self._disk_cache is not None:
+            from config_cache import fingerprint
+            key = fingerprint(self.config_dir, self._json_source(), self.loader, explicit_env)
+            cached = self._disk_cache.load(key)
+            if cached is not None:
+                self._use_env(cached['env'])
+                return _ConfigState(cached['files'], cached['json'])
+        
+        base_json = self._read_json(self._json_source())
+        loaded: Dict[str, Dict[str, Any]] = {}
+        self._use_env(explicit_env or self._default_env(base_json, loaded))
+        json_vars = self._with_json_overlay(base_json)
+        # A config file read to pick the environment is not loaded (run) again
+        files = {name: self._load_config_file(name, data) for name, data in loaded.items()}
+        if key is None:
+            return _ConfigState(files, json_vars)
+        
+        for name in self._config_names():
+            if name not in files:
+                files[name] = self._load_config_file(name)
+        self._disk_cache.store(key, files, dict(json_vars), self.env_name)
+        return _ConfigState(files, json_vars)
+    
+    def _read_json(self, json_path: Path) -> Mapping[str, Any]:
+        """Read a JSON config file in place, treating a missing or broken file as empty."""
+        from config_json import load_json
+        
+        try:
+            return load_json(json_path, self.json_mode)
+        except FileNotFoundError:
             return {}
-            
-        spec = importlib.util.spec_from_file_location(config_name, config_file)
-        if spec is None or spec.loader is None:
+        except (ValueError, OSError) as e:
+            print(f"Warning: Could not load JSON config file {json_path}: {e}")
             return {}
-            
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        
-        # Extract all non-private attributes as config values
-        config_data = {}
-        for attr_name in dir(module):
-            if not attr_name.startswith('_'):
-                config_data[attr_name] = getattr(module, attr_name)
-                
-        return config_data
+    
+    def _with_json_overlay(self, json_vars: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Apply the active environment's JSON overlay, if there is one, over json_vars."""
+        overlay_path = self._json_overlay_source()
+        if overlay_path is None:
+            return json_vars
+        overlay = self._read_json(overlay_path)
+        if not overlay:
+            return json_vars
+        from config_json import LazyJSONObject
+        
+        if isinstance(json_vars, LazyJSONObject):
+            return json_vars.with_overlay(overlay)
+        return {**json_vars, **overlay}
+    
+    def _load_json_file(self) -> Mapping[str, Any]:
+        """Load configuration from JSON file. Bundled copies are read in place."""
+        return self._with_json_overlay(self._read_json(self._json_source()))
+    
+    def _load_config_file(self, config_name: str, base: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Load a specific config file, with the environment overlay merged over it."""
+        if self._metrics is None:
+            return self._load_layers(config_name, base)
+        
+        stopwatch = Stopwatch()
+        data = self._load_layers(config_name, base)
+        self._metrics.record_file_load(config_name, stopwatch.elapsed())
+        return data
+    
+    def _load_layers(self, config_name: str, base: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Load config/<name>.py (unless its values are passed in as base) and
+        deep-merge config/<env>/<name>.py over it.
+        """
+        data = base
+        if data is None:
+            data = load_config_file(self.config_dir / f"{config_name}.py", config_name, self.loader)
+        if self._overlay_dir is not None:
+            overlay = load_config_file(self._overlay_dir / f"{config_name}.py", config_name, self.loader)
+            if overlay:
+                data = _merged(data, overlay)
+        return data
+    
+    def _namespace(self, state: _ConfigState, config_name: str) -> Dict[str, Any]:
+        """Get a config file's values from state, loading it on first use."""
+        data = state.files.get(config_name)
+        if data is None:
+            data = state.files.setdefault(config_name, self._load_config_file(config_name))
+        return data
+    
+    def _publish(self, files: Dict[str, Dict[str, Any]], json_vars: Mapping[str, Any],
+                 stale: Optional[Callable[[str], bool]] = None,
+                 overrides: Optional[Dict[str, Any]] = None, index: Optional["KeyIndex"] = None) -> None:
+        """
+        Swap in a new state. Resolved entries are carried over unless stale matches
+        them; with no stale predicate nothing is carried over. The set() overrides
+        are carried over unless new ones are given. The key index is rebuilt on
+        first use unless one that matches the new layers is given.
+        """
+        old = self._state
+        resolved = None
+        env_keys = None
+        if stale is not None:
+            resolved = {key: value for key, value in old.resolved.copy().items() if not stale(key)}
+            env_keys = {}
+            for name, keys in old.env_keys.copy().items():
+                kept = {key for key in keys.copy() if key in resolved}
+                if kept:
+                    env_keys[name] = kept
+        # Views are carried over: all() rebuilds the ones whose file was replaced,
+        # reusing their unchanged parts
+        if overrides is None:
+            overrides = old.overrides
+        self._state = _ConfigState(files, json_vars, resolved, old.views.copy(), overrides, env_keys, index)
+        self._version += 1
+    
+    @property
+    def version(self) -> int:
+        """Counter bumped every time the configuration changes."""
+        return self._version
     
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a configuration value using dot notation (e.g., 'app.name' or 'database.host').
-        JSON configuration takes precedence over config files.
-        Environment variables take precedence over everything.
+        JSON configuration takes precedence over config files, environment variables
+        over JSON, and values set with set() over everything.
+        
+        Resolved values are kept in an index keyed by the dotted key, so repeated
+        lookups cost a single dict lookup until set(), reload() or an environment
+        change invalidates them.
+        """
+        state = self._state
+        value = state.resolved.get(key, _MISSING)
+        if value is _MISSING:
+            value = state.resolved[key] = self._resolve(state, key, _NOT_FOUND)
+        if value is _NOT_FOUND:
+            return default
+        return value
+    
+    def _instrumented_get(self, key: str, default: Any = None) -> Any:
+        """get() with metrics, installed over get() by instrument()."""
+        metrics = self._metrics
+        start = perf_counter_ns()
+        state = self._state
+        value = state.resolved.get(key, _MISSING)
+        if value is _MISSING:
+            value = state.resolved[key] = self._resolve(state, key, _NOT_FOUND)
+            metrics.record_miss(key, self._layer_of(state, key, value))
+        metrics.record_get(key, perf_counter_ns() - start)
+        if value is _NOT_FOUND:
+            return default
+        return value
+    
+    def _layer_of(self, state: _ConfigState, key: str, value: Any) -> str:
+        """Name the layer a resolved value came from."""
+        if _override(state.overrides, key) is not _MISSING:
+            return 'set'
+        name = env_key(key)
+        if name in self._environment:
+            return 'env'
+        if name in state.json_vars:
+            return 'json'
+        return 'default' if value is _NOT_FOUND else 'file'
+    
+    def instrument(self, enabled: bool = True) -> Optional["ConfigMetrics"]:
+        """
+        Start (or stop) collecting metrics and return the metrics object.
+        While disabled, get() runs without any instrumentation checks at all.
+        """
+        if not enabled:
+            self._metrics = None
+            self.__dict__.pop('get', None)
+            return None
+        
+        if self._metrics is None:
+            from config_metrics import ConfigMetrics
+            self._metrics = ConfigMetrics()
+        self.get = self._instrumented_get
+        return self._metrics
+    
+    @property
+    def metrics(self) -> Optional["ConfigMetrics"]:
+        """Metrics collected since instrument() was called, or None."""
+        return self._metrics
+    
+    def get_many(self, keys: Iterable[str], defaults: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
         """
+        Get several configuration values at once, keyed by their dotted key.
+        All values come from the same state, so they are consistent with each other.
+        """
+        defaults = defaults or {}
+        state = self._state
+        resolved = state.resolved
+        metrics = self._metrics
+        values = {}
+        for key in keys:
+            value = resolved.get(key, _MISSING)
+            if value is _MISSING:
+                value = resolved[key] = self._resolve(state, key, _NOT_FOUND)
+                if metrics is not None:
+                    metrics.record_miss(key, self._layer_of(state, key, value))
+            if metrics is not None:
+                metrics.record_get(key)
+            values[key] = defaults.get(key) if value is _NOT_FOUND else value
+        return values
+    
+    def snapshot(self, keys: Iterable[str], defaults: Optional[Mapping[str, Any]] = None):
+        """
+        Resolve several keys in one pass and return an immutable snapshot of them.
+        Values are served as attributes, with dots replaced by underscores
+        (e.g. 'app.name' -> snapshot.app_name), and by position. A key that
+        doesn't make a valid attribute name ('db.read-only'), or whose name is
+        already taken ('a.b_c' after 'a_b.c'), is served as _<position>
+        (snapshot._1) instead.
+        """
+        keys = tuple(keys)
+        values = self.get_many(keys, defaults)
+        return _snapshot_class(keys)._make(values[key] for key in keys)
+    
+    def _resolve(self, state: _ConfigState, key: str, default: Any = None) -> Any:
+        """
+        Resolve a key through the set(), environment, JSON and config file layers.
+        Keys in the schema are coerced to their declared type; environment
+        variables are parsed from their raw strings for them. Values that don't
+        match the schema are served as configured; validate() reports them.
+        """
+        schema = self.schema
+        if schema is None or key not in schema:
+            return self._resolve_layers(state, key, default)
+        
+        value = self._resolve_layers(state, key, _NOT_FOUND, raw_env=True)
+        if value is _NOT_FOUND:
+            return default
+        try:
+            return schema.coerce(key, value)
+        except ValueError:
+            return self._resolve_layers(state, key, default)
+    
+    def _resolve_layers(self, state: _ConfigState, key: str, default: Any = None,
+                        raw_env: bool = False) -> Any:
+        """Look a key up in the set(), environment, JSON and config file layers, in that order."""
+        if state.overrides:
+            value = _override(state.overrides, key)
+            if value is not _MISSING:
+                return value
+        
+        # An environment passed in explicitly is the one whose overlays are loaded
+        if key == ENV_KEY and self._env is not None:
+            return self.env_name
+        
         # Check for environment variable override first (highest priority)
-        env_key = key.upper().replace('.', '_')
-        if env_key in os.environ:
-            value = os.environ[env_key]
-            # Convert string boolean values
-            if value.lower() in ('true', 'false'):
-                return value.lower() == 'true'
+        name = env_key(key)
+        keys = state.env_keys.get(name)
+        if keys is None:
+            keys = state.env_keys.setdefault(name, set())
+        keys.add(key)
+        if raw_env:
+            value = self._environment.raw(name, _MISSING)
+        else:
+            value = self._environment.get(name, _MISSING)
+        if value is not _MISSING:
             return value
         
         # Check for JSON config override (second priority)
-        if env_key in self._json_vars:
-            return self._json_vars[env_key]
+        if name in state.json_vars:
+            return state.json_vars[name]
             
         # Parse the key to get config file and setting (lowest priority)
         if '.' not in key:
@@ -113,14 +600,8 @@ class ConfigManager:
             
         config_name, setting_path = key.split('.', 1)
         
-        # Load config file if not cached
-        if config_name not in self._config_cache:
-            self._config_cache[config_name] = self._load_config_file(config_name)
-            
-        config_data = self._config_cache[config_name]
-        
         # Navigate through nested settings using dot notation
-        current = config_data
+        current = self._namespace(state, config_name)
         for part in setting_path.split('.'):
             if isinstance(current, dict) and part in current:
                 current = current[part]
@@ -129,79 +610,460 @@ class ConfigManager:
                 
         return current
     
+    def _keys_for_env(self, state: _ConfigState, names: Set[str]) -> Set[str]:
+        """
+        Map environment-style names (e.g. 'APP_LOGGING_LEVEL') to the resolved keys
+        they override. Keys nobody has resolved serve no value that could go stale.
+        """
+        keys: Set[str] = set()
+        env_keys = state.env_keys
+        for name in names:
+            resolved = env_keys.get(name)
+            if resolved:
+                keys.update(resolved.copy())
+        return keys
+    
+    def subscribe(self, callback: Callable[[Set[str]], None]) -> None:
+        """
+        Register a callback that receives the set of keys changed by set(), reload(),
+        incremental reloads and environment changes.
+        """
+        self._subscribers.append(callback)
+    
+    def unsubscribe(self, callback: Callable[[Set[str]], None]) -> None:
+        """Remove a callback registered with subscribe()."""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+    
+    def _notify(self, changed: Set[str]) -> None:
+        """Tell subscribers which keys changed."""
+        if changed:
+            for callback in list(self._subscribers):
+                callback(changed)
+    
+    def _loaded_keys(self, state: _ConfigState, config_name: Optional[str] = None) -> Set[str]:
+        """Get the keys a reload may change: every loaded file key and every resolved key."""
+        keys = set(state.resolved.copy())
+        for name, data in state.files.copy().items():
+            if config_name is None or name == config_name:
+                keys.update(_flatten(name, data, {}))
+        if config_name is not None:
+            keys = {key for key in keys if key.startswith(config_name + '.')}
+        return keys
+    
+    def reload_changed(self, config_names: Iterable[str] = (), json_changed: bool = False) -> Set[str]:
+        """
+        Reload only the given config files (and the JSON file if json_changed),
+        invalidate only the resolved keys whose values changed and notify subscribers.
+        """
+        self._check_writable()
+        changed: Set[str] = set()
+        stopwatch = Stopwatch()
+        
+        with self._write_lock:
+            state = self._state
+            files = state.files.copy()
+            json_vars = state.json_vars
+            
+            for config_name in config_names:
+                old = files.get(config_name)
+                if old is None:
+                    # Never loaded, so nothing was resolved from it
+                    continue
+                # Runtime set() values survive a hot reload
+                new = files[config_name] = self._with_overrides(
+                    state.overrides, config_name, self._load_config_file(config_name))
+                changed |= _changed_keys(_flatten(config_name, old, {}), _flatten(config_name, new, {}))
+            
+            json_names: Set[str] = set()
+            if json_changed:
+                from config_json import changed_names
+                new_json = self._load_json_file()
+                json_names = changed_names(state.json_vars, new_json)
+                if json_names:
+                    # Published even if no loaded key maps to the names, so keys
+                    # that are new or not read yet see the new values
+                    json_vars = new_json
+                    changed |= self._keys_for_env(state, json_names)
+            
+            if changed or json_names:
+                stale = _nested_under(changed)
+                if json_names:
+                    stale = lambda key, nested=stale: nested(key) or env_key(key) in json_names
+                self._publish(files, json_vars, stale)
+        
+        if self._metrics is not None:
+            self._metrics.record_reload(stopwatch.elapsed())
+        self._notify(changed)
+        return changed
+    
+    def watch(self, interval: float = 1.0):
+        """Start a background thread that reloads config files as they change."""
+        from config_watcher import ConfigWatcher
+        
+        self._check_writable()
+        if self._watcher is None:
+            self._watcher = ConfigWatcher(self, interval)
+            self._watcher.start()
+        return self._watcher
+    
+    def stop_watching(self) -> None:
+        """Stop the background reload thread started by watch()."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+    
+    def _on_env_change(self, names: Set[str]) -> None:
+        """Invalidate resolved entries backed by the changed environment variables."""
+        if self._frozen:
+            return
+        with self._write_lock:
+            state = self._state
+            changed = self._keys_for_env(state, names)
+            index = state.index
+            if not changed and (index is None or not any(index.key_for(name) for name in names)):
+                # Nothing read or indexed depends on them (e.g. PATH): keep the
+                # state, so the version and the key index stay as they are
+                return
+            if index is not None:
+                if all(name in self._environment for name in names):
+                    keys = (index.key_for(name) for name in names)
+                    index = index.with_keys(key for key in keys if key is not None)
+                else:
+                    # A removed variable may have been the only source of its key
+                    index = None
+            self._publish(state.files, state.json_vars, lambda key: env_key(key) in names, index=index)
+        self._notify(changed)
+    
+    def refresh_env(self) -> None:
+        """
+        Re-read the process environment.
+        Writes through os.environ are picked up automatically; this catches the rest.
+        """
+        self._check_writable()
+        self._environment.refresh()
+    
+    @staticmethod
+    def _with_overrides(overrides: Mapping[str, Any], config_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply the set() overrides for a config file to freshly loaded values."""
+        prefix = config_name + '.'
+        for key, value in overrides.items():
+            if key.startswith(prefix):
+                data = _with_value(data, key[len(prefix):].split('.'), value)
+        return data
+    
     def set(self, key: str, value: Any) -> None:
-        """Set a configuration value in the cache (runtime only)."""
+        """
+        Set a configuration value at runtime (not persisted). It takes precedence
+        over every other layer until the config file is reloaded with reload().
+        """
+        self._check_writable()
         if '.' not in key:
             return
             
         config_name, setting_path = key.split('.', 1)
         
-        # Ensure config is loaded
-        if config_name not in self._config_cache:
-            self._config_cache[config_name] = self._load_config_file(config_name)
-            
-        # Navigate and set the value
-        current = self._config_cache[config_name]
-        parts = setting_path.split('.')
-        
-        for part in parts[:-1]:
-            if part not in current or not isinstance(current[part], dict):
-                current[part] = {}
-            current = current[part]
-            
-        current[parts[-1]] = value
+        with self._write_lock:
+            state = self._state
+            files = state.files.copy()
+            data = self._namespace(state, config_name)
+            files[config_name] = _with_value(data, setting_path.split('.'), value)
+            self._publish(files, state.json_vars, _related_to(key),
+                          _with_override(state.overrides, key, value),
+                          self._index_with(state.index, key, _file_value(data, setting_path), value))
+        self._notify({key})
     
     def reload(self, config_name: Optional[str] = None) -> None:
-        """Reload configuration files. If config_name is None, reload all."""
-        if config_name:
-            if config_name in self._config_cache:
-                del self._config_cache[config_name]
-        else:
-            self._config_cache.clear()
-            # Clean up old extracted JSON and reload
-            self._cleanup_extracted_json()
-            self._load_json_file()
+        """
+        Reload configuration files, dropping their set() values. If config_name is
+        None, reload all (and pick the active environment again).
+        """
+        self._check_writable()
+        stopwatch = Stopwatch()
+        with self._write_lock:
+            state = self._state
+            changed = self._loaded_keys(state, config_name)
+            if config_name:
+                files = state.files.copy()
+                files.pop(config_name, None)
+                prefix = config_name + '.'
+                overrides = {key: value for key, value in state.overrides.items() if not key.startswith(prefix)}
+                self._publish(files, state.json_vars, _related_to(config_name), overrides)
+            else:
+                self._state = self._initial_state()
+                self._version += 1
+        if self._metrics is not None:
+            self._metrics.record_reload(stopwatch.elapsed())
+        self._notify(changed)
+    
+    def export(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Load every config file and resolve all of their keys (nested ones included).
+        Returns the resolved values keyed by dotted key, plus the JSON values keyed
+        by environment-style name for keys that no config file defines.
+        """
+        state = self._state
+        keys: Dict[str, Any] = {}
+        for config_name in self._config_names():
+            _flatten(config_name, self._namespace(state, config_name), keys)
+        for config_name, data in state.files.copy().items():
+            _flatten(config_name, data, keys)
+        return self.get_many(keys), dict(state.json_vars)
+    
+    def all(self, config_name: str) -> Mapping[str, Any]:
+        """
+        Get all configuration values for a specific config file, including runtime
+        set() values, as a read-only view (nested dicts are read-only views and
+        lists are tuples). The view is built once per configuration change and
+        shared between callers.
+        """
+        state = self._state
+        entry = state.views.get(config_name)
+        if entry is not None and entry[0] is state.files.get(config_name):
+            return entry[1]
+        
+        data = self._namespace(state, config_name)
+        previous, previous_view = entry if entry is not None else (None, None)
+        view = _freeze(data, previous, previous_view)
+        state.views[config_name] = (data, view)
+        return view
+    
+    def view(self, prefix: str) -> Mapping[str, Any]:
+        """
+        Get a read-only view of the settings under a dotted prefix
+        (e.g. 'app.logging'). Raises KeyError if prefix is not a mapping.
+        """
+        config_name, _, path = prefix.partition('.')
+        current = self.all(config_name)
+        if path:
+            for part in path.split('.'):
+                if not isinstance(current, Mapping) or part not in current:
+                    raise KeyError(prefix)
+                current = current[part]
+            if not isinstance(current, Mapping):
+                raise KeyError(prefix)
+        return current
+    
+    def validate(self) -> Dict[str, Any]:
+        """
+        Check every key in the schema in a single pass and return the coerced values.
+        Raises ConfigValidationError listing all problems at once.
+        """
+        if self.schema is None:
+            return {}
+        state = self._state
+        values = self.schema.validate(
+            lambda key: self._resolve_layers(state, key, _NOT_FOUND, raw_env=True), _NOT_FOUND)
+        # Warm the resolved index with the coerced values
+        state.resolved.update(values)
+        return values
     
-    def all(self, config_name: str) -> Dict[str, Any]:
-        """Get all configuration values for a specific config file."""
-        if config_name not in self._config_cache:
-            self._config_cache[config_name] = self._load_config_file(config_name)
-        return self._config_cache[config_name].copy()
+    def _key_index(self, state: _ConfigState) -> "KeyIndex":
+        """Get the key index of state, loading every config file and building it on first use."""
+        index = state.index
+        if index is None:
+            from config_index import build_index
+            
+            for config_name in self._config_names():
+                self._namespace(state, config_name)
+            index = state.index = build_index(
+                state.files.copy(), list(state.json_vars), self._environment.names())
+        return index
+    
+    def _index_with(self, index: Optional["KeyIndex"], key: str, old: Any, value: Any) -> Optional["KeyIndex"]:
+        """Carry index over a set() of key from old to value, or drop it if keys go away."""
+        if index is None or isinstance(old, dict):
+            return None
+        if isinstance(value, dict):
+            return index.with_keys([key, *_flatten(key, value, {})])
+        return index.with_keys([key])
     
     def has(self, key: str) -> bool:
-        """Check if a configuration key exists."""
-        sentinel = object()
-        try:
-            result = self.get(key, sentinel)
-            return result is not sentinel
-        except:
+        """
+        Check if a configuration key exists, in time proportional to the key's length.
+        Any environment variable or JSON value the key maps to counts as well; of
+        the config files only the key's own file is loaded.
+        """
+        state = self._state
+        name = env_key(key)
+        if name in self._environment or name in state.json_vars:
+            return True
+        if '.' not in key:
             return False
+        config_name, setting_path = key.split('.', 1)
+        return _file_value(self._namespace(state, config_name), setting_path) is not _MISSING
+    
+    def keys(self, prefix: str = "") -> Iterator[str]:
+        """
+        Stream the dotted keys under prefix (e.g. 'app.logging') from every layer:
+        config files, JSON values and environment variables under a known key.
+        """
+        return self._key_index(self._state).keys(prefix)
+    
+    def items(self, prefix: str = "") -> Iterator[Tuple[str, Any]]:
+        """Stream (key, value) pairs under prefix, resolving each value as it is reached."""
+        state = self._state
+        resolved = state.resolved
+        for key in self._key_index(state).keys(prefix):
+            value = resolved.get(key, _MISSING)
+            if value is _MISSING:
+                value = resolved[key] = self._resolve(state, key, _NOT_FOUND)
+            yield key, (None if value is _NOT_FOUND else value)
+    
+    @property
+    def frozen(self) -> bool:
+        """Whether freeze() has been called."""
+        return self._frozen
+    
+    def _check_writable(self) -> None:
+        if self._frozen:
+            raise RuntimeError("Configuration is frozen and cannot be changed")
+    
+    def _resolve_frozen(self, state: _ConfigState, prefix: str, data: Mapping[str, Any],
+                        view: Mapping[str, Any], into: Dict[str, Any]) -> None:
+        """
+        Resolve every key under prefix into into. Values that come straight from
+        the config file reuse the objects of its frozen view; others (environment,
+        JSON, set()) are frozen on their own.
+        """
+        for name, raw in data.items():
+            key = f"{prefix}.{name}"
+            value = self._resolve(state, key, _NOT_FOUND)
+            into[key] = view[name] if value is raw else _freeze(value)
+            if isinstance(raw, dict):
+                self._resolve_frozen(state, key, raw, view[name], into)
+    
+    def freeze(self) -> None:
+        """
+        Prepare the configuration to be shared with forked worker processes.
+        Every config file is loaded and every key resolved up front, values are
+        converted to read-only structures (dicts become read-only views shared
+        with all(), lists become tuples), and everything is moved to the garbage
+        collector's permanent generation with gc.freeze(), so children's
+        collections do not write to the pages they share with the parent.
+        
+        Afterwards set(), reload(), watch() and refresh_env() raise RuntimeError,
+        and environment changes are no longer picked up.
+        """
+        import gc
+        
+        # The watcher may be waiting for the write lock to reload a change, so it is
+        # stopped (and joined) before the lock is taken
+        self.stop_watching()
+        with self._write_lock:
+            if self._frozen:
+                return
+            state = self._state
+            index = self._key_index(state)
+            
+            resolved: Dict[str, Any] = {}
+            for config_name, data in state.files.copy().items():
+                self._resolve_frozen(state, config_name, data, self.all(config_name), resolved)
+            for key in index.keys():
+                if key not in resolved:
+                    resolved[key] = _freeze(self._resolve(state, key, _NOT_FOUND))
+            
+            frozen = _ConfigState(state.files, dict(state.json_vars), resolved, state.views, state.overrides)
+            frozen.index = index
+            # The values are equal to the ones already served, so the version stays
+            # and caches built on it (e.g. rendered display sections) stay valid
+            self._state = frozen
+            self._frozen = True
+        
+        gc.collect()
+        gc.freeze()
+
 
+# Global config manager instance, built on first use (set CONFIG_CACHE_FILE to enable the disk cache)
+_config_manager: Optional[ConfigManager] = None
+_config_manager_lock = threading.Lock()
 
-# Global config manager instance
-_config_manager = ConfigManager()
+
+def get_manager() -> ConfigManager:
+    """Get the global config manager, building it on first use."""
+    global _config_manager
+    if _config_manager is None:
+        with _config_manager_lock:
+            if _config_manager is None:
+                _config_manager = ConfigManager(cache_file=os.environ.get('CONFIG_CACHE_FILE'))
+    return _config_manager
 
 
 def config(key: str, default: Any = None) -> Any:
     """Get a configuration value."""
-    return _config_manager.get(key, default)
+    return (_config_manager or get_manager()).get(key, default)
 
 
 def config_set(key: str, value: Any) -> None:
     """Set a configuration value."""
-    _config_manager.set(key, value)
+    get_manager().set(key, value)
+
+
+def config_many(keys: Iterable[str], defaults: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+    """Get several configuration values at once."""
+    return get_manager().get_many(keys, defaults)
+
+
+def config_snapshot(keys: Iterable[str], defaults: Optional[Mapping[str, Any]] = None):
+    """Get an immutable snapshot of several configuration values."""
+    return get_manager().snapshot(keys, defaults)
 
 
 def config_reload(config_name: Optional[str] = None) -> None:
     """Reload configuration."""
-    _config_manager.reload(config_name)
+    get_manager().reload(config_name)
 
 
-def config_all(config_name: str) -> Dict[str, Any]:
+def config_all(config_name: str) -> Mapping[str, Any]:
     """Get all configuration for a config file."""
-    return _config_manager.all(config_name)
+    return get_manager().all(config_name)
+
+
+def config_view(prefix: str) -> Mapping[str, Any]:
+    """Get a read-only view of the configuration under a dotted prefix."""
+    return get_manager().view(prefix)
 
 
 def config_has(key: str) -> bool:
     """Check if a configuration key exists."""
-    return _config_manager.has(key)
\ No newline at end of file
+    return get_manager().has(key)
+
+
+def config_version() -> int:
+    """Get the global configuration's change counter."""
+    return (_config_manager or get_manager()).version
+
+
+def config_validate() -> Dict[str, Any]:
+    """Validate the configuration against its schema."""
+    return get_manager().validate()
+
+
+def config_keys(prefix: str = "") -> Iterator[str]:
+    """Stream the configuration keys under a prefix."""
+    return get_manager().keys(prefix)
+
+
+def config_items(prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """Stream the configuration keys and values under a prefix."""
+    return get_manager().items(prefix)
+
+
+def config_refresh_env() -> None:
+    """Pick up environment variable changes made at runtime."""
+    get_manager().refresh_env()
+
+
+def config_freeze() -> None:
+    """Freeze the global configuration before forking worker processes."""
+    get_manager().freeze()
+
+
+def config_watch(interval: float = 1.0):
+    """Start hot-reloading the configuration files as they change."""
+    return get_manager().watch(interval)
+
+
+def config_stop_watching() -> None:
+    """Stop hot-reloading the configuration files."""
+    get_manager().stop_watching()
\ No newline at end of file
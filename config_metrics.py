@@ -0,0 +1,113 @@
+"""
+Instrumentation for ConfigManager: per-key counters, the layer that answered each
+key, lookup latency histograms, file-load and reload timings.
+"""
+
+import json
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Layers a key can be resolved from, in precedence order
+LAYERS = ('set', 'env', 'json', 'file', 'default')
+
+
+class Histogram:
+    """Power-of-two bucketed histogram of nanosecond durations."""
+
+    def __init__(self):
+        self.buckets: Counter = Counter()
+        self.count = 0
+        self.total = 0
+
+    def record(self, value: int) -> None:
+        self.buckets[value.bit_length()] += 1
+        self.count += 1
+        self.total += value
+
+    def report(self) -> Dict[str, Any]:
+        """Bucket counts keyed by their upper bound ("<=1024" holds values up to 1024 ns)."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "buckets": {f"<={(1 << bits) - 1}": self.buckets[bits] for bits in sorted(self.buckets)},
+        }
+
+
+class Timings:
+    """Count, total and maximum of a set of durations in seconds."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def report(self) -> Dict[str, Any]:
+        return {"count": self.count, "total_ms": self.total * 1000, "max_ms": self.max * 1000}
+
+
+class ConfigMetrics:
+    """
+    Metrics collected by an instrumented ConfigManager.
+    Updates are not locked, so counts from many threads at once are approximate.
+    """
+
+    def __init__(self):
+        self.gets: Counter = Counter()
+        self.misses: Counter = Counter()
+        self.layers: Dict[str, str] = {}
+        self.layer_counts: Counter = Counter()
+        self.latency = Histogram()
+        self.file_loads: Dict[str, Timings] = {}
+        self.reloads = Timings()
+
+    def record_get(self, key: str, elapsed_ns: Optional[int] = None) -> None:
+        """Count a lookup; bulk lookups are counted without a latency sample."""
+        self.gets[key] += 1
+        if elapsed_ns is not None:
+            self.latency.record(elapsed_ns)
+
+    def record_miss(self, key: str, layer: str) -> None:
+        self.misses[key] += 1
+        self.layers[key] = layer
+        self.layer_counts[layer] += 1
+
+    def record_file_load(self, config_name: str, seconds: float) -> None:
+        timings = self.file_loads.get(config_name)
+        if timings is None:
+            timings = self.file_loads[config_name] = Timings()
+        timings.record(seconds)
+
+    def record_reload(self, seconds: float) -> None:
+        self.reloads.record(seconds)
+
+    def hot_keys(self, count: int = 10) -> List[Tuple[str, int]]:
+        """The most requested keys with their lookup counts."""
+        return self.gets.most_common(count)
+
+    def report(self) -> Dict[str, Any]:
+        """Export everything as plain, JSON-serialisable data."""
+        total_gets = sum(self.gets.values())
+        total_misses = sum(self.misses.values())
+        return {
+            "gets": total_gets,
+            "misses": total_misses,
+            "hit_ratio": (total_gets - total_misses) / total_gets if total_gets else 0.0,
+            "layers": {layer: self.layer_counts[layer] for layer in LAYERS},
+            "keys": {
+                key: {"gets": count, "misses": self.misses[key], "layer": self.layers.get(key)}
+                for key, count in self.gets.items()
+            },
+            "hot_keys": self.hot_keys(),
+            "get_latency_ns": self.latency.report(),
+            "file_loads": {name: timings.report() for name, timings in self.file_loads.items()},
+            "reloads": self.reloads.report(),
+        }
+
+    def to_json(self, indent: int = 2) -> str:
+        return json.dumps(self.report(), indent=indent)
@@ -0,0 +1,184 @@
+"""
+Optional typed schema for configuration values.
+The schema lives in config/schema.json and maps dotted keys to a type and
+optional constraints:
+
+    {
+        "app.response_number": {"type": "int", "min": 0},
+        "app.logging.level": {"type": "str", "choices": ["DEBUG", "INFO", "WARNING"], "ignore_case": true},
+        "app.debug": {"type": "bool", "required": true}
+    }
+
+With "ignore_case", string choices match in any case ("info" passes the check
+above) and the value is served as configured.
+
+It is compiled once into a coercer and a validator per key. Strings (e.g. from
+environment variables) are parsed into the declared type; values of the wrong
+type raise ConfigValidationError from coerce() and validate().
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+
+class ConfigValidationError(ValueError):
+    """Raised when configuration values do not match the schema."""
+
+    def __init__(self, errors: Iterable[str]):
+        self.errors = list(errors)
+        super().__init__("; ".join(self.errors))
+
+
+_TRUE = frozenset(('true', '1', 'yes', 'on'))
+_FALSE = frozenset(('false', '0', 'no', 'off'))
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    raise ValueError(f"expected a boolean, got {value!r}")
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return int(value.strip())
+    raise ValueError(f"expected an integer, got {value!r}")
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        return float(value.strip())
+    raise ValueError(f"expected a number, got {value!r}")
+
+
+def _to_str(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (bool, int, float)):
+        return str(value)
+    raise ValueError(f"expected a string, got {value!r}")
+
+
+def _parsed(kind: type, name: str) -> Callable[[Any], Any]:
+    """Coercer for containers: accept the container itself or a JSON string of one."""
+    def coerce(value: Any) -> Any:
+        if isinstance(value, str):
+            import json
+            value = json.loads(value)
+        if not isinstance(value, kind):
+            raise ValueError(f"expected a {name}, got {value!r}")
+        return value
+    return coerce
+
+
+_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    'str': _to_str,
+    'int': _to_int,
+    'float': _to_float,
+    'bool': _to_bool,
+    'list': _parsed(list, 'list'),
+    'dict': _parsed(dict, 'mapping'),
+    'any': lambda value: value,
+}
+
+
+class SchemaField:
+    """A compiled schema entry: a coercer plus the constraint checks for one key."""
+
+    __slots__ = ('key', 'type', 'required', '_coerce', '_checks')
+
+    def __init__(self, key: str, spec: Mapping[str, Any]):
+        self.key = key
+        self.type = spec.get('type', 'any')
+        if self.type not in _COERCERS:
+            raise ValueError(f"Unknown type {self.type!r} for config key {key!r} in schema")
+        self.required = bool(spec.get('required', False))
+        self._coerce = _COERCERS[self.type]
+
+        checks: List[Callable[[Any], Optional[str]]] = []
+        if 'choices' in spec:
+            choices = tuple(spec['choices'])
+            if spec.get('ignore_case'):
+                folded = {choice.casefold() for choice in choices}
+                checks.append(lambda value: None if str(value).casefold() in folded
+                              else f"must be one of {list(choices)} (in any case)")
+            else:
+                checks.append(lambda value: None if value in choices else f"must be one of {list(choices)}")
+        if 'min' in spec:
+            low = spec['min']
+            checks.append(lambda value: None if value >= low else f"must be at least {low}")
+        if 'max' in spec:
+            high = spec['max']
+            checks.append(lambda value: None if value <= high else f"must be at most {high}")
+        self._checks = tuple(checks)
+
+    def coerce(self, value: Any) -> Any:
+        """Convert value to the declared type and check its constraints."""
+        try:
+            value = self._coerce(value)
+        except ValueError as e:
+            raise ConfigValidationError([f"{self.key}: {e}"]) from None
+        for check in self._checks:
+            problem = check(value)
+            if problem is not None:
+                raise ConfigValidationError([f"{self.key}: {value!r} {problem}"])
+        return value
+
+
+class ConfigSchema:
+    """Compiled schema: one SchemaField per dotted key."""
+
+    def __init__(self, spec: Mapping[str, Mapping[str, Any]]):
+        self.fields: Dict[str, SchemaField] = {key: SchemaField(key, field) for key, field in spec.items()}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.fields
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def coerce(self, key: str, value: Any) -> Any:
+        """Coerce and check a value for key (keys without a schema entry pass through)."""
+        field = self.fields.get(key)
+        return value if field is None else field.coerce(value)
+
+    def validate(self, resolve: Callable[[str], Any], missing: Any) -> Dict[str, Any]:
+        """
+        Check every key in one pass. resolve(key) returns the raw value or missing.
+        Returns the coerced values, or raises ConfigValidationError listing every problem.
+        """
+        values: Dict[str, Any] = {}
+        errors: List[str] = []
+        for key, field in self.fields.items():
+            value = resolve(key)
+            if value is missing:
+                if field.required:
+                    errors.append(f"{key}: is required")
+                continue
+            try:
+                values[key] = field.coerce(value)
+            except ConfigValidationError as e:
+                errors.extend(e.errors)
+        if errors:
+            raise ConfigValidationError(errors)
+        return values
+
+
+def load_schema(path: Path) -> Optional[ConfigSchema]:
+    """Load and compile a schema file, or return None if there is none."""
+    if not path.exists():
+        return None
+    from config_loader import load_json_file
+    return ConfigSchema(load_json_file(path))
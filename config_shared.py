@@ -0,0 +1,237 @@
+"""
+Shared-memory config snapshots for multiprocessing worker pools.
+The parent resolves its configuration once and publishes it to shared memory;
+workers attach and decode only the values they read.
+
+Segment layout:
+    control segment <name>:   magic (8s) | generation (Q)
+    data segment <name>-<gen>: magic (4s) | count (I) | keys length (I) | fallback count (I)
+                               | marshalled key tuple | (offset, length) pairs (2I each)
+                               | marshalled values
+The key tuple lists the resolved dotted keys first, then the JSON values that
+no config file defines under their environment-style names.
+"""
+
+import marshal
+import os
+import struct
+import threading
+import uuid
+from multiprocessing import resource_tracker, shared_memory
+from types import MappingProxyType
+from typing import Any, Dict, Optional
+
+from config_env import env_key, environment
+
+
+_CONTROL = struct.Struct('<8sQ')
+_CONTROL_MAGIC = b'CFGCTRL1'
+_HEADER = struct.Struct('<4sIII')
+_DATA_MAGIC = b'CFG1'
+_ENTRY = struct.Struct('<II')
+_MISSING = object()
+
+# Times a reader re-reads the generation when its segment is unlinked before it attaches
+_ATTACH_ATTEMPTS = 5
+
+# Segments created by publishers in this process
+_owned = set()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without handing it to this process's resource tracker."""
+    segment = shared_memory.SharedMemory(name=name)
+    if os.name == 'posix' and name not in _owned:
+        # Attaching registers the segment for cleanup at exit, which would unlink
+        # it under the publisher's feet
+        resource_tracker.unregister(segment._name, 'shared_memory')
+    return segment
+
+
+def _encode_table(table: Dict[str, Any], keys: list, blobs: list) -> None:
+    """Marshal the values of table, skipping values marshal cannot handle."""
+    for key, value in table.items():
+        try:
+            blobs.append(marshal.dumps(value))
+        except ValueError:
+            print(f"Warning: Config value {key!r} cannot be shared, skipping it")
+            continue
+        keys.append(key)
+
+
+def _thaw(value: Any) -> Any:
+    """Turn the read-only views and tuples of a frozen configuration back into dicts and lists."""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {name: _thaw(item) for name, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def encode_snapshot(values: Dict[str, Any], fallbacks: Dict[str, Any]) -> bytes:
+    """Serialise resolved values and JSON fallbacks into the data segment layout."""
+    keys: list = []
+    blobs: list = []
+    _encode_table(values, keys, blobs)
+    value_count = len(keys)
+    _encode_table(fallbacks, keys, blobs)
+
+    key_blob = marshal.dumps(tuple(keys))
+    offset = _HEADER.size + len(key_blob) + _ENTRY.size * len(keys)
+    entries = bytearray()
+    for blob in blobs:
+        entries += _ENTRY.pack(offset, len(blob))
+        offset += len(blob)
+
+    header = _HEADER.pack(_DATA_MAGIC, value_count, len(key_blob), len(keys) - value_count)
+    return b''.join([header, key_blob, bytes(entries), *blobs])
+
+
+class SharedConfigPublisher:
+    """
+    Publishes a ConfigManager's resolved configuration to shared memory.
+    Every change in the parent (set, reload, hot reload, environment change)
+    publishes a new generation.
+    """
+
+    def __init__(self, manager, name: Optional[str] = None, auto_publish: bool = True):
+        self.manager = manager
+        self.name = name or f"cfg-{uuid.uuid4().hex[:12]}"
+        self.generation = 0
+        # Subscribers are notified outside the manager's write lock, so changes
+        # from several threads can publish at once
+        self._lock = threading.Lock()
+        self._control = shared_memory.SharedMemory(name=self.name, create=True, size=_CONTROL.size)
+        _owned.add(self.name)
+        self._segment: Optional[shared_memory.SharedMemory] = None
+        self.publish()
+        if auto_publish:
+            manager.subscribe(self._on_change)
+
+    def _on_change(self, changed) -> None:
+        self.publish()
+
+    def publish(self) -> int:
+        """Publish the manager's current configuration as a new generation."""
+        with self._lock:
+            return self._publish()
+
+    def _publish(self) -> int:
+        values, fallbacks = self.manager.export()
+        if self.manager.frozen:
+            # marshal cannot encode the read-only views freeze() serves
+            values = {key: _thaw(value) for key, value in values.items()}
+        payload = encode_snapshot(values, fallbacks)
+        generation = self.generation + 1
+        segment = shared_memory.SharedMemory(
+            name=f"{self.name}-{generation}", create=True, size=max(len(payload), 1)
+        )
+        segment.buf[:len(payload)] = payload
+        _owned.add(segment.name)
+
+        _CONTROL.pack_into(self._control.buf, 0, _CONTROL_MAGIC, generation)
+        previous, self._segment, self.generation = self._segment, segment, generation
+
+        # Attached workers keep their mapping, new attaches go to the new generation
+        if previous is not None:
+            previous.close()
+            previous.unlink()
+            _owned.discard(previous.name)
+        return generation
+
+    def close(self) -> None:
+        """Stop publishing and remove the shared segments."""
+        self.manager.unsubscribe(self._on_change)
+        for segment in (self._segment, self._control):
+            if segment is not None:
+                segment.close()
+                segment.unlink()
+                _owned.discard(segment.name)
+        self._segment = None
+
+
+class SharedConfigReader:
+    """
+    Reads a configuration published by SharedConfigPublisher.
+    Only the key table is decoded on attach; values are decoded on first access.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._control = _attach(name)
+        self.generation = 0
+        self._segment: Optional[shared_memory.SharedMemory] = None
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """Attach to the newest generation if the publisher moved on."""
+        for attempt in range(_ATTACH_ATTEMPTS):
+            magic, generation = _CONTROL.unpack_from(self._control.buf, 0)
+            if magic != _CONTROL_MAGIC:
+                raise ValueError(f"Shared memory segment {self.name!r} holds no config snapshot")
+            if generation == self.generation:
+                return
+            try:
+                segment = _attach(f"{self.name}-{generation}")
+                break
+            except FileNotFoundError:
+                # The publisher published again and unlinked this generation
+                # between the two reads; follow the control segment again
+                if attempt == _ATTACH_ATTEMPTS - 1:
+                    raise
+
+        buf = segment.buf
+        magic, value_count, keys_length, _ = _HEADER.unpack_from(buf, 0)
+        if magic != _DATA_MAGIC:
+            segment.close()
+            raise ValueError(f"Shared memory segment {self.name}-{generation} holds no config snapshot")
+
+        keys = marshal.loads(buf[_HEADER.size:_HEADER.size + keys_length])
+        entries = range(_HEADER.size + keys_length, _HEADER.size + keys_length + _ENTRY.size * len(keys), _ENTRY.size)
+        self._index: Dict[str, int] = dict(zip(keys[:value_count], entries[:value_count]))
+        self._fallback_index: Dict[str, int] = dict(zip(keys[value_count:], entries[value_count:]))
+        self._values: Dict[str, Any] = {}
+
+        if self._segment is not None:
+            self._segment.close()
+        self._segment, self.generation = segment, generation
+
+    def _decode(self, entry: int) -> Any:
+        offset, length = _ENTRY.unpack_from(self._segment.buf, entry)
+        return marshal.loads(self._segment.buf[offset:offset + length])
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a value with the same precedence as ConfigManager.get: resolved config
+        keys first, then this process's environment, then JSON-only values.
+        """
+        self._refresh()
+        value = self._values.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        entry = self._index.get(key)
+        if entry is not None:
+            value = self._values[key] = self._decode(entry)
+            return value
+
+        name = env_key(key)
+        value = environment.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+        entry = self._fallback_index.get(name)
+        if entry is not None:
+            return self._decode(entry)
+        return default
+
+    def keys(self):
+        """List the resolved dotted keys in the current generation."""
+        self._refresh()
+        return list(self._index)
+
+    def close(self) -> None:
+        """Detach from shared memory."""
+        for segment in (self._segment, self._control):
+            if segment is not None:
+                segment.close()
+        self._segment = None
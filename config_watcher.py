@@ -0,0 +1,82 @@
+"""
+Background watcher that hot-reloads changed config files.
+Polls the modification times of config/*.py and the JSON config file (and their
+environment overlays) and reloads only the files that changed.
+"""
+
+import threading
+from typing import Dict, Optional, Set, Tuple
+
+
+class ConfigWatcher:
+    """Polls a ConfigManager's source files and reloads the ones that change."""
+
+    def __init__(self, manager, interval: float = 1.0):
+        self.manager = manager
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._config_stats, self._json_stat = self._scan()
+
+    def _scan(self) -> Tuple[Dict[str, tuple], tuple]:
+        """Stat every watched file: each config file with its overlay, and the JSON file with its overlay."""
+        manager = self.manager
+        config_dir = manager.config_dir
+        overlay_dir = manager._overlay_dir
+        config_stats = {}
+        for name in manager._config_names():
+            config_stats[name] = (
+                _stat(config_dir / f"{name}.py"),
+                _stat(overlay_dir / f"{name}.py") if overlay_dir is not None else None,
+            )
+        json_overlay = manager._json_overlay_source()
+        json_stat = (
+            _stat(manager._json_source()),
+            _stat(json_overlay) if json_overlay is not None else None,
+        )
+        return config_stats, json_stat
+
+    def poll(self) -> Set[str]:
+        """Check the watched files once, reload what changed and return the changed keys."""
+        config_stats, json_stat = self._scan()
+        changed_names = {
+            name for name in self._config_stats.keys() | config_stats.keys()
+            if self._config_stats.get(name) != config_stats.get(name)
+        }
+        json_changed = json_stat != self._json_stat
+        self._config_stats, self._json_stat = config_stats, json_stat
+
+        if not changed_names and not json_changed:
+            return set()
+        return self.manager.reload_changed(sorted(changed_names), json_changed)
+
+    def start(self) -> None:
+        """Start polling on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and wait for the thread to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                # A broken config file must not kill the watcher
+                print(f"Warning: Could not reload config: {e}")
+
+
+def _stat(path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
@@ -1,11 +1,17 @@
-def time():
-    from datetime import datetime as dt
-    now = dt.now()
-    return now.strftime("%I:%M %p")
+from clock import Clock, Stopwatch, clock
+
+
+# Current time as "%I:%M %p", formatted at most once a minute
+time = clock.now
 
 
 # Configuration helper functions
-from config_manager import config, config_set, config_reload, config_all, config_has
+from config_manager import (
+    config, config_set, config_reload, config_all, config_has, config_refresh_env,
+    config_many, config_snapshot, config_version, config_validate, config_keys, config_items,
+    config_view, config_watch, config_stop_watching, config_freeze,
+)
+from config_env import environment
 
 
 def get_config(key: str, default=None):
@@ -13,6 +19,16 @@ def get_config(key: str, default=None):
     return config(key, default)
 
 
+def get_many_config(keys, defaults=None):
+    """Get several configuration values at once, keyed by their dotted key."""
+    return config_many(keys, defaults)
+
+
+def get_config_snapshot(keys, defaults=None):
+    """Get an immutable snapshot of several configuration values ('app.name' -> .app_name)."""
+    return config_snapshot(keys, defaults)
+
+
 def set_config(key: str, value):
     """Set a configuration value (runtime only)."""
     config_set(key, value)
@@ -28,16 +44,60 @@ def get_all_config(config_name: str):
     return config_all(config_name)
 
 
+def get_config_view(prefix: str):
+    """Get a read-only view of the configuration under a prefix (e.g. 'app.logging')."""
+    return config_view(prefix)
+
+
 def has_config(key: str):
     """Check if a configuration key exists."""
     return config_has(key)
 
 
+def get_config_keys(prefix: str = ""):
+    """Iterate over the configuration keys under a prefix (e.g. 'app.logging')."""
+    return config_keys(prefix)
+
+
+def get_config_items(prefix: str = ""):
+    """Iterate over the configuration keys and values under a prefix."""
+    return config_items(prefix)
+
+
+def refresh_env():
+    """Pick up environment variable changes made at runtime."""
+    config_refresh_env()
+
+
+def validate_config():
+    """Check the configuration against config/schema.json; raises ConfigValidationError."""
+    return config_validate()
+
+
+def get_config_version() -> int:
+    """Get a counter that changes whenever any configuration value may have changed."""
+    return config_version()
+
+
+def watch_config(interval: float = 1.0):
+    """Reload config files in the background whenever they change."""
+    return config_watch(interval)
+
+
+def stop_watching_config():
+    """Stop reloading config files in the background."""
+    config_stop_watching()
+
+
+def freeze_config():
+    """Make the configuration read-only and fork-friendly (see ConfigManager.freeze)."""
+    config_freeze()
+
+
 def env(key: str, default=None):
     """Get an environment variable or config value."""
-    import os
     # Check environment variables first
-    env_value = os.environ.get(key.upper())
+    env_value = environment.raw(key.upper())
     if env_value is not None:
         return env_value
     
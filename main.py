@@ -3,14 +3,188 @@ General Python Template - Main Entry Point
 Minimal entry point that delegates to modules.
 """
 
-from modules import AppModule
+import os
+import sys
+
+
+# Commands startup_report() times: a bare interpreter, importing the app modules
+# and the CLI itself, each until its first output
+STARTUP_COMMANDS = {
+    "interpreter": ('-c', 'print()'),
+    "import_modules": ('-c', 'import modules; print()'),
+    "first_output": ('main.py',),
+}
+
+# Unix socket served by `main.py --serve` (override with APP_SOCKET)
+DAEMON_SOCKET = os.environ.get('APP_SOCKET', os.path.join('data', 'app.sock'))
+
+
+def time_to_first_output(args: tuple, root: str, env: dict) -> float:
+    """Milliseconds until `python <args>`, started in root, writes its first byte of output."""
+    import subprocess
+    import time
+
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, *args], cwd=root, env=env, stdout=subprocess.PIPE)
+    process.stdout.read(1)
+    elapsed = (time.perf_counter() - start) * 1000
+    process.stdout.read()
+    process.wait()
+    return elapsed
+
+
+def startup_env() -> dict:
+    """The environment startup is measured in: users start with compiled modules."""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+
+def startup_report(limit: int = 15, runs: int = 10) -> dict:
+    """
+    Measure startup in fresh interpreters, with warm .pyc files: the time
+    `import modules` and `python main.py` (until its first output) add to a bare
+    interpreter, best of runs, plus the slowest imports of `import modules` from
+    `python -X importtime`. benchmarks/bench_startup.py compares these timings
+    with another revision of the tree.
+    """
+    import subprocess
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    env = startup_env()
+    time_to_first_output(STARTUP_COMMANDS["first_output"], root, env)
+    # Interleaved, so a busy moment on the machine hits every command alike
+    best = dict.fromkeys(STARTUP_COMMANDS, float('inf'))
+    for _ in range(runs):
+        for name, args in STARTUP_COMMANDS.items():
+            best[name] = min(best[name], time_to_first_output(args, root, env))
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import modules'],
+        cwd=root, env=env, capture_output=True, text=True,
+    )
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        imports.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+
+    return {
+        "interpreter_ms": best["interpreter"],
+        "import_ms": best["import_modules"] - best["interpreter"],
+        "first_output_ms": best["first_output"] - best["interpreter"],
+        "slowest_imports": sorted(imports, key=lambda entry: entry[1], reverse=True)[:limit],
+    }
+
+
+def show_startup_report() -> None:
+    """Print the startup report."""
+    if getattr(sys, 'frozen', False):
+        print("Startup report is not available in the packaged executable")
+        return
+
+    report = startup_report()
+    print("=== Startup Report ===")
+    print(f"Interpreter start: {report['interpreter_ms']:.1f} ms")
+    print(f"import modules: +{report['import_ms']:.1f} ms")
+    print(f"Time to first output: +{report['first_output_ms']:.1f} ms")
+    print("Slowest imports of `import modules` (self / cumulative ms):")
+    for name, self_ms, cumulative_ms in report['slowest_imports']:
+        print(f"  {self_ms:7.2f} {cumulative_ms:8.2f}  {name}")
+
+
+def client_request(command: list, socket_path: str = DAEMON_SOCKET, timeout: float = 10.0) -> tuple:
+    """
+    Send a command (e.g. ['render', 'app_info']) to the daemon started with --serve.
+    Returns (ok, output); raises OSError if no daemon is listening.
+    """
+    import socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(socket_path)
+        client.sendall((' '.join(command) + '\n').encode('utf-8'))
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+    status, _, output = b''.join(chunks).decode('utf-8').partition('\n')
+    if status == 'OK':
+        return True, output
+    return False, status[len('ERR '):] if status.startswith('ERR ') else status
+
+
+def _require_unix_sockets() -> None:
+    import socket
+
+    if not hasattr(socket, 'AF_UNIX'):
+        print("Daemon mode needs Unix domain sockets, which this platform does not support", file=sys.stderr)
+        sys.exit(2)
+
+
+def run_client(command: list) -> None:
+    """Print the daemon's reply to a command; exit with 1 on errors, 2 if no daemon is running."""
+    _require_unix_sockets()
+    try:
+        ok, output = client_request(command or ['render'])
+    except OSError as e:
+        print(f"Could not reach the daemon at {DAEMON_SOCKET}: {e}", file=sys.stderr)
+        sys.exit(2)
+    if not ok:
+        print(f"Error: {output}", file=sys.stderr)
+        sys.exit(1)
+    sys.stdout.write(output)
+
+
+def serve() -> None:
+    """Serve the warm app over DAEMON_SOCKET until stopped."""
+    _require_unix_sockets()
+    from modules.daemon import AppDaemon
+
+    daemon = AppDaemon(DAEMON_SOCKET)
+    print(f"Serving on {DAEMON_SOCKET} (stop with Ctrl+C or `main.py --client stop`)", flush=True)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
 
 
 def main():
     """Main application entry point."""
-    app = AppModule()
-    app.start()
+    args = sys.argv[1:]
+    if '--startup-report' in args:
+        show_startup_report()
+        return
+
+    # The client only needs a socket, so it runs before anything else is imported
+    if args[:1] == ['--client']:
+        run_client(args[1:])
+        return
+
+    from config_schema import ConfigValidationError
+
+    try:
+        if '--serve' in args:
+            serve()
+            return
+
+        from modules import AppModule
+
+        AppModule().start()
+    except ConfigValidationError as e:
+        print("Configuration error:")
+        for error in e.errors:
+            print(f"  {error}")
+        sys.exit(1)
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
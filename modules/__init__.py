@@ -5,5 +5,10 @@ Contains organized functionality extracted from main application.
 
 from .app import AppModule
 from .display import DisplayModule
+from .lifecycle import Lifecycle
+from .output import FileSink, MemorySink, NullSink, OutputSink, StdoutSink
 
-__all__ = ['AppModule', 'DisplayModule']
\ No newline at end of file
+__all__ = [
+    'AppModule', 'DisplayModule', 'Lifecycle',
+    'OutputSink', 'StdoutSink', 'FileSink', 'MemorySink', 'NullSink',
+]
\ No newline at end of file
@@ -3,7 +3,10 @@ Main application module.
 Coordinates application logic and flow.
 """
 
+import helpers
+
 from .display import DisplayModule
+from .lifecycle import Lifecycle
 
 
 class AppModule:
@@ -12,23 +15,62 @@ class AppModule:
     def __init__(self):
         """Initialize the application module."""
         self.display = DisplayModule()
+        # Resources (database connections, API clients, ...) started by initialize()
+        self.lifecycle = Lifecycle()
+        # Queued log writer, configured from app.logging by initialize()
+        self.log_writer = None
     
     def run(self):
         """Run the main application logic."""
         # Run all display sections
         self.display.show_all()
     
+    def start_logging(self):
+        """Attach the queued log writer (built from app.logging) to the application logger."""
+        if self.log_writer is None:
+            from .logger import QueuedLogging
+            self.log_writer = QueuedLogging.from_config()
+        self.log_writer.start()
+    
     def initialize(self):
-        """Initialize the application (setup)."""
-        # Placeholder for any initialization
-        # This could include database connections, API setup, etc.
-        pass
+        """
+        Initialize the application (setup).
+        Validates the configuration, attaches logging to the application
+        logger (its writer thread starts with the first record, from
+        get_logger() or logging.getLogger('app...') alike), then starts the
+        resources registered with self.lifecycle, independent ones in parallel.
+        """
+        helpers.validate_config()
+        self.start_logging()
+        
+        timings = self.lifecycle.start()
+        if timings:
+            from .logger import get_logger
+            get_logger('lifecycle').debug(
+                "Started %d resources in %.1f ms", len(timings), self.lifecycle.phase_times['start'] * 1000)
+        return timings
     
     def cleanup(self):
-        """Clean up resources (teardown)."""
-        # Placeholder for any cleanup
-        # This could include closing connections, saving state, etc.
-        pass
+        """
+        Clean up resources (teardown).
+        Stops the running resources in reverse dependency order, then flushes
+        and stops logging.
+        """
+        try:
+            return self.lifecycle.stop()
+        finally:
+            if self.log_writer is not None:
+                self.log_writer.stop()
+    
+    def freeze(self):
+        """
+        Prepare to fork worker processes that share this app's memory.
+        Renders every display section once, so the cached text is built before
+        the fork, then freezes the configuration (see ConfigManager.freeze),
+        which also moves all objects to the GC's permanent generation.
+        """
+        self.display.render_all()
+        helpers.freeze_config()
     
     def start(self):
         """Start the application with full lifecycle management."""
@@ -47,5 +89,16 @@ class AppModule:
             self.initialize()
             # Use the demo display method
             self.display.show_with_delay(0.05)
+        finally:
+            self.cleanup()
+    
+    async def start_with_demo_async(self):
+        """
+        Start the application with the demonstration, without blocking the event loop.
+        Several apps can run their demos concurrently in one loop.
+        """
+        try:
+            self.initialize()
+            await self.display.show_with_delay_async(0.05)
         finally:
             self.cleanup()
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""
+Resident application daemon served over a Unix domain socket.
+`python main.py --serve` keeps one initialized AppModule (and the config it
+has loaded) in memory and renders output for `python main.py --client`
+requests, so repeated invocations skip interpreter startup, imports and
+config loading. Config files are hot-reloaded while the daemon runs.
+
+Protocol: the client sends one command line and reads the reply until the
+daemon closes the connection. The reply starts with "OK\\n" followed by the
+output, or with "ERR <message>\\n".
+
+    render [section]   render every section, or one of SECTIONS (e.g. app_info)
+    ping               check that the daemon is up
+    stop               shut the daemon down
+"""
+
+import os
+import socket
+import socketserver
+import threading
+from typing import Optional
+
+import helpers
+
+from .app import AppModule
+
+
+# Longest command line the daemon accepts, in bytes
+MAX_REQUEST = 1024
+
+# Sections a client can ask for, by name
+SECTIONS = ('header', 'app_info', 'app_response', 'config_source')
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers one client command per connection."""
+    
+    def handle(self):
+        line = self.rfile.readline(MAX_REQUEST)
+        if not line.endswith(b'\n'):
+            # Disconnected (e.g. a liveness probe) or an oversized request
+            return
+        try:
+            reply = "OK\n" + self.server.daemon.handle(line.decode('utf-8', 'replace').split())
+        except ValueError as e:
+            reply = f"ERR {e}\n"
+        try:
+            self.wfile.write(reply.encode('utf-8'))
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    # Scripts start many clients at once; the default backlog of 5 refuses them
+    request_queue_size = 128
+    
+    def __init__(self, path: str, daemon: "AppDaemon"):
+        self.daemon = daemon
+        super().__init__(path, _RequestHandler)
+
+
+class AppDaemon:
+    """Keeps an AppModule warm and serves render requests over a Unix socket."""
+    
+    def __init__(self, socket_path: str, app: Optional[AppModule] = None,
+                 watch_interval: Optional[float] = 1.0):
+        """Serve app (a new AppModule by default); watch_interval=None disables hot reloading."""
+        self.socket_path = socket_path
+        self.app = app or AppModule()
+        self.watch_interval = watch_interval
+        self._server: Optional[_Server] = None
+        self._ready = threading.Event()
+    
+    def handle(self, command) -> str:
+        """Run a client command (a list of words) and return its output; raises ValueError for bad ones."""
+        name, args = (command[0], command[1:]) if command else ('render', [])
+        display = self.app.display
+        if name == 'render':
+            if not args or args == ['all']:
+                return display.render_all()
+            if len(args) == 1 and args[0] in SECTIONS:
+                return getattr(display, f"render_{args[0]}")()
+            raise ValueError(f"unknown section {' '.join(args)!r}, expected one of: all, {', '.join(SECTIONS)}")
+        if name == 'ping' and not args:
+            return "pong\n"
+        if name == 'stop' and not args:
+            # shutdown() waits for serve_forever() to return, so it can't run on a handler thread
+            threading.Thread(target=self.shutdown, name="daemon-stop").start()
+            return "stopping\n"
+        raise ValueError(f"unknown command {' '.join(command)!r}")
+    
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the socket accepts connections. Returns False on timeout."""
+        return self._ready.wait(timeout)
+    
+    def serve_forever(self) -> None:
+        """Initialize the app, bind the socket and serve until shutdown() or a stop command."""
+        _claim_socket(self.socket_path)
+        try:
+            self.app.initialize()
+            if self.watch_interval is not None:
+                helpers.watch_config(self.watch_interval)
+            self._server = _Server(self.socket_path, self)
+            self._ready.set()
+            self._server.serve_forever()
+        finally:
+            if self._server is not None:
+                self._server.server_close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+            if self.watch_interval is not None:
+                helpers.stop_watching_config()
+            self.app.cleanup()
+    
+    def shutdown(self) -> None:
+        """Stop serving; serve_forever() returns once in-flight requests are answered."""
+        if self._server is not None:
+            self._server.shutdown()
+
+
+def _claim_socket(path: str) -> None:
+    """Remove a stale socket file left by a daemon that died; refuse if one is still running."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+    else:
+        raise RuntimeError(f"A daemon is already serving on {path}")
+    finally:
+        probe.close()
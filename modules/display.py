@@ -6,69 +6,166 @@ Handles all display-related functionality.
 import time
 import helpers
 
+from .output import OutputSink, StdoutSink
+from .templates import SectionTemplate
 
-class DisplayModule:
-    """Handles application display and output functionality."""
-    
-    def __init__(self):
-        """Initialize the display module."""
-        pass
-    
-    def show_header(self):
-        """Display the application header."""
-        print("=== General Python Template ===")
-        print(f"Current time: {helpers.time()}")
-        print()
+
+# Config keys used by the display sections, with their fallback values
+DISPLAY_DEFAULTS = {
+    'app.name': 'Unknown App',
+    'app.version': '1.0.0',
+    'app.env': 'unknown',
+    'app.debug': False,
+    'app.response_number': 0,
+    'app.message': 'Hello, World!',
+}
+
+
+class ConfigSourceSection:
+    """The configuration source section, which also depends on environment overrides."""
     
-    def show_app_info(self):
-        """Display application information."""
-        # Get basic app configuration
-        app_name = helpers.get_config('app.name', 'Unknown App')
-        app_version = helpers.get_config('app.version', '1.0.0')
-        app_env = helpers.get_config('app.env', 'unknown')
-        app_debug = helpers.get_config('app.debug', False)
-        
-        print(f"App: {app_name} v{app_version}")
-        print(f"Environment: {app_env} (Debug: {app_debug})")
-        print()
+    keys = ('app.response_number', 'app.message')
+    env_names = ('APP_RESPONSE_NUMBER', 'APP_MESSAGE')
     
-    def show_app_response(self):
-        """Display the application response section."""
-        response_number = helpers.get_config('app.response_number', 0)
-        message = helpers.get_config('app.message', 'Hello, World!')
-        
-        print("=== App Response ===")
-        print(f"Message: {message}")
-        print(f"Response Number: {response_number}")
-        print()
+    def values(self, settings):
+        return (
+            settings.app_response_number,
+            settings.app_message,
+            *(helpers.env(name) for name in self.env_names),
+        )
     
-    def show_config_source(self):
-        """Display configuration source information."""
-        response_number = helpers.get_config('app.response_number', 0)
-        message = helpers.get_config('app.message', 'Hello, World!')
-        
-        print("=== Configuration Source ===")
+    def render(self, values) -> str:
+        response_number, message, env_number, env_message = values
+        lines = ["=== Configuration Source ==="]
         
         # Check response number source
-        env_number = helpers.env('APP_RESPONSE_NUMBER')
         if env_number:
-            print(f"Response number is overridden by environment variable: {env_number}")
+            lines.append(f"Response number is overridden by environment variable: {env_number}")
         else:
-            print(f"Response number is from config file: {response_number}")
+            lines.append(f"Response number is from config file: {response_number}")
         
         # Check message source
-        env_message = helpers.env('APP_MESSAGE')
         if env_message:
-            print(f"Message is overridden by environment variable: {env_message}")
+            lines.append(f"Message is overridden by environment variable: {env_message}")
+        else:
+            lines.append(f"Message is from config file: {message}")
+        
+        lines.append("")
+        return "\n".join(lines)
+
+
+# Display sections, compiled once
+SECTIONS = {
+    'app_info': SectionTemplate(
+        "App: {app.name} v{app.version}\n"
+        "Environment: {app.env} (Debug: {app.debug})\n"
+        "\n"
+    ),
+    'app_response': SectionTemplate(
+        "=== App Response ===\n"
+        "Message: {app.message}\n"
+        "Response Number: {app.response_number}\n"
+        "\n"
+    ),
+    'config_source': ConfigSourceSection(),
+}
+
+
+class DisplayModule:
+    """
+    Handles application display and output functionality.
+    Rendered sections are cached and only rebuilt when one of their config values
+    changes (or, for the header, when the clock's formatted time changes).
+    """
+    
+    def __init__(self, sink: OutputSink = None):
+        """Initialize the display module, writing to sink (stdout by default)."""
+        self.sink = sink or StdoutSink()
+        # Section name -> (config version, values, rendered text)
+        self._rendered = {}
+        self._settings = None
+        self._header = None
+    
+    def settings(self):
+        """Resolve every config value the display sections use in one pass."""
+        version = helpers.get_config_version()
+        cached = self._settings
+        if cached is None or cached[0] != version:
+            cached = self._settings = (version, helpers.get_config_snapshot(DISPLAY_DEFAULTS, DISPLAY_DEFAULTS))
+        return cached[1]
+    
+    def _render_section(self, name: str, settings=None) -> str:
+        """Render a section, reusing the cached text while its values are unchanged."""
+        section = SECTIONS[name]
+        cached = self._rendered.get(name)
+        version = None
+        if settings is None:
+            version = helpers.get_config_version()
+            if cached is not None and cached[0] == version:
+                return cached[2]
+            settings = self.settings()
+        
+        values = section.values(settings)
+        if cached is not None and cached[1] == values:
+            text = cached[2]
         else:
-            print(f"Message is from config file: {message}")
+            text = section.render(values)
+        # Text rendered from settings passed in by the caller is not tied to a version
+        self._rendered[name] = (version, values, text)
+        return text
+    
+    def render_header(self) -> str:
+        """Render the application header."""
+        # The clock returns the same string object until the minute changes
+        now = helpers.time()
+        if self._header is None or self._header[0] is not now:
+            self._header = (now, (
+                "=== General Python Template ===\n"
+                f"Current time: {now}\n"
+                "\n"
+            ))
+        return self._header[1]
+    
+    def render_app_info(self, settings=None) -> str:
+        """Render application information."""
+        return self._render_section('app_info', settings)
+    
+    def render_app_response(self, settings=None) -> str:
+        """Render the application response section."""
+        return self._render_section('app_response', settings)
+    
+    def render_config_source(self, settings=None) -> str:
+        """Render configuration source information."""
+        return self._render_section('config_source', settings)
+    
+    def render_all(self) -> str:
+        """Render all application information sections."""
+        return ''.join((
+            self.render_header(),
+            self.render_app_info(),
+            self.render_app_response(),
+            self.render_config_source(),
+        ))
+    
+    def show_header(self):
+        """Display the application header."""
+        self.sink.write(self.render_header())
+    
+    def show_app_info(self, settings=None):
+        """Display application information."""
+        self.sink.write(self.render_app_info(settings))
+    
+    def show_app_response(self, settings=None):
+        """Display the application response section."""
+        self.sink.write(self.render_app_response(settings))
+    
+    def show_config_source(self, settings=None):
+        """Display configuration source information."""
+        self.sink.write(self.render_config_source(settings))
     
     def show_all(self):
-        """Display all application information sections."""
-        self.show_header()
-        self.show_app_info()
-        self.show_app_response()
-        self.show_config_source()
+        """Display all application information sections with a single write."""
+        self.sink.write(self.render_all())
     
     def show_with_delay(self, delay_seconds: float = 0.1):
         """
@@ -84,4 +181,18 @@ class DisplayModule:
         self.show_app_response()
         time.sleep(delay_seconds)
         
-        self.show_config_source()
\ No newline at end of file
+        self.show_config_source()
+    
+    async def show_with_delay_async(self, delay_seconds: float = 0.1):
+        """
+        Non-blocking show_with_delay: the sections are scheduled on the running
+        event loop, so other sequences and tasks run in the gaps.
+        Returns how late each section was shown, in seconds.
+        """
+        # asyncio is only imported by callers of the async API
+        from .scheduler import run_timed
+        
+        return await run_timed(
+            (self.show_header, self.show_app_info, self.show_app_response, self.show_config_source),
+            delay_seconds,
+        )
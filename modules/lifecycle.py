@@ -0,0 +1,177 @@
+"""
+Lifecycle registry for application resources (database connections, API clients, ...).
+Resources declare what they depend on; startup runs them concurrently on a thread
+pool as soon as their dependencies are up, teardown runs in reverse dependency order.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from clock import Stopwatch
+
+
+class Resource:
+    """A named resource with optional start and stop callables."""
+    
+    def __init__(self, name: str, start: Optional[Callable[[], object]] = None,
+                 stop: Optional[Callable[[], object]] = None, depends_on: Iterable[str] = ()):
+        self.name = name
+        self.start = start
+        self.stop = stop
+        self.depends_on = tuple(depends_on)
+
+
+class Lifecycle:
+    """
+    Starts and stops registered resources in dependency order.
+    Independent resources start in parallel, so startup takes as long as the
+    slowest chain of dependencies rather than the sum of all steps.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._resources: Dict[str, Resource] = {}
+        self._started: List[str] = []
+        # Phase -> resource name -> seconds, and phase -> wall time in seconds
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self.phase_times: Dict[str, float] = {}
+    
+    def register(self, name: str, start: Optional[Callable[[], object]] = None,
+                 stop: Optional[Callable[[], object]] = None, depends_on: Iterable[str] = ()) -> None:
+        """Register a resource; it starts after every resource named in depends_on."""
+        if name in self._resources:
+            raise ValueError(f"Resource {name!r} is already registered")
+        self._resources[name] = Resource(name, start, stop, depends_on)
+    
+    def __len__(self) -> int:
+        """Number of registered resources."""
+        return len(self._resources)
+    
+    @property
+    def started(self) -> List[str]:
+        """Names of the running resources, in the order they finished starting."""
+        return list(self._started)
+    
+    def order(self) -> List[str]:
+        """A dependency-respecting start order; raises ValueError for unknown or circular dependencies."""
+        for resource in self._resources.values():
+            for dependency in resource.depends_on:
+                if dependency not in self._resources:
+                    raise ValueError(f"Resource {resource.name!r} depends on unknown resource {dependency!r}")
+        
+        order: List[str] = []
+        done: Set[str] = set()
+        pending = list(self._resources)
+        while pending:
+            ready = [name for name in pending if done.issuperset(self._resources[name].depends_on)]
+            if not ready:
+                raise ValueError(f"Circular resource dependencies between {sorted(pending)}")
+            order.extend(ready)
+            done.update(ready)
+            pending = [name for name in pending if name not in done]
+        return order
+    
+    def start(self) -> Dict[str, float]:
+        """
+        Start every registered resource that is not running yet and return the
+        per-resource start times. If one fails, the resources already started are
+        stopped again and the error is raised.
+        """
+        self.order()
+        names = [name for name in self._resources if name not in self._started]
+        blockers = {
+            name: {dep for dep in self._resources[name].depends_on if dep not in self._started}
+            for name in names
+        }
+        error = self._run_phase('start', names, blockers, lambda resource: resource.start,
+                                self._started.append)
+        if error is not None:
+            self.stop()
+            raise error
+        return self.timings['start']
+    
+    def stop(self) -> Dict[str, float]:
+        """Stop the running resources, each after everything that depends on it."""
+        names = list(reversed(self._started))
+        running = set(names)
+        blockers = {name: set() for name in names}
+        for name in names:
+            for dependency in self._resources[name].depends_on:
+                if dependency in running:
+                    blockers[dependency].add(name)
+        
+        stopped = set()
+        error = self._run_phase('stop', names, blockers, lambda resource: resource.stop, stopped.add,
+                                keep_going=True)
+        self._started = [name for name in self._started if name not in stopped]
+        if error is not None:
+            raise error
+        return self.timings['stop']
+    
+    def report(self) -> Dict[str, Dict[str, object]]:
+        """Timings of the last start and stop, in milliseconds."""
+        return {
+            phase: {
+                "total_ms": self.phase_times[phase] * 1000,
+                "resources_ms": {name: seconds * 1000 for name, seconds in timings.items()},
+            }
+            for phase, timings in self.timings.items()
+        }
+    
+    def _run_phase(self, phase: str, names: List[str], blockers: Dict[str, Set[str]],
+                   action: Callable[[Resource], Optional[Callable[[], object]]],
+                   on_done: Callable[[str], object], keep_going: bool = False) -> Optional[BaseException]:
+        """
+        Run each resource's action on a thread pool once none of its blockers are
+        pending. Returns the first error; unless keep_going, nothing new is
+        submitted after an error.
+        """
+        phase_stopwatch = Stopwatch()
+        timings: Dict[str, float] = {}
+        self.timings[phase] = timings
+        error: Optional[BaseException] = None
+        
+        if names:
+            # Only pay for the thread pool import when there is something to run
+            from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+            
+            def run(resource: Resource) -> float:
+                stopwatch = Stopwatch()
+                callback = action(resource)
+                if callback is not None:
+                    callback()
+                return stopwatch.elapsed()
+            
+            waiting = {name: set(blockers[name]) for name in names}
+            with ThreadPoolExecutor(self.max_workers, thread_name_prefix=f"lifecycle-{phase}") as pool:
+                running = {}
+                while True:
+                    if error is None or keep_going:
+                        for name in [name for name, pending in waiting.items() if not pending]:
+                            del waiting[name]
+                            running[pool.submit(run, self._resources[name])] = name
+                    if not running:
+                        break
+                    
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        name = running.pop(future)
+                        try:
+                            timings[name] = future.result()
+                        except BaseException as e:
+                            if error is None:
+                                error = e
+                            if not keep_going:
+                                continue
+                        else:
+                            on_done(name)
+                        for pending in waiting.values():
+                            pending.discard(name)
+                    
+                    # Resources waiting on a failed start can never start
+                    if not keep_going and error is not None:
+                        waiting.clear()
+        
+        self.phase_times[phase] = phase_stopwatch.elapsed()
+        return error
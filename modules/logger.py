@@ -0,0 +1,243 @@
+"""
+Queued application logging configured from the app.logging config block.
+Log calls only put the record on a queue; a background thread, started with
+the first record, formats the records, writes them to the log file in batches
+and rotates it by size.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import helpers
+
+
+# Name of the application logger; get_logger() returns children of it
+LOGGER_NAME = "app"
+
+# Logging settings and their fallbacks, read from config (app.logging.level etc.)
+LOGGING_DEFAULTS = {
+    'app.logging.level': 'INFO',
+    'app.logging.format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    'app.logging.file': 'logs/app.log',
+    'app.logging.max_bytes': 1048576,
+    'app.logging.backup_count': 3,
+}
+
+_STOP = object()
+
+
+def get_logger(name: Optional[str] = None) -> logging.Logger:
+    """Get the application logger, or one of its children."""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
+
+
+class _QueueHandler(logging.Handler):
+    """Hands records to the writer thread without formatting or locking."""
+    
+    def __init__(self, records: queue.SimpleQueue):
+        super().__init__()
+        self._records = records
+        # Starts the writer thread; cleared once it runs
+        self.start_writer = None
+    
+    def handle(self, record: logging.LogRecord):
+        if self.filter(record):
+            self._records.put(record)
+            if self.start_writer is not None:
+                self.start_writer()
+        return record
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        self._records.put(record)
+
+
+class QueuedLogging:
+    """
+    Background log writer for the application logger.
+    Records are formatted on the writer thread, so arguments passed to a log
+    call should not be mutated afterwards.
+    """
+    
+    def __init__(self, level: Any = 'INFO', format: str = LOGGING_DEFAULTS['app.logging.format'],
+                 file: str = 'logs/app.log', max_bytes: int = 1048576, backup_count: int = 3,
+                 batch_size: int = 1024, flush_interval: float = 0.05, logger_name: str = LOGGER_NAME):
+        self.level = _level(level)
+        self.formatter = logging.Formatter(format)
+        self.path = file
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        # How long the writer lets records pile up before writing a batch
+        self.flush_interval = flush_interval
+        self.logger = logging.getLogger(logger_name)
+        
+        self._records: queue.SimpleQueue = queue.SimpleQueue()
+        self._handler = _QueueHandler(self._records)
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        # Logger level and propagate flag before start(), restored by stop()
+        self._saved: Optional[tuple] = None
+        self._file = None
+        self._size = 0
+    
+    @classmethod
+    def from_config(cls, **overrides) -> "QueuedLogging":
+        """Build the writer from the app.logging config block (with env/JSON overrides)."""
+        options = {key.rsplit('.', 1)[1]: value for key, value in settings().items()}
+        options.update(overrides)
+        return cls(**options)
+    
+    @property
+    def running(self) -> bool:
+        """Whether the queue is attached to the logger (the thread may not have started yet)."""
+        return self._saved is not None
+    
+    def start(self) -> None:
+        """
+        Attach the queue to the application logger. The writer thread starts
+        with the first record, so runs that never log don't pay for it.
+        """
+        if self._saved is not None:
+            return
+        self._saved = (self.logger.level, self.logger.propagate)
+        self.logger.setLevel(self.level)
+        # Handlers further up (e.g. from logging.basicConfig) would run on the caller
+        self.logger.propagate = False
+        self._handler.start_writer = self._start_thread
+        self.logger.addHandler(self._handler)
+    
+    def _start_thread(self) -> None:
+        with self._thread_lock:
+            if self._thread is None and self._saved is not None:
+                self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self._thread.start()
+            self._handler.start_writer = None
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every record logged so far is written. Returns False on timeout."""
+        if self._thread is None:
+            return True
+        written = threading.Event()
+        self._records.put(written)
+        return written.wait(timeout)
+    
+    def stop(self) -> None:
+        """
+        Detach from the logger (restoring its level and propagation), write out
+        the queued records and stop the thread.
+        """
+        if self._saved is None:
+            return
+        self.logger.removeHandler(self._handler)
+        with self._thread_lock:
+            level, propagate = self._saved
+            self.logger.setLevel(level)
+            self.logger.propagate = propagate
+            self._saved = None
+            self._handler.start_writer = None
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._records.put(_STOP)
+            thread.join()
+    
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self._records.get()]
+            self._drain(batch)
+            if self.flush_interval and len(batch) < self.batch_size and _only_records(batch):
+                # Let a light trickle of records pile up into a batch instead of
+                # competing with the logging threads record by record
+                time.sleep(self.flush_interval)
+                self._drain(batch)
+            
+            lines: List[str] = []
+            written: List[threading.Event] = []
+            for item in batch:
+                if item is _STOP:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    written.append(item)
+                else:
+                    lines.append(self._format(item))
+            
+            if lines:
+                try:
+                    self._write('\n'.join(lines) + '\n')
+                except OSError as e:
+                    print(f"Warning: Could not write log file {self.path}: {e}")
+            for event in written:
+                event.set()
+        
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def _drain(self, batch: list) -> None:
+        """Move queued items into batch, up to batch_size."""
+        try:
+            while len(batch) < self.batch_size:
+                batch.append(self._records.get_nowait())
+        except queue.Empty:
+            pass
+    
+    def _format(self, record: logging.LogRecord) -> str:
+        try:
+            return self.formatter.format(record)
+        except Exception as e:
+            return f"Could not format log record {record.msg!r}: {e}"
+    
+    def _write(self, text: str) -> None:
+        """Append a batch to the log file, rotating it first if it would grow too large."""
+        data = text.encode('utf-8')
+        if self._file is None:
+            self._open()
+        if self.max_bytes and self._size and self._size + len(data) > self.max_bytes:
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+    
+    def _open(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, 'ab')
+        self._size = self._file.tell()
+    
+    def _rotate(self) -> None:
+        """Shift app.log.1 .. app.log.N-1 up by one and move the current file to app.log.1."""
+        self._file.close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open()
+
+
+def _only_records(batch: list) -> bool:
+    """Check that nobody is waiting on a flush or stop in batch."""
+    return all(isinstance(item, logging.LogRecord) for item in batch)
+
+
+def _level(level: Any) -> int:
+    """Accept level names ("DEBUG") as well as numbers."""
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(str(level).upper())
+    if not isinstance(value, int):
+        raise ValueError(f"Unknown log level: {level!r}")
+    return value
+
+
+def settings() -> Dict[str, Any]:
+    """The effective logging settings."""
+    return helpers.get_many_config(LOGGING_DEFAULTS, LOGGING_DEFAULTS)
@@ -0,0 +1,114 @@
+"""
+Output sinks for rendered display text.
+A sink receives whole rendered sections and writes each one with a single write;
+batch() groups many renders into one write.
+"""
+
+import sys
+from contextlib import contextmanager
+
+
+class OutputSink:
+    """Base sink: buffers written text and hands it to _write() on flush."""
+    
+    def __init__(self, autoflush: bool = True):
+        """
+        With autoflush, every write() is flushed immediately (outside of batch()).
+        Without it, text is kept until flush() or close() is called.
+        """
+        self.autoflush = autoflush
+        self._pending = []
+        self._batch_depth = 0
+    
+    def write(self, text: str) -> None:
+        """Queue rendered text for output."""
+        if not text:
+            return
+        self._pending.append(text)
+        if self.autoflush and not self._batch_depth:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write out everything queued so far in one write."""
+        if self._pending:
+            text = ''.join(self._pending)
+            self._pending.clear()
+            self._write(text)
+    
+    @contextmanager
+    def batch(self):
+        """Collect the writes made inside the block and flush them together at the end."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self.autoflush:
+                self.flush()
+    
+    def close(self) -> None:
+        """Flush pending text and release the sink's resources."""
+        self.flush()
+    
+    def _write(self, text: str) -> None:
+        raise NotImplementedError
+
+
+class StdoutSink(OutputSink):
+    """Writes to sys.stdout, looked up at write time so redirection keeps working."""
+    
+    def _write(self, text: str) -> None:
+        stream = sys.stdout
+        stream.write(text)
+        stream.flush()
+
+
+class FileSink(OutputSink):
+    """Writes to a file, opened on first write."""
+    
+    def __init__(self, path: str, mode: str = 'a', encoding: str = 'utf-8', autoflush: bool = True):
+        super().__init__(autoflush)
+        self.path = path
+        self.mode = mode
+        self.encoding = encoding
+        self._file = None
+    
+    def _write(self, text: str) -> None:
+        if self._file is None:
+            self._file = open(self.path, self.mode, encoding=self.encoding)
+        self._file.write(text)
+        self._file.flush()
+    
+    def close(self) -> None:
+        super().close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class MemorySink(OutputSink):
+    """Keeps everything written in memory (useful for tests and capturing output)."""
+    
+    def __init__(self, autoflush: bool = True):
+        super().__init__(autoflush)
+        self.writes = []
+    
+    def _write(self, text: str) -> None:
+        self.writes.append(text)
+    
+    def getvalue(self) -> str:
+        """Everything flushed so far."""
+        return ''.join(self.writes)
+    
+    def clear(self) -> None:
+        self.writes.clear()
+
+
+class NullSink(OutputSink):
+    """Discards all output."""
+    
+    def write(self, text: str) -> None:
+        pass
+    
+    def _write(self, text: str) -> None:
+        pass
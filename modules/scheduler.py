@@ -0,0 +1,36 @@
+"""
+Non-blocking timed sequences on an asyncio event loop.
+Steps are scheduled against monotonic deadlines taken from loop.time(), so the
+time spent running a step does not push the later steps back, and any number of
+sequences can share one loop.
+"""
+
+import asyncio
+from typing import Callable, Iterable, List, Optional
+
+
+async def run_timed(steps: Iterable[Callable[[], object]], interval: float,
+                    start: Optional[float] = None) -> List[float]:
+    """
+    Run step i at start + i * interval (start defaults to now) and return how
+    late each step started, in seconds.
+    """
+    loop = asyncio.get_running_loop()
+    if start is None:
+        start = loop.time()
+    
+    lateness = []
+    for index, step in enumerate(steps):
+        deadline = start + index * interval
+        delay = deadline - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        lateness.append(loop.time() - deadline)
+        step()
+    return lateness
+
+
+def schedule_timed(steps: Iterable[Callable[[], object]], interval: float,
+                   start: Optional[float] = None) -> "asyncio.Task[List[float]]":
+    """Start a timed sequence as a task on the running loop."""
+    return asyncio.get_running_loop().create_task(run_timed(steps, interval, start))
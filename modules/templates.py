@@ -0,0 +1,40 @@
+"""
+Precompiled text templates for display sections.
+A template is a format string whose fields are dotted config keys; it is parsed
+once into a positional format string bound to those keys.
+"""
+
+from string import Formatter
+from typing import Any, Tuple
+
+
+class SectionTemplate:
+    """A section's text, compiled once and bound to the config keys it uses."""
+    
+    def __init__(self, source: str):
+        """Compile source, e.g. "App: {app.name} v{app.version}\\n"."""
+        parsed = list(Formatter().parse(source))
+        self.source = source
+        self.keys: Tuple[str, ...] = tuple(dict.fromkeys(
+            field for _, field, _, _ in parsed if field is not None
+        ))
+        self._fields = tuple(key.replace('.', '_') for key in self.keys)
+        
+        pieces = []
+        for literal, field, spec, conversion in parsed:
+            pieces.append(literal.replace('{', '{{').replace('}', '}}'))
+            if field is not None:
+                pieces.append('{%d%s%s}' % (
+                    self.keys.index(field),
+                    f'!{conversion}' if conversion else '',
+                    f':{spec}' if spec else '',
+                ))
+        self._format = ''.join(pieces).format
+    
+    def values(self, settings) -> Tuple[Any, ...]:
+        """Pick this template's values out of a config snapshot."""
+        return tuple(getattr(settings, field) for field in self._fields)
+    
+    def render(self, values: Tuple[Any, ...]) -> str:
+        """Render the template from the values returned by values()."""
+        return self._format(*values)
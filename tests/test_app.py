@@ -8,7 +8,7 @@ import os
 # Add the project root to the path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from modules import AppModule, DisplayModule
+from modules import AppModule, DisplayModule, FileSink, Lifecycle, MemorySink, NullSink
 
 
 def test_foundation():
@@ -26,10 +26,15 @@ def test_foundation():
     
     print("✓ All display methods work")
     
-    # Test app module
-    app = AppModule()
-    app.initialize()
-    app.cleanup()
+    # Test app module, logging to a temporary file rather than logs/app.log
+    import tempfile
+    from modules.logger import QueuedLogging
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        app = AppModule()
+        app.log_writer = QueuedLogging.from_config(file=os.path.join(temp_dir, "app.log"))
+        app.initialize()
+        app.cleanup()
     
     print("✓ App module lifecycle methods work")
     
@@ -60,12 +65,490 @@ def test_delayed_functionality():
     return True
 
 
+def test_output_sinks():
+    """Test rendering into pluggable output sinks."""
+    print("Testing output sinks...")
+    
+    import tempfile
+    
+    # Every show_* call is one write; show_all renders everything at once
+    sink = MemorySink()
+    display = DisplayModule(sink)
+    display.show_all()
+    assert len(sink.writes) == 1
+    output = sink.getvalue()
+    assert output.startswith("=== General Python Template ===\n")
+    assert "=== App Response ===" in output
+    assert "=== Configuration Source ===" in output
+    assert output == display.render_all()
+    
+    # Batching turns many renders into one write
+    sink.clear()
+    with sink.batch():
+        display.show_header()
+        display.show_app_info()
+        display.show_app_response()
+        assert sink.writes == []
+    assert len(sink.writes) == 1
+    
+    # Without autoflush, text waits for an explicit flush
+    sink = MemorySink(autoflush=False)
+    DisplayModule(sink).show_all()
+    DisplayModule(sink).show_all()
+    assert sink.writes == []
+    sink.flush()
+    assert len(sink.writes) == 1
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "display.txt")
+        file_sink = FileSink(path)
+        DisplayModule(file_sink).show_app_response()
+        file_sink.close()
+        with open(path, encoding='utf-8') as f:
+            assert f.read().startswith("=== App Response ===\n")
+    
+    DisplayModule(NullSink()).show_all()
+    
+    print("✓ Output sinks work")
+    return True
+
+
+def test_section_cache():
+    """Test that rendered sections are reused until their config values change."""
+    print("Testing section templates and caching...")
+    
+    from modules.templates import SectionTemplate
+    
+    template = SectionTemplate("{app.name} {{literal}} {app.debug!r:>6} {app.name}")
+    assert template.keys == ('app.name', 'app.debug')
+    assert template.render(('Demo', False)) == "Demo {literal}  False Demo"
+    
+    display = DisplayModule(MemorySink())
+    first = display.render_all()
+    info = display.render_app_info()
+    response = display.render_app_response()
+    assert display.render_all() == first
+    assert display.render_app_info() is info
+    
+    try:
+        # Only the sections using the changed key are rebuilt
+        os.environ['APP_MESSAGE'] = 'From env'
+        assert "Message: From env" in display.render_app_response()
+        assert display.render_app_info() is info
+        assert "overridden by environment variable: From env" in display.render_config_source()
+    finally:
+        os.environ.pop('APP_MESSAGE', None)
+    assert display.render_app_response() == response
+    
+    print("✓ Section caching works")
+    return True
+
+
+def test_async_display():
+    """Test timed display sequences running concurrently on one event loop."""
+    print("Testing async display scheduling...")
+    
+    import asyncio
+    import time
+    
+    sinks = [MemorySink() for _ in range(20)]
+    displays = [DisplayModule(sink) for sink in sinks]
+    
+    async def run_all():
+        return await asyncio.gather(*(display.show_with_delay_async(0.02) for display in displays))
+    
+    start = time.perf_counter()
+    lateness = asyncio.run(run_all())
+    elapsed = time.perf_counter() - start
+    
+    # 20 sequences of 3 gaps each would take 1.2 s one after another
+    assert elapsed < 0.6, f"took {elapsed:.3f} s"
+    assert all(len(sink.writes) == 4 for sink in sinks)
+    assert all(len(steps) == 4 and min(steps) >= 0 for steps in lateness)
+    assert sinks[0].getvalue() == sinks[-1].getvalue()
+    
+    app = AppModule()
+    app.display.sink = MemorySink()
+    asyncio.run(app.start_with_demo_async())
+    assert "=== Configuration Source ===" in app.display.sink.getvalue()
+    
+    print(f"✓ Async display works ({elapsed:.3f} s for 20 sequences)")
+    return True
+
+
+def test_clock():
+    """Test the cached clock and stopwatch helpers."""
+    print("Testing clock service...")
+    
+    import time
+    from datetime import datetime
+    import helpers
+    from clock import Clock, Stopwatch
+    
+    clock = Clock()
+    first = clock.now()
+    assert clock.now() is first
+    assert first in (datetime.now().strftime("%I:%M %p"), clock._refresh())
+    
+    # Past the deadline the time is formatted again
+    clock._deadline = 0.0
+    refreshed = clock.now()
+    assert refreshed is not first
+    assert 0.0 < clock._deadline - time.monotonic() <= 60.0
+    assert helpers.time() == helpers.clock.now()
+    
+    stopwatch = Stopwatch()
+    elapsed = stopwatch.elapsed()
+    assert elapsed >= 0.0
+    assert stopwatch.restart() >= elapsed
+    assert stopwatch.elapsed_ms() >= 0.0
+    
+    print("✓ Clock service works")
+    return True
+
+
+def test_lifecycle():
+    """Test dependency-ordered, parallel resource startup and teardown."""
+    print("Testing lifecycle registry...")
+    
+    import tempfile
+    import threading
+    import time
+    from modules.logger import QueuedLogging
+    
+    events = []
+    lock = threading.Lock()
+    
+    def step(name, seconds=0.0, fail=False):
+        def run():
+            time.sleep(seconds)
+            with lock:
+                events.append(name)
+            if fail:
+                raise RuntimeError(f"{name} failed")
+        return run
+    
+    app = AppModule()
+    app.lifecycle.register('database', step('start database', 0.1), step('stop database'))
+    app.lifecycle.register('api', step('start api', 0.1), step('stop api'))
+    app.lifecycle.register('cache', step('start cache', 0.1), step('stop cache'), depends_on=['database', 'api'])
+    assert len(app.lifecycle) == 3
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        app.log_writer = QueuedLogging.from_config(file=os.path.join(temp_dir, "app.log"))
+        app.initialize()
+        # database and api start together, so startup takes two steps rather than three
+        assert app.lifecycle.phase_times['start'] < 0.28
+        assert events[-1] == 'start cache'
+        assert set(app.lifecycle.started) == {'database', 'api', 'cache'}
+        
+        app.cleanup()
+    assert events[3] == 'stop cache'
+    assert set(events[4:]) == {'stop database', 'stop api'}
+    assert app.lifecycle.started == []
+    report = app.lifecycle.report()
+    assert set(report['start']['resources_ms']) == {'database', 'api', 'cache'}
+    
+    # A failed start tears down what was already started
+    events.clear()
+    lifecycle = Lifecycle()
+    lifecycle.register('database', step('start database'), step('stop database'))
+    lifecycle.register('api', step('start api', 0.05, fail=True), depends_on=['database'])
+    lifecycle.register('worker', step('start worker'), depends_on=['api'])
+    try:
+        lifecycle.start()
+        assert False, "start should fail"
+    except RuntimeError:
+        pass
+    assert events == ['start database', 'start api', 'stop database']
+    assert lifecycle.started == []
+    
+    lifecycle = Lifecycle()
+    lifecycle.register('a', depends_on=['b'])
+    lifecycle.register('b', depends_on=['a'])
+    try:
+        lifecycle.start()
+        assert False, "circular dependencies should be rejected"
+    except ValueError:
+        pass
+    
+    print("✓ Lifecycle registry works")
+    return True
+
+
+def test_queued_logging():
+    """Test the queued log writer: batching, level filtering, rotation and flushing."""
+    print("Testing queued logging...")
+    
+    import logging
+    import tempfile
+    from modules.logger import QueuedLogging
+    
+    # config.json overrides app.logging.level with DEBUG
+    assert QueuedLogging.from_config().level == logging.DEBUG
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "logs", "app.log")
+        writer = QueuedLogging(level='INFO', format='%(levelname)s %(message)s', file=path,
+                               max_bytes=2000, backup_count=2, logger_name='app.tests')
+        logger = logging.getLogger('app.tests')
+        writer.start()
+        # The writer thread waits for the first record; the logger's records
+        # stop at the queue instead of propagating to root handlers
+        assert writer.running and writer._thread is None
+        assert logger.propagate is False
+        logger.debug("hidden")
+        assert writer._thread is None
+        for index in range(20):
+            logger.info("message %d", index)
+        assert writer.flush(5)
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        assert lines[0] == "INFO message 0" and lines[-1] == "INFO message 19"
+        
+        # Rotation happens between batches; write enough batches to rotate more than backup_count times
+        for index in range(500):
+            logger.warning("rotation %d", index)
+            if index % 100 == 99:
+                writer.flush(5)
+        writer.stop()
+        assert not writer.running
+        assert logger.propagate is True and logger.level == logging.NOTSET
+        assert os.path.exists(path + ".1") and os.path.exists(path + ".2")
+        assert not os.path.exists(path + ".3")
+        with open(path, encoding='utf-8') as f:
+            assert f.read().splitlines()[-1] == "WARNING rotation 499"
+        
+        # Records logged after stop are not queued any more
+        logger.warning("after stop")
+        assert writer._records.empty()
+    
+    # initialize() attaches logging; records from the standard logging API
+    # start the writer thread and end up in the log file, not on stderr
+    import subprocess
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "app.log")
+        script = (
+            "import logging; from modules import AppModule; app = AppModule(); app.initialize(); "
+            "print(app.log_writer.running, app.log_writer._thread is None); "
+            "logging.getLogger('app.db').warning('standard logger'); "
+            "print(app.log_writer._thread is not None); app.cleanup()"
+        )
+        result = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True,
+                                env=dict(os.environ, APP_LOGGING_FILE=path))
+        assert result.stdout.split() == ['True', 'True', 'True'], result.stdout + result.stderr
+        assert result.stderr == ""
+        with open(path, encoding='utf-8') as f:
+            assert "app.db - WARNING - standard logger" in f.read()
+    
+    print("✓ Queued logging works")
+    return True
+
+
+def test_daemon():
+    """Test serving render requests from a warm app over a Unix socket."""
+    print("Testing daemon mode...")
+    
+    import socket
+    import tempfile
+    import threading
+    
+    if not hasattr(socket, 'AF_UNIX'):
+        print("✓ Daemon mode skipped (no Unix sockets)")
+        return True
+    
+    import helpers
+    import main
+    from modules.daemon import AppDaemon
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "run", "app.sock")
+        daemon = AppDaemon(path, watch_interval=None)
+        server = threading.Thread(target=daemon.serve_forever)
+        server.start()
+        try:
+            assert daemon.wait_ready(5)
+            assert main.client_request(['ping'], path) == (True, "pong\n")
+            
+            # Concurrent clients all get the same rendering
+            expected = daemon.app.display.render_app_info()
+            replies = []
+            clients = [
+                threading.Thread(target=lambda: replies.append(main.client_request(['render', 'app_info'], path)))
+                for _ in range(16)
+            ]
+            for client in clients:
+                client.start()
+            for client in clients:
+                client.join()
+            assert replies == [(True, expected)] * 16
+            
+            ok, output = main.client_request(['render'], path)
+            assert ok and "=== App Response ===" in output
+            ok, error = main.client_request(['render', 'nope'], path)
+            assert not ok and "unknown section" in error
+            
+            # Config changes show up in the next render
+            helpers.set_config('app.version', '9.9.9')
+            try:
+                assert "v9.9.9" in main.client_request(['render', 'app_info'], path)[1]
+            finally:
+                helpers.reload_config('app')
+            
+            # A second daemon refuses to take over a live socket
+            try:
+                AppDaemon(path, watch_interval=None).serve_forever()
+                assert False, "second daemon should not start"
+            except RuntimeError:
+                pass
+            
+            assert main.client_request(['stop'], path) == (True, "stopping\n")
+            server.join(5)
+            assert not server.is_alive()
+            assert not os.path.exists(path)
+        finally:
+            daemon.shutdown()
+            server.join(5)
+    
+    print("✓ Daemon mode works")
+    return True
+
+
+def test_app_freeze():
+    """Test freezing the app before forking workers (in a separate process)."""
+    print("Testing app freeze...")
+    
+    import subprocess
+    
+    if not hasattr(os, 'fork'):
+        print("✓ App freeze skipped (no fork)")
+        return True
+    
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    script = """
+import gc, os, helpers, config_manager
+from modules import AppModule
+app = AppModule()
+expected = app.display.render_app_info()
+app.freeze()
+assert config_manager.get_manager().frozen and gc.get_freeze_count() > 0
+try:
+    helpers.set_config('app.name', 'x')
+    raise SystemExit('set_config should fail once frozen')
+except RuntimeError:
+    pass
+pid = os.fork()
+if pid == 0:
+    os._exit(0 if app.display.render_app_info() == expected else 1)
+_, status = os.waitpid(pid, 0)
+print(os.waitstatus_to_exitcode(status))
+"""
+    result = subprocess.run([sys.executable, '-c', script], cwd=root, capture_output=True, text=True)
+    assert result.stdout.strip() == '0', result.stdout + result.stderr
+    
+    print("✓ App freeze works")
+    return True
+
+
+def test_benchmark_suite():
+    """Smoke-test the benchmark suite on a tiny config tree."""
+    print("Testing benchmark suite...")
+    
+    import json
+    import tempfile
+    from pathlib import Path
+    
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.path.join(root, "benchmarks"))
+    try:
+        import suite
+    finally:
+        sys.path.remove(os.path.join(root, "benchmarks"))
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        profile_dir = os.path.join(temp_dir, "profiles")
+        document = suite.run(files=3, keys=6, depth=1, patterns=['config.*', 'display.*'],
+                             min_time=0.001, repeat=1, profile=['config.get'], profile_dir=Path(profile_dir),
+                             profile_calls=10)
+        assert set(document['results']) == set(suite.select(['config.*', 'display.*']))
+        assert all(result['ns_per_call'] > 0 for result in document['results'].values())
+        assert document['meta']['files'] == 3
+        assert os.path.exists(os.path.join(profile_dir, "config.get.prof"))
+        json.dumps(document)
+        
+        # A case slower than its baseline by more than the tolerance is flagged
+        baseline = json.loads(json.dumps(document))
+        baseline['results']['config.get']['ns_per_call'] /= 10
+        report = suite.compare(document, baseline, tolerance=0.25)
+        assert report['config.get']['regressed']
+        assert not report['config.has']['regressed']
+    
+    print("✓ Benchmark suite works")
+    return True
+
+
+def test_startup_budget():
+    """
+    Test that startup stays lazy. Set STARTUP_BASELINE_REVISION (e.g. a tag) to
+    also check that CLI startup is not slower than that revision, measured in the
+    same run by benchmarks/bench_startup.py.
+    """
+    print("Testing startup budget...")
+    
+    import subprocess
+    import main
+    
+    # Importing main must not build the config manager or load optional modules,
+    # and config_manager loads its optional parts on first use
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    check = subprocess.run(
+        [sys.executable, '-c',
+         "import sys, main, config_manager; "
+         "print(config_manager._config_manager is None, "
+         "any(name in sys.modules for name in ('config_metrics', 'config_watcher', 'json', 'dis', 'asyncio', 'concurrent.futures', 'logging', "
+         "'config_json', 'config_index', 'config_cache', 'config_schema')))"],
+        cwd=root, capture_output=True, text=True,
+    )
+    assert check.stdout.split() == ['True', 'False'], check.stdout + check.stderr
+    
+    report = main.startup_report(runs=1)
+    assert report['interpreter_ms'] > 0 and report['slowest_imports']
+    
+    # Wall-clock timings depend on the machine, so comparing them is opt-in
+    revision = os.environ.get('STARTUP_BASELINE_REVISION')
+    if revision:
+        sys.path.insert(0, os.path.join(root, "benchmarks"))
+        try:
+            import bench_startup
+        finally:
+            sys.path.remove(os.path.join(root, "benchmarks"))
+        comparison = bench_startup.run(revision)
+        assert not comparison['regressed'], (
+            f"startup against {revision}: {comparison['current_ms']} ms vs {comparison['baseline_ms']} ms")
+        print(f"✓ Startup stays lazy and within {bench_startup.DEFAULT_TOLERANCE:.0%} of {revision}")
+        return True
+    
+    print("✓ Startup stays lazy")
+    return True
+
+
 def run_tests():
     """Run all tests."""
     try:
         test_foundation()
         test_main_functionality()
         test_delayed_functionality()
+        test_output_sinks()
+        test_section_cache()
+        test_async_display()
+        test_clock()
+        test_lifecycle()
+        test_queued_logging()
+        test_daemon()
+        test_app_freeze()
+        test_benchmark_suite()
+        test_startup_budget()
         print("\n✅ All tests passed!")
         return True
     except Exception as e:
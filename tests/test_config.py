@@ -6,6 +6,7 @@ import os
 import sys
 import tempfile
 import shutil
+import time
 from pathlib import Path
 
 # Add the project root to the path
@@ -112,9 +113,9 @@ name = "Original App"
         print("✓ Runtime config changes work")
 
 
-def test_bundled_json_extraction():
-    """Test JSON extraction and cleanup for bundled applications."""
-    print("Testing bundled JSON extraction and cleanup...")
+def test_bundled_json_loading():
+    """Test that bundled JSON is read in place for PyInstaller builds."""
+    print("Testing bundled JSON loading...")
     
     with tempfile.TemporaryDirectory() as temp_dir:
         config_dir = Path(temp_dir) / "config"
@@ -127,8 +128,10 @@ name = "Original App"
 debug = False
 """)
         
-        # Create JSON config file
-        json_file = Path(temp_dir) / "config.json"
+        # Create the bundled JSON config file in a fake PyInstaller bundle
+        bundle_dir = Path(temp_dir) / "bundle"
+        bundle_dir.mkdir()
+        json_file = bundle_dir / "config.json"
         json_file.write_text("""
 {
     "APP_NAME": "Bundled App",
@@ -136,18 +139,990 @@ debug = False
 }
 """)
         
-        # Test config manager
+        sys._MEIPASS = str(bundle_dir)
+        try:
+            manager = ConfigManager(config_dir=str(config_dir), json_file="config.json")
+            
+            # Test JSON loading straight from the bundle
+            assert manager.get('app.name') == "Bundled App"
+            assert manager.get('app.debug') == True
+            
+            # Reloading reads the bundled file in place again
+            json_file.write_text('{"APP_NAME": "Rebundled App"}')
+            manager.reload()
+            assert manager.get('app.name') == "Rebundled App"
+            assert manager.get('app.debug') == False
+        finally:
+            del sys._MEIPASS
+        
+        print("✓ Bundled JSON loading works")
+
+
+def test_resolved_index_invalidation():
+    """Test that resolved values are invalidated by set, reload and env changes."""
+    print("Testing resolved-key index invalidation...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        
+        test_config = config_dir / "idx.py"
+        test_config.write_text("""
+name = "Indexed App"
+settings = {
+    "host": "localhost",
+    "port": 8000
+}
+""")
+        
+        manager = ConfigManager(config_dir=str(config_dir), json_file="/nonexistent/config.json")
+        
+        # Repeated lookups are served from the index
+        assert manager.get('idx.settings.host') == "localhost"
+        assert 'idx.settings.host' in manager._state.resolved
+        assert manager._state.env_keys['IDX_SETTINGS_HOST'] == {'idx.settings.host'}
+        assert manager.get('idx.missing', 'fallback') == 'fallback'
+        assert manager.get('idx.missing', 'other') == 'other'
+        
+        # set() invalidates the key and its ancestors
+        manager.set('idx.settings.host', "example.com")
+        assert 'idx.settings' not in manager._state.resolved
+        assert manager.get('idx.settings.host') == "example.com"
+        assert manager.get('idx.settings')['host'] == "example.com"
+        assert manager.get('idx.name') == "Indexed App"
+        
+        # reload() drops every entry for the namespace
+        test_config.write_text('name = "Reloaded App"\n')
+        manager.reload('idx')
+        assert manager.get('idx.name') == "Reloaded App"
+        assert manager.get('idx.settings.host') is None
+        
+        # Environment changes are picked up by refresh_env()
+        os.environ['IDX_NAME'] = "Env App"
+        try:
+            manager.refresh_env()
+            assert manager.get('idx.name') == "Env App"
+        finally:
+            del os.environ['IDX_NAME']
+        manager.refresh_env()
+        assert manager.get('idx.name') == "Reloaded App"
+        
+        print("✓ Resolved-key index invalidation works")
+
+
+def test_environment_layer():
+    """Test the shared environment snapshot and its change detection."""
+    print("Testing environment snapshot layer...")
+    
+    from config_env import EnvironmentLayer
+    import helpers
+    
+    # Writes through os.environ are picked up without a refresh
+    os.environ['ENVLAYER_FLAG'] = "True"
+    try:
+        assert helpers.get_config('envlayer.flag') is True
+        assert helpers.env('envlayer_flag') == "True"
+        os.environ['ENVLAYER_FLAG'] = "off"
+        assert helpers.get_config('envlayer.flag') == "off"
+    finally:
+        del os.environ['ENVLAYER_FLAG']
+    assert helpers.get_config('envlayer.flag', 'unset') == 'unset'
+    assert helpers.env('envlayer_flag') is None
+    
+    # A failing subscriber neither fails the write nor keeps other managers stale
+    def failing(changed):
+        raise RuntimeError("subscriber failed")
+    
+    first = ConfigManager(json_file="/nonexistent/config.json")
+    second = ConfigManager(json_file="/nonexistent/config.json")
+    first.subscribe(failing)
+    os.environ['ENVLAYER_LABEL'] = "A"
+    try:
+        assert first.get('envlayer.label') == second.get('envlayer.label') == "A"
+        os.environ['ENVLAYER_LABEL'] = "B"
+        assert first.get('envlayer.label') == second.get('envlayer.label') == "B"
+    finally:
+        del os.environ['ENVLAYER_LABEL']
+    assert second.get('envlayer.label') is None
+    
+    # Changes to a custom mapping are only seen after refresh()
+    environ = {'ENVLAYER_NAME': "First"}
+    layer = EnvironmentLayer(environ)
+    manager = ConfigManager(json_file="/nonexistent/config.json", environment=layer)
+    assert manager.get('envlayer.name') == "First"
+    environ['ENVLAYER_NAME'] = "Second"
+    assert manager.get('envlayer.name') == "First"
+    assert layer.refresh() == {'ENVLAYER_NAME'}
+    assert manager.get('envlayer.name') == "Second"
+    
+    # Variables no resolved or indexed key maps to leave the state alone
+    list(manager.keys())
+    state, version = manager._state, manager.version
+    environ['UNRELATED_VAR'] = "1"
+    assert layer.refresh() == {'UNRELATED_VAR'}
+    assert manager._state is state and manager.version == version
+    assert state.index is not None
+    environ['ENVLAYER_NAME'] = "Third"
+    layer.refresh()
+    assert manager.version == version + 1
+    assert manager.get('envlayer.name') == "Third"
+    
+    # New variables are added to the carried-over key index, removed ones drop it
+    environ['APP_ENVLAYER_LEVEL'] = "2"
+    layer.refresh()
+    assert manager._state.index is not None
+    assert 'app.envlayer_level' in list(manager.keys('app'))
+    del environ['APP_ENVLAYER_LEVEL']
+    layer.refresh()
+    assert manager._state.index is None
+    assert 'app.envlayer_level' not in list(manager.keys('app'))
+    
+    print("✓ Environment snapshot layer works")
+
+
+def test_get_many_and_snapshot():
+    """Test bulk lookups and immutable config snapshots."""
+    print("Testing get_many and config snapshots...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        
+        test_config = config_dir / "app.py"
+        test_config.write_text("""
+name = "Bulk App"
+logging = {"level": "INFO"}
+""")
+        
+        manager = ConfigManager(config_dir=str(config_dir), json_file="/nonexistent/config.json")
+        
+        values = manager.get_many(['app.name', 'app.logging.level', 'app.missing'], {'app.missing': 7})
+        assert values == {'app.name': "Bulk App", 'app.logging.level': "INFO", 'app.missing': 7}
+        
+        snapshot = manager.snapshot(['app.name', 'app.logging.level'])
+        assert snapshot.app_name == "Bulk App"
+        assert snapshot.app_logging_level == "INFO"
+        
+        # Snapshots are immutable and do not follow later changes
+        try:
+            snapshot.app_name = "Changed"
+            assert False, "Snapshot should be immutable"
+        except AttributeError:
+            pass
+        manager.set('app.name', "Changed")
+        assert snapshot.app_name == "Bulk App"
+        assert manager.snapshot(['app.name']).app_name == "Changed"
+        
+        # Keys that collide or aren't identifiers are served by position
+        manager.set('a.b_c', 1)
+        manager.set('a_b.c', 2)
+        manager.set('db.read-only', True)
+        snapshot = manager.snapshot(['a_b.c', 'a.b_c', 'db.read-only', 'app.name'])
+        assert snapshot.a_b_c == 2 and snapshot._1 == 1 and snapshot._2 is True
+        assert snapshot.app_name == "Changed" and tuple(snapshot) == (2, 1, True, "Changed")
+        
+        print("✓ get_many and config snapshots work")
+
+
+def test_static_config_loader():
+    """Test that literal-only config files load without executing them."""
+    print("Testing static config loader...")
+    
+    from config_loader import load_static
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        
+        (config_dir / "static.py").write_text("""
+\"\"\"Literal settings.\"\"\"
+
+name = "Static App"
+timeout = 30
+hosts = ["a", "b"]
+primary = backup = {"host": "localhost"}
+limits = {"low": -1, "high": 1e3, "pair": (1, 2)}
+_private = "hidden"
+""")
+        (config_dir / "dynamic.py").write_text("""
+import os
+separator = os.sep
+""")
+        
+        # Literal files are evaluated statically, files with code are left to the importer
+        assert load_static(config_dir / "static.py", "static") is not None
+        assert load_static(config_dir / "dynamic.py", "dynamic") is None
+        
+        static = ConfigManager(config_dir=str(config_dir), json_file="/nonexistent/config.json")
+        imported = ConfigManager(config_dir=str(config_dir), json_file="/nonexistent/config.json", loader="exec")
+        
+        assert static.all('static') == imported.all('static')
+        assert list(static.all('static')) == list(imported.all('static'))
+        assert static.get('static.limits.pair') == (1, 2)
+        assert static.has('static._private') == False
+        
+        # Files with real code fall back to being imported
+        assert static.get('dynamic.separator') == os.sep
+        
+        print("✓ Static config loader works")
+
+
+def test_disk_cache():
+    """Test the on-disk config cache and its invalidation by source file changes."""
+    print("Testing on-disk config cache...")
+    
+    import config_manager
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        cache_file = Path(temp_dir) / "data" / "config_cache.marshal"
+        
+        test_config = config_dir / "app.py"
+        test_config.write_text('name = "Cached App"\nsettings = {"port": 8000}\n')
+        json_file = Path(temp_dir) / "config.json"
+        json_file.write_text('{"APP_MESSAGE": "From JSON"}')
+        
+        # A cold start loads everything from source and writes the cache
+        cold = ConfigManager(config_dir=str(config_dir), json_file=str(json_file), cache_file=str(cache_file))
+        assert cache_file.exists()
+        assert cold.get('app.name') == "Cached App"
+        
+        # A warm start is served from the cache without loading any config file
+        original_loader = config_manager.load_config_file
+        loads = []
+        config_manager.load_config_file = lambda *args: loads.append(args) or {}
+        try:
+            warm = ConfigManager(config_dir=str(config_dir), json_file=str(json_file), cache_file=str(cache_file))
+            assert warm.get('app.name') == "Cached App"
+            assert warm.get('app.settings.port') == 8000
+            assert warm.get('app.message') == "From JSON"
+            assert loads == []
+        finally:
+            config_manager.load_config_file = original_loader
+        
+        # Changing a source file invalidates the cache
+        test_config.write_text('name = "Changed App"\nsettings = {"port": 8000}\n')
+        stat = test_config.stat()
+        os.utime(test_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        changed = ConfigManager(config_dir=str(config_dir), json_file=str(json_file), cache_file=str(cache_file))
+        assert changed.get('app.name') == "Changed App"
+        
+        print("✓ On-disk config cache works")
+
+
+def test_config_watcher():
+    """Test incremental hot reloads of changed config files."""
+    print("Testing config watcher...")
+    
+    from config_watcher import ConfigWatcher
+    
+    def touch(path, text):
+        # Bump the mtime explicitly so the change is seen on coarse filesystem clocks
+        path.write_text(text)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        
+        app_config = config_dir / "app.py"
+        app_config.write_text('name = "Watched App"\nlogging = {"level": "INFO"}\n')
+        other_config = config_dir / "other.py"
+        other_config.write_text('value = 1\n')
+        json_file = Path(temp_dir) / "config.json"
+        json_file.write_text('{"APP_LOGGING_LEVEL": "DEBUG"}')
+        
         manager = ConfigManager(config_dir=str(config_dir), json_file=str(json_file))
+        assert manager.get('app.name') == "Watched App"
+        assert manager.get('app.logging.level') == "DEBUG"
+        assert manager.get('other.value') == 1
         
-        # Test JSON loading
-        assert manager.get('app.name') == "Bundled App"
-        assert manager.get('app.debug') == True
+        notifications = []
+        manager.subscribe(notifications.append)
+        watcher = ConfigWatcher(manager)
+        assert watcher.poll() == set()
+        
+        # Only the changed keys of the changed file are invalidated
+        touch(app_config, 'name = "Reloaded App"\nlogging = {"level": "INFO"}\n')
+        assert watcher.poll() == {'app.name'}
+        assert notifications == [{'app.name'}]
+        assert 'other.value' in manager._state.resolved
+        assert 'app.logging.level' in manager._state.resolved
+        assert manager.get('app.name') == "Reloaded App"
+        
+        # JSON changes invalidate the dotted keys they override
+        touch(json_file, '{"APP_LOGGING_LEVEL": "WARNING"}')
+        assert watcher.poll() == {'app.logging.level'}
+        assert manager.get('app.logging.level') == "WARNING"
+        
+        # JSON changes to keys nobody has read yet (or new ones) are not lost
+        touch(json_file, '{"APP_LOGGING_LEVEL": "WARNING", "APP_NEW": "added", "OTHER_EXTRA": 1}')
+        assert watcher.poll() == set()
+        assert manager.get('app.new') == "added"
+        assert manager.get('other.extra') == 1
+        touch(json_file, '{"APP_LOGGING_LEVEL": "WARNING", "APP_NEW": "changed", "OTHER_EXTRA": 1}')
+        assert watcher.poll() == {'app.new'}
+        assert manager.get('app.new') == "changed"
+        
+        # The background thread picks up changes on its own
+        manager.watch(interval=0.01)
+        try:
+            touch(other_config, 'value = 2\n')
+            for _ in range(500):
+                if manager.get('other.value') == 2:
+                    break
+                time.sleep(0.01)
+            assert manager.get('other.value') == 2
+            
+            # A JSON value changed before its key was ever read
+            touch(json_file, '{"APP_LOGGING_LEVEL": "WARNING", "APP_NEW": "changed", "DB_HOST": "old"}')
+            for _ in range(500):
+                if manager._state.json_vars.get('DB_HOST') == "old":
+                    break
+                time.sleep(0.01)
+            touch(json_file, '{"APP_LOGGING_LEVEL": "WARNING", "APP_NEW": "changed", "DB_HOST": "new"}')
+            for _ in range(500):
+                if manager._state.json_vars.get('DB_HOST') == "new":
+                    break
+                time.sleep(0.01)
+            assert manager.get('db.host') == "new"
+        finally:
+            manager.stop_watching()
         
-        # Test cleanup - the manager should properly initialize without extracted path
-        # since this is not a bundled environment
-        assert manager._extracted_json_path is None
+        print("✓ Config watcher works")
+
+
+def test_concurrent_readers_and_writers():
+    """Test that readers always see a consistent config while writers swap in new ones."""
+    print("Testing concurrent readers and writers...")
+    
+    import threading
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        (config_dir / "app.py").write_text('pair = {"a": 0, "b": 0}\n')
         
-        print("✓ Bundled JSON extraction and cleanup work")
+        manager = ConfigManager(config_dir=str(config_dir), json_file="/nonexistent/config.json")
+        stop = threading.Event()
+        errors = []
+        
+        def reader():
+            while not stop.is_set():
+                values = manager.get_many(['app.pair.a', 'app.pair.b', 'app.pair'])
+                pair = values['app.pair']
+                if values['app.pair.a'] != values['app.pair.b'] or pair['a'] != pair['b']:
+                    errors.append(values)
+        
+        def writer():
+            for number in range(2000):
+                manager.set('app.pair', {'a': number, 'b': number})
+                if number % 100 == 0:
+                    manager.reload()
+        
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        try:
+            writer()
+        finally:
+            stop.set()
+            for thread in readers:
+                thread.join()
+        
+        assert errors == [], f"Inconsistent reads: {errors[:3]}"
+        assert manager.get('app.pair') == {'a': 1999, 'b': 1999}
+        
+        print("✓ Concurrent readers and writers work")
+
+
+def test_shared_memory_snapshot():
+    """Test publishing a config snapshot to shared memory and reading it from a worker."""
+    print("Testing shared-memory config snapshots...")
+    
+    import gc
+    import subprocess
+    import threading
+    import config_shared
+    from config_shared import SharedConfigPublisher, SharedConfigReader
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        (config_dir / "app.py").write_text('name = "Shared App"\nlogging = {"level": "INFO"}\n')
+        json_file = Path(temp_dir) / "config.json"
+        json_file.write_text('{"APP_LOGGING_LEVEL": "DEBUG", "SHARED_ONLY": 5}')
+        
+        manager = ConfigManager(config_dir=str(config_dir), json_file=str(json_file))
+        publisher = SharedConfigPublisher(manager)
+        try:
+            reader = SharedConfigReader(publisher.name)
+            assert reader.get('app.name') == "Shared App"
+            assert reader.get('app.logging.level') == "DEBUG"
+            assert reader.get('app.logging') == {"level": "INFO"}
+            assert reader.get('shared.only') == 5
+            assert reader.get('app.missing', 'default') == 'default'
+            
+            # Changes in the parent publish a new generation that readers follow
+            manager.set('app.name', "Updated App")
+            assert publisher.generation == 2
+            assert reader.get('app.name') == "Updated App"
+            
+            # A generation unlinked between reading the control segment and
+            # attaching is skipped for the next one
+            real_attach = config_shared._attach
+            
+            def racing_attach(name):
+                if name == f"{publisher.name}-3":
+                    manager.set('app.name', "Raced App")
+                return real_attach(name)
+            
+            manager.set('app.name', "Skipped App")
+            config_shared._attach = racing_attach
+            try:
+                assert reader.get('app.name') == "Raced App"
+                assert reader.generation == 4
+            finally:
+                config_shared._attach = real_attach
+            reader.close()
+            
+            # A separate worker process attaches and reads the same snapshot
+            root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            script = (
+                "from config_shared import SharedConfigReader; "
+                f"print(SharedConfigReader({publisher.name!r}).get('app.name'))"
+            )
+            result = subprocess.run([sys.executable, "-c", script], cwd=root,
+                                    capture_output=True, text=True, check=True)
+            assert result.stdout.strip() == "Raced App"
+            
+            # Changes from several threads publish one generation each
+            errors = []
+            
+            def writer(number):
+                try:
+                    for i in range(20):
+                        manager.set(f'app.writer_{number}', i)
+                except Exception as e:
+                    errors.append(e)
+            
+            writers = [threading.Thread(target=writer, args=(number,)) for number in range(4)]
+            for thread in writers:
+                thread.start()
+            for thread in writers:
+                thread.join()
+            assert errors == [] and publisher.generation == 4 + 80
+            
+            # A frozen configuration is shared with its dicts and lists
+            manager.freeze()
+            try:
+                publisher.publish()
+                reader = SharedConfigReader(publisher.name)
+                assert reader.get('app.logging') == {"level": "INFO"}
+                assert reader.get('app.writer_3') == 19
+                reader.close()
+            finally:
+                gc.unfreeze()
+        finally:
+            publisher.close()
+        
+        print("✓ Shared-memory config snapshots work")
+
+
+def test_instrumentation():
+    """Test per-key counters, layer attribution and timing metrics."""
+    print("Testing config instrumentation...")
+    
+    import json
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        (config_dir / "app.py").write_text('name = "Metered App"\nversion = "1.0.0"\n')
+        json_file = Path(temp_dir) / "config.json"
+        json_file.write_text('{"APP_VERSION": "2.0.0"}')
+        
+        manager = ConfigManager(config_dir=str(config_dir), json_file=str(json_file))
+        
+        # Nothing is collected until instrumentation is enabled
+        manager.get('app.name')
+        assert manager.metrics is None
+        
+        metrics = manager.instrument()
+        os.environ['APP_METERED'] = "yes"
+        try:
+            for _ in range(3):
+                manager.get('app.name')
+            manager.get('app.version')
+            manager.get('app.metered')
+            manager.get('app.missing')
+            manager.get_many(['app.name'])
+        finally:
+            del os.environ['APP_METERED']
+        manager.reload()
+        manager.get('app.name')
+        
+        report = json.loads(metrics.to_json())
+        assert report['keys']['app.name']['gets'] == 5
+        assert report['keys']['app.name']['layer'] == 'file'
+        assert report['keys']['app.version']['layer'] == 'json'
+        assert report['keys']['app.metered']['layer'] == 'env'
+        assert report['keys']['app.missing']['layer'] == 'default'
+        assert metrics.hot_keys(1) == [('app.name', 5)]
+        assert report['get_latency_ns']['count'] == 7
+        assert report['file_loads']['app']['count'] == 1
+        assert report['reloads']['count'] == 1
+        
+        # Disabling restores the uninstrumented get()
+        manager.instrument(False)
+        assert 'get' not in manager.__dict__
+        assert manager.metrics is None
+        
+        print("✓ Config instrumentation works")
+
+
+def test_config_schema():
+    """Test typed schema coercion, caching and single-pass validation."""
+    print("Testing config schema...")
+    
+    import json
+    from config_env import EnvironmentLayer
+    from config_schema import ConfigValidationError
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        (config_dir / "server.py").write_text('port = 8000\nworkers = 4\nmode = "fast"\n')
+        (config_dir / "schema.json").write_text(json.dumps({
+            "server.port": {"type": "int", "min": 1, "max": 65535},
+            "server.debug": {"type": "bool"},
+            "server.ratio": {"type": "float"},
+            "server.hosts": {"type": "list"},
+            "server.mode": {"type": "str", "choices": ["fast", "safe"]},
+            "server.name": {"type": "str", "required": True},
+        }))
+        environ = {
+            'SERVER_PORT': "8080", 'SERVER_DEBUG': "yes", 'SERVER_RATIO': "0.5",
+            'SERVER_HOSTS': '["a", "b"]', 'SERVER_NAME': "true",
+        }
+        layer = EnvironmentLayer(environ)
+        manager = ConfigManager(config_dir=str(config_dir), json_file="/nonexistent/config.json",
+                                environment=layer)
+        
+        # Environment strings come back in the declared type, and are cached coerced
+        assert manager.get('server.port') == 8080
+        assert manager._state.resolved['server.port'] == 8080
+        assert manager.get('server.debug') is True
+        assert manager.get('server.ratio') == 0.5
+        assert manager.get('server.hosts') == ["a", "b"]
+        assert manager.get('server.name') == "true"
+        # Keys outside the schema keep the old behaviour
+        assert manager.get('server.workers') == 4
+        
+        values = manager.validate()
+        assert values['server.port'] == 8080 and values['server.mode'] == "fast"
+        
+        # Invalid values are served as configured, and validation reports every problem at once
+        environ.update({'SERVER_PORT': "99999", 'SERVER_MODE': "slow", 'SERVER_DEBUG': "true"})
+        del environ['SERVER_NAME']
+        layer.refresh()
+        assert manager.get('server.port') == "99999"
+        assert manager.get('server.port', 0) == "99999"
+        assert manager.get('server.mode') == "slow"
+        environ['SERVER_DEBUG'] = "maybe"
+        layer.refresh()
+        assert manager.get('server.debug') == "maybe"
+        try:
+            manager.validate()
+            assert False, "validation should fail"
+        except ConfigValidationError as e:
+            assert len(e.errors) == 4
+            assert "at most 65535" in str(e)
+            assert isinstance(e, ValueError)
+    
+    # The shipped schema accepts any environment name, overlay or not
+    root = Path(__file__).resolve().parent.parent
+    manager = ConfigManager(config_dir=str(root / "config"), json_file=str(root / "config.json"),
+                            environment=EnvironmentLayer({'APP_ENV': "staging"}))
+    assert manager.validate()['app.env'] == "staging"
+    
+    # Log levels are accepted in any case, as the logger takes them
+    manager = ConfigManager(config_dir=str(root / "config"), json_file=str(root / "config.json"),
+                            environment=EnvironmentLayer({'APP_LOGGING_LEVEL': "info"}))
+    assert manager.validate()['app.logging.level'] == "info"
+    manager = ConfigManager(config_dir=str(root / "config"), json_file=str(root / "config.json"),
+                            environment=EnvironmentLayer({'APP_LOGGING_LEVEL': "verbose"}))
+    try:
+        manager.validate()
+        assert False, "validation should fail"
+    except ConfigValidationError as e:
+        assert "app.logging.level" in str(e)
+    
+    print("✓ Config schema works")
+
+
+def test_key_index():
+    """Test the prefix trie key index, has() and streaming keys()/items()."""
+    print("Testing key index...")
+    
+    import types
+    from config_env import EnvironmentLayer
+    from config_index import KeyIndex
+    
+    index = KeyIndex()
+    index.add_tree('app', {'name': 'x', 'logging': {'level': 'INFO'}})
+    assert 'app.logging.level' in index and 'app.logging' in index
+    assert 'app' not in index and 'app.log' not in index
+    assert index.key_for('APP_LOGGING_LEVEL') == 'app.logging.level'
+    assert index.key_for('APP_LOGGING_NEW_SETTING') == 'app.logging.new_setting'
+    assert index.key_for('PATH') is None
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        (config_dir / "app.py").write_text('name = "Indexed"\nlogging = {"level": "INFO", "file": "app.log"}\n')
+        (config_dir / "database.py").write_text('host = "localhost"\nport = 5432\n')
+        json_file = Path(temp_dir) / "config.json"
+        json_file.write_text('{"APP_LOGGING_LEVEL": "DEBUG", "FEATURE_FLAGS": true}')
+        environ = {'DATABASE_POOL_SIZE': "10", 'HOME': "/root"}
+        manager = ConfigManager(config_dir=str(config_dir), json_file=str(json_file),
+                                environment=EnvironmentLayer(environ))
+        
+        # keys() and items() are generators, not copies
+        assert isinstance(manager.keys(), types.GeneratorType)
+        assert list(manager.keys('app')) == ['app.logging', 'app.logging.level', 'app.logging.file', 'app.name']
+        assert list(manager.keys('database')) == ['database.host', 'database.port', 'database.pool_size']
+        assert 'feature_flags' in list(manager.keys())
+        assert not any(key.startswith('home') for key in manager.keys())
+        assert dict(manager.items('app.logging')) == {'app.logging.level': "DEBUG", 'app.logging.file': "app.log"}
+        assert dict(manager.items('database'))['database.pool_size'] == "10"
+        assert list(manager.keys('missing')) == []
+        
+        assert manager.has('app.logging.level')
+        assert manager.has('database.pool_size')
+        assert manager.has('feature_flags')
+        assert manager.has('home')
+        assert not manager.has('app.missing')
+        assert not manager.has('app')
+        
+        # Runtime changes are added to the carried-over index
+        index = manager._state.index
+        manager.set('database.timeout', 30)
+        manager.set('database.replica', {"host": "replica"})
+        assert manager._state.index is not None and 'database.timeout' not in index
+        assert list(manager.keys('database'))[-3:] == ['database.timeout', 'database.replica', 'database.replica.host']
+        assert manager.has('database.replica.host')
+        manager.set('app.logging', "off")
+        assert manager._state.index is None
+        assert 'app.logging.file' not in list(manager.keys('app'))
+        
+        # has() only loads the key's own config file, never other files with code
+        (config_dir / "noisy.py").write_text('import os\nos.environ["NOISY_LOADED"] = "1"\n')
+        fresh = ConfigManager(config_dir=str(config_dir), json_file=str(json_file),
+                              environment=EnvironmentLayer(environ))
+        fresh.set('app.name', "Set")
+        assert fresh.has('app.name') and not fresh.has('app.missing')
+        assert set(fresh._state.files) == {'app'} and 'NOISY_LOADED' not in os.environ
+    
+    print("✓ Key index works")
+
+
+def test_config_views():
+    """Test the read-only, cached views returned by all() and view()."""
+    print("Testing read-only config views...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        (config_dir / "app.py").write_text(
+            'name = "Viewed"\nhosts = ["a", "b"]\nlogging = {"level": "INFO", "handlers": {"file": "app.log"}}\n')
+        (config_dir / "database.py").write_text('host = "localhost"\n')
+        manager = ConfigManager(config_dir=str(config_dir), json_file="/nonexistent/config.json")
+        
+        app = manager.all('app')
+        assert manager.all('app') is app
+        assert app['name'] == "Viewed" and app['hosts'] == ("a", "b")
+        assert manager.view('app.logging.handlers') is app['logging']['handlers']
+        
+        # Views are read-only all the way down
+        for mutate in (lambda: app.__setitem__('name', 'x'),
+                       lambda: app['logging'].__setitem__('level', 'DEBUG'),
+                       lambda: app['hosts'].append('c')):
+            try:
+                mutate()
+                assert False, "view should be read-only"
+            except (TypeError, AttributeError):
+                pass
+        
+        try:
+            manager.view('app.name')
+            assert False, "non-mapping prefix should raise KeyError"
+        except KeyError:
+            pass
+        
+        # set() gives a new view of the changed file only
+        database = manager.all('database')
+        manager.set('app.logging.level', 'DEBUG')
+        assert manager.all('app') is not app
+        assert manager.view('app.logging')['level'] == 'DEBUG'
+        assert app['logging']['level'] == 'INFO'
+        assert manager.all('database') is database
+    
+    print("✓ Read-only config views work")
+
+
+def test_environment_overlays():
+    """Test per-environment overlays and the precedence of set() over every layer."""
+    print("Testing environment overlays...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        (config_dir / "production").mkdir(parents=True)
+        (config_dir / "app.py").write_text("""
+env = "production"
+name = "Base App"
+logging = {"level": "DEBUG", "file": "logs/app.log"}
+""")
+        (config_dir / "production" / "app.py").write_text('logging = {"level": "WARNING"}\n')
+        (config_dir / "production" / "queue.py").write_text('workers = 8\n')
+        json_file = Path(temp_dir) / "config.json"
+        json_file.write_text('{"APP_MESSAGE": "Base JSON"}')
+        (Path(temp_dir) / "config.production.json").write_text('{"APP_MESSAGE": "Production JSON"}')
+        
+        # The environment comes from config/app.py; overlays are deep-merged at load time
+        manager = ConfigManager(config_dir=str(config_dir), json_file=str(json_file))
+        assert manager.env_name == "production"
+        assert manager.get('app.logging.level') == "WARNING"
+        assert manager.get('app.logging.file') == "logs/app.log"
+        assert manager.get('app.message') == "Production JSON"
+        assert manager.get('queue.workers') == 8
+        assert 'queue.workers' in list(manager.keys())
+        
+        # config/app.py is run once, even when it names the environment
+        import config_manager
+        loads = []
+        real_load = config_manager.load_config_file
+        
+        def counting_load(path, *args):
+            loads.append(Path(path).relative_to(config_dir).as_posix())
+            return real_load(path, *args)
+        
+        config_manager.load_config_file = counting_load
+        try:
+            exec_manager = ConfigManager(config_dir=str(config_dir), json_file=str(json_file), loader="exec")
+            assert exec_manager.get('app.name') == "Base App"
+            assert exec_manager.get('app.logging.level') == "WARNING"
+            exec_manager.reload()
+            assert exec_manager.get('app.logging.level') == "WARNING"
+            assert loads == ["app.py", "production/app.py"] * 2
+        finally:
+            config_manager.load_config_file = real_load
+        
+        # An explicit environment without overlays gets the base values
+        testing = ConfigManager(config_dir=str(config_dir), json_file=str(json_file), env="testing")
+        assert testing.env_name == "testing"
+        assert testing.get('app.env') == "testing"
+        # ... even over an APP_ENV from the JSON file
+        root = Path(__file__).resolve().parent.parent
+        production = ConfigManager(config_dir=str(root / "config"), json_file=str(root / "config.json"),
+                                   env="production")
+        assert production.get('app.env') == "production"
+        assert testing.get('app.logging.level') == "DEBUG"
+        assert testing.get('app.message') == "Base JSON"
+        
+        # set() beats environment variables and JSON until the file is reloaded
+        os.environ['APP_NAME'] = "Env App"
+        try:
+            assert manager.get('app.name') == "Env App"
+            manager.set('app.name', "Set App")
+            manager.set('app.logging', {"level": "ERROR"})
+            assert manager.get('app.name') == "Set App"
+            assert manager.get('app.logging.level') == "ERROR"
+            manager.set('app.logging.level', "INFO")
+            assert manager.get('app.logging') == {"level": "INFO"}
+            
+            manager.set('app.region', "eu")
+            instrumented = manager.instrument()
+            manager.get('app.region')
+            assert instrumented.layer_counts['set'] == 1
+            manager.instrument(False)
+            
+            # Hot reloads keep set() values, reload() drops them
+            manager.reload_changed(['app'])
+            assert manager.get('app.name') == "Set App"
+            manager.reload('app')
+            assert manager.get('app.name') == "Env App"
+            assert manager.get('app.logging.level') == "WARNING"
+        finally:
+            del os.environ['APP_NAME']
+    
+    print("✓ Environment overlays work")
+
+
+def test_lazy_json_loading():
+    """Test the streaming JSON index and values decoded on first access."""
+    print("Testing lazy JSON loading...")
+    
+    import io
+    import json
+    from config_json import LazyJSONObject, index_json_file
+    
+    document = {
+        "APP_NAME": "Lazy Ünïcode App",
+        "APP_ROUTES": {f"route_{i}": {"target": f"host-{i}", "weights": [i, 1.5, None]} for i in range(50)},
+        "APP_FLAGS": [{"name": "flag", "enabled": True}] * 20,
+        "APP_RESPONSE_NUMBER": 7,
+    }
+    data = json.dumps(document, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    # Offsets are byte offsets, whatever the chunk boundaries
+    for chunk_size in (1, 7, 1 << 20):
+        entries = index_json_file(io.BytesIO(data), chunk_size)
+        assert list(entries) == list(document)
+        for name, (offset, length, _) in entries.items():
+            assert json.loads(data[offset:offset + length]) == document[name]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        (config_dir / "app.py").write_text('name = "File App"\nresponse_number = 1\n')
+        json_file = Path(temp_dir) / "config.json"
+        json_file.write_bytes(data)
+        
+        manager = ConfigManager(config_dir=str(config_dir), json_file=str(json_file), json_mode="lazy")
+        json_vars = manager._state.json_vars
+        assert isinstance(json_vars, LazyJSONObject)
+        assert manager.has('app.routes') and json_vars.decoded == 0
+        assert manager.get('app.name') == "Lazy Ünïcode App"
+        assert manager.get('app.routes')['route_3']['target'] == "host-3"
+        assert json_vars.decoded == 2
+        
+        # Only entries whose text changed count as changed on reload
+        assert manager.get('app.response_number') == 7
+        document["APP_RESPONSE_NUMBER"] = 8
+        json_file.write_bytes(json.dumps(document, indent=2, ensure_ascii=False).encode('utf-8'))
+        changed = manager.reload_changed(json_changed=True)
+        assert changed == {'app.response_number'}, changed
+        assert manager.get('app.response_number') == 8
+        
+        # A file rewritten in place (truncated, then written) is indexed again
+        # before undecoded values are read, instead of decoding stale offsets
+        json_vars = manager._state.json_vars
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump({**document, "APP_FLAGS": [], "APP_EXTRA": 1}, f, ensure_ascii=False)
+        assert manager.get('app.flags') == []
+        assert manager.get('app.routes')['route_3']['target'] == "host-3"
+        assert 'APP_EXTRA' not in json_vars
+        assert 'app.flags' in manager.reload_changed(json_changed=True)
+        assert manager.get('app.extra') == 1
+        
+        lazy = LazyJSONObject.open(json_file)
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump({"APP_NAME": "Smaller"}, f)
+        assert lazy['APP_NAME'] == "Smaller"
+        try:
+            lazy['APP_ROUTES']
+            assert False, "a value missing from the rewritten file should be reported"
+        except ValueError as e:
+            assert "APP_ROUTES" in str(e)
+        
+        # Broken files are reported and treated as empty, like in eager mode
+        json_file.write_text('{"APP_NAME": "Broken",')
+        manager.reload()
+        assert manager.get('app.name') == "File App"
+    
+    print("✓ Lazy JSON loading works")
+
+
+def test_config_freeze():
+    """Test freezing the configuration before forking workers."""
+    print("Testing config freeze...")
+    
+    import gc
+    import threading
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_dir = Path(temp_dir) / "config"
+        config_dir.mkdir()
+        (config_dir / "app.py").write_text("""
+name = "Frozen"
+hosts = ["a", "b"]
+logging = {"level": "INFO", "handlers": {"file": True}}
+""")
+        (config_dir / "cache.py").write_text('ttl = 60\n')
+        
+        manager = ConfigManager(config_dir=str(config_dir), json_file="/nonexistent/config.json")
+        manager.set('app.region', "eu")
+        before = dict(manager.items())
+        version = manager.version
+        
+        try:
+            manager.freeze()
+            assert manager.frozen and manager.version == version
+            
+            # Everything is resolved up front, into read-only values shared with all()
+            state = manager._state
+            assert set(state.files) == {'app', 'cache'}
+            assert 'cache.ttl' in state.resolved and 'app.logging.handlers.file' in state.resolved
+            assert dict(manager.items()) == {key: tuple(value) if isinstance(value, list) else value
+                                             for key, value in before.items()}
+            assert manager.get('app.logging') is manager.all('app')['logging']
+            assert manager.get('app.hosts') == ("a", "b")
+            assert manager.get('app.region') == "eu"
+            assert gc.get_freeze_count() > 0
+            
+            for change in (lambda: manager.set('app.name', "Thawed"), lambda: manager.reload(),
+                           lambda: manager.reload_changed(['app']), lambda: manager.watch(),
+                           manager.refresh_env):
+                try:
+                    change()
+                    assert False, "frozen configuration should reject changes"
+                except RuntimeError:
+                    pass
+            
+            # Environment changes are not picked up any more
+            os.environ['APP_NAME'] = "From Env"
+            try:
+                assert manager.get('app.name') == "Frozen"
+            finally:
+                del os.environ['APP_NAME']
+        finally:
+            gc.unfreeze()
+        
+        # Freezing while the watcher is about to reload a change must not deadlock
+        watched = ConfigManager(config_dir=str(config_dir), json_file="/nonexistent/config.json")
+        watched.get('cache.ttl')
+        reloading, stopping = threading.Event(), threading.Event()
+        reload_changed, stop_watching = watched.reload_changed, watched.stop_watching
+        
+        def slow_reload(*args, **kwargs):
+            reloading.set()
+            stopping.wait(1)
+            return reload_changed(*args, **kwargs)
+        
+        def signalled_stop():
+            stopping.set()
+            stop_watching()
+        
+        watched.reload_changed, watched.stop_watching = slow_reload, signalled_stop
+        watched.watch(interval=0.01)
+        try:
+            (config_dir / "cache.py").write_text('ttl = 120\n')
+            stat = (config_dir / "cache.py").stat()
+            os.utime(config_dir / "cache.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+            assert reloading.wait(5)
+            freezer = threading.Thread(target=watched.freeze, daemon=True)
+            freezer.start()
+            freezer.join(5)
+            assert not freezer.is_alive(), "freeze() deadlocked with the watcher"
+            assert watched.frozen and watched._watcher is None
+            assert watched.get('cache.ttl') == 120
+        finally:
+            gc.unfreeze()
+    
+    print("✓ Config freeze works")
 
 
 def test_helpers_integration():
@@ -175,7 +1150,22 @@ def run_tests():
         test_config_loading()
         test_json_overrides()
         test_runtime_config_changes()
-        test_bundled_json_extraction()
+        test_bundled_json_loading()
+        test_resolved_index_invalidation()
+        test_environment_layer()
+        test_get_many_and_snapshot()
+        test_static_config_loader()
+        test_disk_cache()
+        test_config_watcher()
+        test_concurrent_readers_and_writers()
+        test_shared_memory_snapshot()
+        test_instrumentation()
+        test_config_schema()
+        test_key_index()
+        test_config_views()
+        test_environment_overlays()
+        test_lazy_json_loading()
+        test_config_freeze()
         test_helpers_integration()
         
         print("\n✅ All tests passed!")